@@ -0,0 +1,7 @@
+"""``python -m core``: the headless command line (see ``core.cli``)."""
+
+import sys
+
+from core.cli import main
+
+sys.exit(main())
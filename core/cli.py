@@ -0,0 +1,225 @@
+"""Headless command line for batch jobs: ``python -m core <command>``.
+
+Commands::
+
+    teams                      team OVR table
+    roster TEAM                a team's players with their ratings
+    matchup HOME AWAY          Monte Carlo matchup projection
+    season                     simulated seasons with playoff and title odds
+
+Every command prints aligned tables by default, or ``--format json`` /
+``--format csv``; ``--output PATH`` writes to a file instead of stdout.
+Commands with more than one table (``matchup``: the result summary, then
+the box scores) print them one after the other in table output; CSV output
+stays a single document, with a leading ``section`` column naming the table
+each row belongs to.
+Nothing here imports PyQt5, and the core modules (and NumPy) are imported
+only by the command that needs them, so ``--help`` and argument errors
+return immediately and the tools run on machines without a GUI stack.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence
+
+FORMATS = ("table", "json", "csv")
+ROSTER_COLUMNS = ("overall", "potential", "PTS", "TRB", "AST", "TS%")
+
+
+class CommandError(Exception):
+    """A user-facing error; printed without a traceback."""
+
+
+def _json_default(value: Any) -> Any:
+    # NumPy scalars and arrays
+    if hasattr(value, "tolist"):
+        return value.tolist()
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.3f}".rstrip("0").rstrip(".") if value != int(value) else str(int(value))
+    return str(value)
+
+
+def render(rows: List[Dict[str, Any]], fmt: str, data: Any = None) -> str:
+    """``rows`` as an aligned table or CSV, or ``data`` (default ``rows``) as JSON."""
+    if fmt == "json":
+        return json.dumps(rows if data is None else data, indent=2, ensure_ascii=False, default=_json_default) + "\n"
+    columns: List[str] = []
+    for row in rows:
+        columns.extend(c for c in row if c not in columns)
+    if fmt == "csv":
+        buf = io.StringIO()
+        writer = csv.DictWriter(buf, fieldnames=columns, lineterminator="\n")
+        writer.writeheader()
+        for row in rows:
+            writer.writerow({c: _cell(row.get(c)) for c in columns})
+        return buf.getvalue()
+    cells = [[_cell(row.get(c)) for c in columns] for row in rows]
+    widths = [max([len(c)] + [len(r[i]) for r in cells]) for i, c in enumerate(columns)]
+    numeric = [all(not r[i] or r[i].lstrip("-").replace(".", "", 1).isdigit() for r in cells)
+               for i in range(len(columns))]
+
+    def line(values):
+        return "  ".join(v.rjust(w) if num else v.ljust(w) for v, w, num in zip(values, widths, numeric)).rstrip()
+
+    return "\n".join([line(columns)] + [line(r) for r in cells]) + "\n"
+
+
+def resolve_team(name: str) -> str:
+    """Full team name from a name, abbreviation or unique case-insensitive fragment."""
+    from core.teams.loader import load_teams
+
+    teams = load_teams()
+    key = name.strip().lower()
+    for team in teams:
+        if key in (team.name.lower(), (team.abbrev or "").lower()):
+            return team.name
+    matches = [t.name for t in teams if key in t.name.lower()]
+    if len(matches) == 1:
+        return matches[0]
+    if matches:
+        raise CommandError(f"{name!r} matches several teams: {', '.join(matches)}")
+    raise CommandError(f"unknown team: {name!r}")
+
+
+# -- commands ----------------------------------------------------------
+
+def cmd_teams(args) -> tuple:
+    from core.teams.loader import load_teams
+    from core.teams.team_overall import get_team_overall_engine
+
+    meta = {t.name: t for t in load_teams()}
+    rows = []
+    for row in get_team_overall_engine().league_table():
+        team = meta.get(row.team)
+        rows.append({
+            "rank": row.rank,
+            "team": row.team,
+            "abbrev": team.abbrev if team else None,
+            "cid": team.cid if team else None,
+            "did": team.did if team else None,
+            "overall": row.overall,
+            "players": row.players,
+        })
+    return {"teams": rows}, None
+
+
+def cmd_roster(args) -> tuple:
+    from core.players.ratings import get_ratings_store
+    from core.teams.rosters import get_team_roster
+
+    team = resolve_team(args.team)
+    store = get_ratings_store()
+    rows = []
+    for name in get_team_roster(team):
+        i = store.index.get(name)
+        row: Dict[str, Any] = {"name": name, "position": store.positions[i] if i is not None else None}
+        for col in ROSTER_COLUMNS:
+            row[col] = store.value(name, col)
+        rows.append(row)
+    rows.sort(key=lambda r: -(r["overall"] or 0.0))
+    return {"players": rows}, {"team": team, "players": rows}
+
+
+def cmd_matchup(args) -> tuple:
+    from core.game.matchup import simulate_matchup
+
+    home, away = resolve_team(args.home), resolve_team(args.away)
+    summary = simulate_matchup(home, away, args.games, rng=args.seed, workers=args.workers)
+    sides = ((home, "home", summary.home_win_prob, summary.home_points, 1),
+             (away, "away", summary.away_win_prob, summary.away_points, -1))
+    # Result first: win probability and the margin from each side's view
+    result = [{
+        "team": team,
+        "side": side,
+        "games": summary.games,
+        "win_pct": round(100 * win, 1),
+        "mean_pts": points.get("mean"),
+        "mean_margin": sign * summary.margin["mean"],
+        "median_margin": sign * summary.margin["p50"] if "p50" in summary.margin else None,
+    } for team, side, win, points, sign in sides]
+    box = [{"team": team, "side": side, **line}
+           for team, side, lines in ((home, "home", summary.home_box), (away, "away", summary.away_box))
+           for line in lines]
+    _note(f"{away} @ {home}: {summary.games} games (seed {summary.seed})", args)
+    return {"result": result, "box": box}, summary.as_dict()
+
+
+def cmd_season(args) -> tuple:
+    from core.game.playoffs import project_playoffs
+    from core.game.season import simulate_seasons
+
+    projection = simulate_seasons(args.seasons, seed=args.seed, workers=args.workers)
+    rows = projection.win_table()
+    if args.sims:
+        odds = {row["team"]: row for row in project_playoffs(projection, args.sims).table()}
+        for row in rows:
+            row.update({k: v for k, v in odds[row["team"]].items() if k != "team"})
+    _note(f"{args.seasons} season(s) (seed {projection.seed})", args)
+    return {"teams": rows}, {"seasons": args.seasons, "seed": projection.seed, "teams": rows}
+
+
+def _note(message: str, args) -> None:
+    # Run details go to stderr so stdout stays machine-readable
+    if not args.quiet:
+        print(message, file=sys.stderr)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m core", description="Basketball GM batch tools (no GUI).")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("-f", "--format", choices=FORMATS, default="table", help="output format (default: table)")
+    common.add_argument("-o", "--output", metavar="PATH", help="write to PATH instead of stdout")
+    common.add_argument("-q", "--quiet", action="store_true", help="no run details on stderr")
+    sim = argparse.ArgumentParser(add_help=False)
+    sim.add_argument("--seed", type=int, help="run seed (default: fresh, reported on stderr)")
+    sim.add_argument("--workers", type=int, help="worker processes (default: every CPU)")
+
+    sub = parser.add_subparsers(dest="command", metavar="command", required=True)
+    p = sub.add_parser("teams", parents=[common], help="team OVR table")
+    p.set_defaults(run=cmd_teams)
+    p = sub.add_parser("roster", parents=[common], help="a team's players and ratings")
+    p.add_argument("team", help="team name, abbreviation or unique fragment")
+    p.set_defaults(run=cmd_roster)
+    p = sub.add_parser("matchup", parents=[common, sim], help="simulate a matchup")
+    p.add_argument("home")
+    p.add_argument("away")
+    p.add_argument("-n", "--games", type=int, default=10_000, help="games to simulate (default: 10000)")
+    p.set_defaults(run=cmd_matchup)
+    p = sub.add_parser("season", parents=[common, sim], help="simulate seasons with playoff odds")
+    p.add_argument("-n", "--seasons", type=int, default=1, help="seasons to simulate (default: 1)")
+    p.add_argument("--sims", type=int, default=10_000,
+                   help="playoff brackets per season; 0 skips playoffs (default: 10000)")
+    p.set_defaults(run=cmd_season)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    try:
+        tables, data = args.run(args)
+    except (CommandError, ValueError) as e:
+        print(f"error: {e}", file=sys.stderr)
+        return 1
+    if args.format == "json":
+        text = render(next(iter(tables.values())), "json", data)
+    elif args.format == "csv" and len(tables) > 1:
+        text = render([{"section": name, **row} for name, rows in tables.items() for row in rows], "csv")
+    else:
+        text = "\n".join(render(rows, args.format) for rows in tables.values())
+    if args.output:
+        with open(args.output, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+    else:
+        sys.stdout.write(text)
+    return 0
@@ -1,3 +1,22 @@
-"""Game module removed."""
+"""Game simulation: team profiles, the vectorized possession engine, play logs, matchups, seasons and playoffs."""
 
-__all__: list[str] = []
+from .profile import ROTATION, TeamProfile, build_team_profile, get_team_profile
+from .engine import (
+    STAT_COLUMNS, GameBatch, GameResult, PlayEvent, play_by_play, simulate_game, simulate_games,
+)
+from .boxscore import BOX_COLUMNS, BoxScoreAccumulator
+from .pbplog import PlayLog, PlayLogWriter, record_season, write_play_log
+from .parallel import simulate_games_parallel
+from .matchup import MatchupSummary, simulate_matchup
+from .season import SeasonProjection, SeasonResult, StandingRow, simulate_season, simulate_seasons
+from .playoffs import Bracket, PlayoffOdds, project_playoffs, seed_playoffs, series_win_probability, simulate_playoffs
+
+__all__ = [
+    "ROTATION", "TeamProfile", "build_team_profile", "get_team_profile",
+    "STAT_COLUMNS", "GameBatch", "GameResult", "PlayEvent", "play_by_play", "simulate_game", "simulate_games",
+    "PlayLog", "PlayLogWriter", "record_season", "write_play_log",
+    "simulate_games_parallel", "BOX_COLUMNS", "BoxScoreAccumulator",
+    "MatchupSummary", "simulate_matchup",
+    "SeasonProjection", "SeasonResult", "StandingRow", "simulate_season", "simulate_seasons",
+    "Bracket", "PlayoffOdds", "project_playoffs", "seed_playoffs", "series_win_probability", "simulate_playoffs",
+]
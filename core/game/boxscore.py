@@ -0,0 +1,155 @@
+"""Array-backed box score totals in a fixed stat-column layout.
+
+``BoxScoreAccumulator`` keeps one row per player (or any key) and one column
+per ``BOX_COLUMNS`` entry in a single preallocated array. Engine box lines
+are added in place with ``np.add.at``, so accumulating thousands of games
+allocates nothing per player, and two accumulators merge with one array
+addition (cheap to ship back from worker processes). Per-game, per-36 and
+shooting percentages are derived on demand from the totals.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Hashable, Iterable, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.game.engine import STAT_COLUMNS, STAT_INDEX
+
+# Games played, then the engine's box score columns
+BOX_COLUMNS: Tuple[str, ...] = ("G",) + STAT_COLUMNS
+BOX_INDEX: Dict[str, int] = {name: i for i, name in enumerate(BOX_COLUMNS)}
+# Counting stats with per-game and per-36 rates (TRB is derived from ORB + DRB)
+RATE_COLUMNS: Tuple[str, ...] = (
+    "PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA",
+    "ORB", "DRB", "TRB", "AST", "STL", "BLK", "TOV", "PF",
+)
+# Percentage columns and their (made, attempted) columns
+PCT_COLUMNS: Dict[str, Tuple[str, str]] = {"FG%": ("FGM", "FGA"), "3P%": ("3PM", "3PA"), "FT%": ("FTM", "FTA")}
+
+
+class BoxScoreAccumulator:
+    """Running ``BOX_COLUMNS`` totals, one row per key.
+
+    ``keys`` are any hashables (player names, ``(team, player)`` pairs) or a
+    row count. Integer totals are the default; pass a float ``dtype`` for
+    sources with fractional minutes.
+    """
+
+    __slots__ = ("keys", "index", "totals")
+
+    def __init__(self, keys: Union[int, Sequence[Hashable]], dtype=np.int64):
+        self.keys: Tuple[Hashable, ...] = tuple(range(keys)) if isinstance(keys, int) else tuple(keys)
+        self.index: Dict[Hashable, int] = {k: i for i, k in enumerate(self.keys)}
+        if len(self.index) != len(self.keys):
+            raise ValueError("accumulator keys must be unique")
+        self.totals = np.zeros((len(self.keys), len(BOX_COLUMNS)), dtype=dtype)
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def __getstate__(self):
+        return self.keys, self.totals
+
+    def __setstate__(self, state):
+        self.keys, self.totals = state
+        self.index = {k: i for i, k in enumerate(self.keys)}
+
+    def rows(self, keys: Iterable[Hashable]) -> np.ndarray:
+        return np.fromiter((self.index[k] for k in keys), dtype=np.intp)
+
+    def copy(self) -> "BoxScoreAccumulator":
+        out = BoxScoreAccumulator.__new__(BoxScoreAccumulator)
+        out.keys, out.index, out.totals = self.keys, self.index, self.totals.copy()
+        return out
+
+    # -- accumulation ---------------------------------------------------
+
+    def add(self, rows: np.ndarray, values: np.ndarray) -> None:
+        """Add full ``BOX_COLUMNS`` lines to ``rows`` (repeated rows are summed)."""
+        rows = np.asarray(rows, dtype=np.intp).ravel()
+        np.add.at(self.totals, rows, np.asarray(values).reshape(len(rows), len(BOX_COLUMNS)))
+
+    def add_box(self, rows: np.ndarray, box: np.ndarray) -> None:
+        """Add engine box lines (``STAT_COLUMNS`` wide); a line with minutes is a game played.
+
+        ``rows`` matches ``box`` without its last axis, e.g. ``(games, 2,
+        ROTATION)`` for a ``GameBatch.box``; negative rows are skipped.
+        """
+        rows = np.broadcast_to(np.asarray(rows, dtype=np.intp), box.shape[:-1]).ravel()
+        lines = box.reshape(len(rows), len(STAT_COLUMNS))
+        keep = rows >= 0
+        if not keep.all():
+            rows, lines = rows[keep], lines[keep]
+        np.add.at(self.totals[:, 1:], rows, lines)
+        np.add.at(self.totals[:, 0], rows, lines[:, STAT_INDEX["SEC"]] > 0)
+
+    def merge(self, other: "BoxScoreAccumulator") -> "BoxScoreAccumulator":
+        """Add ``other``'s totals in place, aligning rows by key when layouts differ."""
+        if other.keys == self.keys:
+            self.totals += other.totals.astype(self.totals.dtype, copy=False)
+        else:
+            missing = [k for k in other.keys if k not in self.index]
+            if missing:
+                raise KeyError(f"keys not in this accumulator: {missing[:5]}")
+            np.add.at(self.totals, self.rows(other.keys), other.totals.astype(self.totals.dtype, copy=False))
+        return self
+
+    __iadd__ = merge
+
+    # -- derived stats --------------------------------------------------
+
+    def column(self, name: str) -> np.ndarray:
+        """Totals of a ``BOX_COLUMNS`` entry, or ``MIN`` / ``TRB``, as float64."""
+        if name == "MIN":
+            return self.totals[:, BOX_INDEX["SEC"]] / 60.0
+        if name == "TRB":
+            return (self.totals[:, BOX_INDEX["ORB"]] + self.totals[:, BOX_INDEX["DRB"]]).astype(np.float64)
+        return self.totals[:, BOX_INDEX[name]].astype(np.float64)
+
+    def per_game(self, name: str) -> np.ndarray:
+        games = self.column("G")
+        return np.divide(self.column(name), games, out=np.zeros(len(self)), where=games > 0)
+
+    def per36(self, name: str) -> np.ndarray:
+        minutes = self.column("MIN")
+        return np.divide(self.column(name) * 36.0, minutes, out=np.zeros(len(self)), where=minutes > 0)
+
+    def pct(self, name: str) -> np.ndarray:
+        """``FG%``, ``3P%``, ``FT%`` or ``TS%`` in percent; NaN without attempts."""
+        if name == "TS%":
+            made = self.column("PTS") / 2.0
+            att = self.column("FGA") + 0.44 * self.column("FTA")
+        else:
+            made, att = (self.column(c) for c in PCT_COLUMNS[name])
+        return np.divide(100.0 * made, att, out=np.full(len(self), np.nan), where=att > 0)
+
+    def line(self, key: Hashable, digits: Optional[int] = 1) -> Dict[str, object]:
+        """Totals, per-game and per-36 rates and percentages for one key."""
+        return self.lines([key], digits)[0]
+
+    def lines(self, keys: Optional[Sequence[Hashable]] = None, digits: Optional[int] = 1) -> List[Dict[str, object]]:
+        """Like ``line`` for many keys (default all), derived with one pass per column."""
+        keys = self.keys if keys is None else tuple(keys)
+        rows = self.rows(keys)
+
+        def fmt(v):
+            v = float(v)
+            if np.isnan(v):
+                return None
+            return round(v, digits) if digits is not None else v
+
+        derived = {"MIN": self.column("MIN")}
+        for col in RATE_COLUMNS:
+            derived[col] = self.column(col)
+            derived[f"{col}/G"] = self.per_game(col)
+            derived[f"{col}/36"] = self.per36(col)
+        derived["MIN/G"] = self.per_game("MIN")
+        for col in (*PCT_COLUMNS, "TS%"):
+            derived[col] = self.pct(col)
+        out = []
+        for key, r in zip(keys, rows):
+            entry: Dict[str, object] = {"key": key, "G": self.totals[r, 0].item()}
+            entry.update({name: fmt(values[r]) for name, values in derived.items()})
+            out.append(entry)
+        return out
@@ -0,0 +1,631 @@
+"""Possession-level game simulation, vectorized across games.
+
+Every game in a batch advances together: possession lengths, turnovers,
+shot selection, makes, fouls, free throws and rebounds are drawn for all
+possessions of all games at once as NumPy arrays, and box scores are
+accumulated with one ``bincount``. Python only loops over second-chance
+attempts (offensive rebounds) and overtime periods for games still tied.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.game.profile import ROTATION, TeamProfile, resolve_profile
+from core.rng import RandomSource, as_streams
+
+STAT_COLUMNS: Tuple[str, ...] = (
+    "SEC", "PTS", "FGM", "FGA", "3PM", "3PA", "FTM", "FTA",
+    "ORB", "DRB", "AST", "STL", "BLK", "TOV", "PF",
+)
+STAT_INDEX: Dict[str, int] = {name: i for i, name in enumerate(STAT_COLUMNS)}
+
+QUARTERS = 4
+QUARTER_SECONDS = 720
+REGULATION_SECONDS = QUARTERS * QUARTER_SECONDS
+OVERTIME_SECONDS = 300
+# Field goal attempts per possession (the first plus offensive-rebound putbacks)
+MAX_ATTEMPTS = 4
+# Home side's make-chance multiplier
+HOME_EDGE = 1.015
+# Games simulated together; bigger batches are split so working arrays stay cache-sized.
+# Each block draws from its own random stream, keyed by block number.
+BLOCK_GAMES = 500
+
+HOME, AWAY = 0, 1
+SHOT, TURNOVER = 0, 1
+
+# One row per turnover or field goal attempt (including shooting fouls)
+PLAY_DTYPE = np.dtype([
+    ("game", np.int32),
+    ("time", np.float32),     # elapsed game seconds when the possession started
+    ("attempt", np.int8),     # 0 for the first attempt of a possession
+    ("side", np.int8),        # offense: HOME or AWAY
+    ("kind", np.int8),        # SHOT or TURNOVER
+    ("player", np.int8),      # shooter / ball handler (rotation slot)
+    ("three", np.bool_),
+    ("fga", np.bool_),        # counted as a field goal attempt
+    ("made", np.bool_),
+    ("fta", np.int8),
+    ("ftm", np.int8),
+    ("assist", np.int8),      # offense slot, -1 if unassisted
+    ("defender", np.int8),    # blocker or stealer, -1 if none
+    ("fouler", np.int8),      # defense slot, -1 if no shooting foul
+    ("rebounder", np.int8),   # -1 if no rebound
+    ("offensive", np.bool_),  # the rebound went to the offense
+])
+
+Teams = Union[str, TeamProfile, Sequence[Union[str, TeamProfile]]]
+
+
+class _TeamTable:
+    """Profiles stacked into ``(teams, ROTATION)`` arrays.
+
+    Player choice is one ``searchsorted`` for any mix of teams: the
+    normalized cumulative weights of team ``t`` are stored shifted by ``t``
+    in a single sorted array, and ``t + u`` is looked up in it.
+    """
+
+    def __init__(self, profiles: Sequence[TeamProfile]):
+        self.profiles = tuple(profiles)
+        n = len(self.profiles)
+        self._offsets = np.arange(n, dtype=np.float64)[:, None]
+        self.minutes = self._matrix("minutes")
+        # Per-player probabilities, flattened for ``team * ROTATION + slot`` lookups
+        self.three_rate = self._matrix("three_rate").ravel()
+        self.p2 = self._matrix("p2").ravel()
+        self.p3 = self._matrix("p3").ravel()
+        self.pft = self._matrix("pft").ravel()
+        self.foul_drawn = self._matrix("foul_drawn").ravel()
+        self.usage = self._cumulative("usage")
+        self.handling = self._cumulative("handling")
+        self.passing = self._cumulative("passing")
+        self.rebounding = self._cumulative("rebounding")
+        self.stealing = self._cumulative("stealing")
+        self.blocking = self._cumulative("blocking")
+        self.fouling = self._cumulative("fouling")
+        for name in ("pace", "turnover_rate", "steal_share", "assist_rate", "defense", "rebound", "block_rate"):
+            setattr(self, name, np.array([getattr(p, name) for p in self.profiles], dtype=np.float64))
+
+    def _matrix(self, attr: str) -> np.ndarray:
+        out = np.zeros((len(self.profiles), ROTATION))
+        for t, p in enumerate(self.profiles):
+            out[t, :p.size] = getattr(p, attr)
+        return out
+
+    def _cumulative(self, attr: str) -> np.ndarray:
+        w = self._matrix(attr)
+        c = np.cumsum(w, axis=1)
+        total = c[:, -1:]
+        c = np.divide(c, total, out=np.ones_like(c), where=total > 0)
+        c[:, -1] = 1.0
+        return (c + self._offsets).ravel()
+
+    @staticmethod
+    def pick(cum: np.ndarray, team: np.ndarray, u: np.ndarray) -> np.ndarray:
+        """Rotation slot drawn from each ``team``'s weights using uniforms ``u``."""
+        idx = np.searchsorted(cum, team + np.minimum(u, 1.0 - 1e-9), side="right")
+        return np.minimum(idx - team * ROTATION, ROTATION - 1)
+
+
+class _Stats:
+    """Per ``(game, side, slot)`` stat totals, accumulated with ``bincount``."""
+
+    def __init__(self, n_games: int):
+        self._rows = n_games * 2 * ROTATION
+        self._totals = np.zeros((len(STAT_COLUMNS), self._rows))
+
+    def add(self, row: np.ndarray, stat: str, weights: Optional[np.ndarray] = None) -> None:
+        """Add to ``stat`` for each player row ``(game * 2 + side) * ROTATION + slot``."""
+        if row.size:
+            self._totals[STAT_INDEX[stat]] += np.bincount(row, weights=weights, minlength=self._rows)
+
+    def finish(self) -> np.ndarray:
+        box = self._totals.T.astype(np.int32)
+        return box.reshape(-1, 2, ROTATION, len(STAT_COLUMNS))
+
+
+def _possession_starts(table: _TeamTable, teams: np.ndarray, seconds: float, rng: np.random.Generator):
+    """Start times (block-relative) of every possession, as ``(game, slot, start)``."""
+    # Possessions alternate, so both teams' paces (per 48 minutes each) set their length
+    mean = REGULATION_SECONDS / (table.pace[teams[:, 0]] + table.pace[teams[:, 1]])
+    n = int(np.ceil(seconds / mean.min() * 1.1)) + 2
+
+    def durations():
+        # Uniform on [0.4, 1.6] x mean: no possession shorter than a few seconds
+        return (0.4 + 1.2 * rng.random((len(teams), n), dtype=np.float32)) * mean[:, None].astype(np.float32)
+
+    ends = np.cumsum(durations(), axis=1)
+    while (ends[:, -1] < seconds).any():
+        ends = np.concatenate([ends, ends[:, -1:] + np.cumsum(durations(), axis=1)], axis=1)
+    starts = np.concatenate([np.zeros((len(teams), 1)), ends[:, :-1]], axis=1)
+    game, slot = np.nonzero(starts < seconds)
+    return game, slot, starts[game, slot]
+
+
+def _play_block(
+    table: _TeamTable,
+    games: np.ndarray,
+    teams: np.ndarray,
+    offset: float,
+    seconds: float,
+    rng: np.random.Generator,
+    stats: _Stats,
+    points: np.ndarray,
+    plays: Optional[List[np.ndarray]],
+) -> None:
+    """Play ``seconds`` of game time for ``games`` (global ids, teams ``(n, 2)``)."""
+    pick = _TeamTable.pick
+    local, slot, start = _possession_starts(table, teams, seconds, rng)
+    tip = rng.integers(0, 2, size=len(games))
+    side = (slot + tip[local]) % 2
+    game = games[local]
+    off = teams[local, side]
+    dfn = teams[local, 1 - side]
+    # First box-score row of the offense / defense in this game
+    off_row = (game * 2 + side) * ROTATION
+    def_row = (game * 2 + 1 - side) * ROTATION
+    n = len(game)
+
+    def record(sel, attempt, kind, player, **fields):
+        rec = np.zeros(len(sel), dtype=PLAY_DTYPE)
+        rec["game"], rec["time"], rec["side"] = game[sel], offset + start[sel], side[sel]
+        rec["attempt"], rec["kind"], rec["player"] = attempt, kind, player
+        rec["assist"] = rec["defender"] = rec["fouler"] = rec["rebounder"] = -1
+        for k, v in fields.items():
+            rec[k] = v
+        plays.append(rec)
+
+    # Turnovers end the possession before a shot
+    tov = np.flatnonzero(rng.random(n, dtype=np.float32) < table.turnover_rate[off])
+    handler = pick(table.handling, off[tov], rng.random(tov.size))
+    steal = np.flatnonzero(rng.random(tov.size) < table.steal_share[dfn[tov]])
+    stealer = pick(table.stealing, dfn[tov[steal]], rng.random(steal.size))
+    stats.add(off_row[tov] + handler, "TOV")
+    stats.add(def_row[tov[steal]] + stealer, "STL")
+    if plays is not None:
+        defender = np.full(tov.size, -1)
+        defender[steal] = stealer
+        record(tov, 0, TURNOVER, handler, defender=defender)
+
+    # Opponent defense and home court scale every make chance of a possession
+    edge = (table.defense[dfn] * np.where(side == HOME, HOME_EDGE, 1.0)).astype(np.float32)
+    orb_chance = np.clip(0.24 + 0.004 * (table.rebound[off] - table.rebound[dfn]), 0.12, 0.38)
+    shoot = np.ones(n, dtype=bool)
+    shoot[tov] = False
+    alive = np.flatnonzero(shoot)
+    for attempt in range(MAX_ATTEMPTS):
+        if alive.size == 0:
+            break
+        k = alive.size
+        o, d = off[alive], dfn[alive]
+        u = rng.random((6, k), dtype=np.float32)
+        shooter = pick(table.usage, o, u[0])
+        at = o * ROTATION + shooter  # flat (team, slot) index into the per-player tables
+        row = off_row[alive] + shooter
+        three = u[1] < table.three_rate[at]
+        chance = np.where(three, table.p3[at], table.p2[at])
+        made = u[2] < chance * edge[alive]
+        fouled = u[3] < table.foul_drawn[at]
+        fga = made | ~fouled
+        missed = fga & ~made
+
+        # Secondary draws only for the attempts they apply to
+        ast = np.flatnonzero(made & (u[4] < table.assist_rate[o]))
+        passer = pick(table.passing, o[ast], rng.random(ast.size))
+        keep = passer != shooter[ast]
+        ast, passer = ast[keep], passer[keep]
+        blk = np.flatnonzero(missed & ~three & (u[5] < table.block_rate[d]))
+        blocker = pick(table.blocking, d[blk], rng.random(blk.size))
+        miss = np.flatnonzero(missed)
+        offensive = rng.random(miss.size) < orb_chance[alive[miss]]
+        rebounder = pick(table.rebounding, np.where(offensive, o[miss], d[miss]), rng.random(miss.size))
+        foul = np.flatnonzero(fouled)
+        fouler = pick(table.fouling, d[foul], rng.random(foul.size))
+        # And-one on a make; two or three shots on a missed (uncounted) attempt
+        fta = np.where(made[foul], 1, np.where(three[foul], 3, 2))
+        shots = rng.random((3, foul.size)) < table.pft[at[foul]]
+        ftm = (shots & (np.arange(3)[:, None] < fta)).sum(axis=0)
+        pts = made * (2 + three)
+        pts[foul] += ftm
+
+        stats.add(row, "FGA", fga)
+        stats.add(row, "FGM", made)
+        stats.add(row, "3PA", fga & three)
+        stats.add(row, "3PM", made & three)
+        stats.add(row, "PTS", pts)
+        stats.add(row[foul], "FTA", fta)
+        stats.add(row[foul], "FTM", ftm)
+        stats.add(def_row[alive[foul]] + fouler, "PF")
+        stats.add(off_row[alive[ast]] + passer, "AST")
+        stats.add(def_row[alive[blk]] + blocker, "BLK")
+        orb, drb = miss[offensive], miss[~offensive]
+        stats.add(off_row[alive[orb]] + rebounder[offensive], "ORB")
+        stats.add(def_row[alive[drb]] + rebounder[~offensive], "DRB")
+        points += np.bincount(off_row[alive] // ROTATION, weights=pts, minlength=points.size).reshape(points.shape).astype(points.dtype)
+        if plays is not None:
+            full = {name: np.full(k, -1, dtype=np.int8) for name in ("assist", "defender", "fouler", "rebounder")}
+            full["assist"][ast], full["defender"][blk] = passer, blocker
+            full["fouler"][foul], full["rebounder"][miss] = fouler, rebounder
+            fta_all, ftm_all, orb_all = np.zeros(k, np.int8), np.zeros(k, np.int8), np.zeros(k, bool)
+            fta_all[foul], ftm_all[foul], orb_all[miss] = fta, ftm, offensive
+            record(alive, attempt, SHOT, shooter, three=three, fga=fga, made=made, fta=fta_all, ftm=ftm_all,
+                   offensive=orb_all, **full)
+        alive = alive[orb]
+
+
+def _as_list(teams: Teams, n: Optional[int]) -> List[Union[str, TeamProfile]]:
+    if isinstance(teams, (str, TeamProfile)):
+        return [teams] * (1 if n is None else n)
+    return list(teams)
+
+
+def simulate_games(
+    home: Teams,
+    away: Teams,
+    n_games: Optional[int] = None,
+    rng: RandomSource = None,
+    keep_plays: bool = False,
+    first_block: int = 0,
+) -> "GameBatch":
+    """Simulate a batch of games, vectorized across games.
+
+    ``home``/``away`` are team names or ``TeamProfile``s, either one team
+    repeated ``n_games`` times or sequences of equal length (one matchup per
+    game). Pass ``keep_plays=True`` to keep the per-attempt play log needed
+    for ``GameResult.events()``; large batches usually only need box scores.
+
+    ``rng`` is a seed or ``RandomStreams``; every ``BLOCK_GAMES`` games use
+    the stream keyed by their block number, counted from ``first_block``.
+    A batch split at block boundaries therefore reproduces exactly when the
+    pieces are simulated separately with matching ``first_block``.
+    """
+    home_list, away_list = _as_list(home, n_games), _as_list(away, n_games)
+    if len(home_list) != len(away_list):
+        raise ValueError(f"{len(home_list)} home teams but {len(away_list)} away teams")
+    streams = as_streams(rng)
+
+    profiles: List[TeamProfile] = []
+    index: Dict[str, int] = {}
+    ids = np.empty((len(home_list), 2), dtype=np.intp)
+    for side, lst in ((HOME, home_list), (AWAY, away_list)):
+        for i, team in enumerate(lst):
+            name = team.name if isinstance(team, TeamProfile) else str(team)
+            if name not in index:
+                index[name] = len(profiles)
+                profiles.append(resolve_profile(team))
+            ids[i, side] = index[name]
+    # Teams in name order, so split batches list them the same way
+    order = sorted(range(len(profiles)), key=lambda i: profiles[i].name)
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+    ids = rank[ids]
+    table = _TeamTable([profiles[i] for i in order])
+
+    n = len(ids)
+    scores = np.zeros((n, 2), dtype=np.int32)
+    box = np.zeros((n, 2, ROTATION, len(STAT_COLUMNS)), dtype=np.int32)
+    periods = np.full(n, QUARTERS, dtype=np.int16)
+    plays: Optional[List[np.ndarray]] = [] if keep_plays else None
+    for lo in range(0, n, BLOCK_GAMES):
+        hi = min(lo + BLOCK_GAMES, n)
+        block_rng = streams.generator(first_block + lo // BLOCK_GAMES)
+        _simulate_block(table, ids[lo:hi], block_rng, scores[lo:hi], box[lo:hi], periods[lo:hi], plays, lo)
+
+    log = None
+    if plays is not None:
+        log = np.concatenate(plays) if plays else np.zeros(0, dtype=PLAY_DTYPE)
+        log = log[np.lexsort((log["attempt"], log["time"], log["game"]))]
+    return GameBatch(
+        teams=table.profiles,
+        home=ids[:, HOME].copy(),
+        away=ids[:, AWAY].copy(),
+        scores=scores,
+        box=box,
+        periods=periods,
+        plays=log,
+        seed=streams.seed,
+    )
+
+
+def _simulate_block(
+    table: _TeamTable,
+    ids: np.ndarray,
+    rng: np.random.Generator,
+    scores: np.ndarray,
+    box: np.ndarray,
+    periods: np.ndarray,
+    plays: Optional[List[np.ndarray]],
+    first_game: int,
+) -> None:
+    """Play regulation plus any overtimes for ``ids``, writing into the output slices."""
+    n = len(ids)
+    stats = _Stats(n)
+    points = np.zeros((n, 2), dtype=np.int64)
+    block_plays: Optional[List[np.ndarray]] = [] if plays is not None else None
+    games = np.arange(n)
+    _play_block(table, games, ids, 0.0, REGULATION_SECONDS, rng, stats, points, block_plays)
+    tied = games[points[:, 0] == points[:, 1]]
+    while tied.size:
+        offset = REGULATION_SECONDS + OVERTIME_SECONDS * (periods[tied[0]] - QUARTERS)
+        _play_block(table, tied, ids[tied], float(offset), OVERTIME_SECONDS, rng, stats, points, block_plays)
+        periods[tied] += 1
+        tied = tied[points[tied, 0] == points[tied, 1]]
+
+    box[...] = stats.finish()
+    total = REGULATION_SECONDS + OVERTIME_SECONDS * (periods - QUARTERS)
+    box[..., STAT_INDEX["SEC"]] = np.rint(table.minutes[ids] / 48.0 * total[:, None, None])
+    scores[...] = points
+    if plays is not None:
+        for rec in block_plays:
+            rec["game"] += first_game
+        plays.extend(block_plays)
+
+
+def iter_game_blocks(
+    home: Teams,
+    away: Teams,
+    n_games: Optional[int] = None,
+    rng: RandomSource = None,
+    keep_plays: bool = False,
+) -> Iterator["GameBatch"]:
+    """``simulate_games`` one block at a time, for progress reporting and cancellation.
+
+    The blocks concatenate to exactly the batch ``simulate_games`` returns
+    for the same arguments.
+    """
+    home_list, away_list = _as_list(home, n_games), _as_list(away, n_games)
+    if len(home_list) != len(away_list):
+        raise ValueError(f"{len(home_list)} home teams but {len(away_list)} away teams")
+    streams = as_streams(rng)
+    cache: Dict[str, TeamProfile] = {}
+
+    def profiles(lst):
+        out = []
+        for team in lst:
+            name = team.name if isinstance(team, TeamProfile) else str(team)
+            if name not in cache:
+                cache[name] = resolve_profile(team)
+            out.append(cache[name])
+        return out
+
+    for lo in range(0, len(home_list), BLOCK_GAMES):
+        hi = lo + BLOCK_GAMES
+        yield simulate_games(profiles(home_list[lo:hi]), profiles(away_list[lo:hi]), rng=streams,
+                             keep_plays=keep_plays, first_block=lo // BLOCK_GAMES)
+
+
+def simulate_game(home: Union[str, TeamProfile], away: Union[str, TeamProfile],
+                  rng: RandomSource = None) -> "GameResult":
+    """Simulate one game with its full play-by-play."""
+    return simulate_games(home, away, 1, rng=rng, keep_plays=True).game(0)
+
+
+def play_by_play(home: Union[str, TeamProfile], away: Union[str, TeamProfile],
+                 n_games: Optional[int] = 1, rng: RandomSource = None) -> Iterator[PlayEvent]:
+    """Stream the play-by-play of ``n_games`` games (``None``: endless), one game at a time.
+
+    Each game is simulated only when the consumer reaches it, from the
+    stream keyed by its game number, so nothing beyond the current game is
+    held in memory.
+    """
+    streams = as_streams(rng)
+    home, away = resolve_profile(home), resolve_profile(away)
+    g = 0
+    while n_games is None or g < n_games:
+        yield from simulate_game(home, away, streams.child("game", g)).events(game=g)
+        g += 1
+
+
+@dataclass(frozen=True)
+class GameBatch:
+    """Results of ``simulate_games``; ``home``/``away`` index into ``teams``."""
+
+    teams: Tuple[TeamProfile, ...]
+    home: np.ndarray      # (games,)
+    away: np.ndarray      # (games,)
+    scores: np.ndarray    # (games, 2) int32, [home, away]
+    box: np.ndarray       # (games, 2, ROTATION, len(STAT_COLUMNS)) int32
+    periods: np.ndarray   # (games,) 4 for regulation, 5+ with overtime
+    plays: Optional[np.ndarray] = None  # PLAY_DTYPE sorted by game and time
+    seed: Optional[int] = None          # run seed the batch was drawn from
+
+    def __len__(self) -> int:
+        return len(self.scores)
+
+    @classmethod
+    def concat(cls, batches: Sequence["GameBatch"]) -> "GameBatch":
+        """Join batches in order; teams are merged by name and plays renumbered."""
+        if not batches:
+            raise ValueError("nothing to concatenate")
+        by_name = {p.name: p for b in batches for p in b.teams}
+        teams = [by_name[name] for name in sorted(by_name)]
+        index = {p.name: i for i, p in enumerate(teams)}
+        homes, aways, logs = [], [], []
+        first = 0
+        for b in batches:
+            remap = np.array([index[p.name] for p in b.teams], dtype=np.intp)
+            homes.append(remap[b.home])
+            aways.append(remap[b.away])
+            if b.plays is not None:
+                log = b.plays.copy()
+                log["game"] += first
+                logs.append(log)
+            first += len(b)
+        seeds = {b.seed for b in batches}
+        return cls(
+            teams=tuple(teams),
+            home=np.concatenate(homes),
+            away=np.concatenate(aways),
+            scores=np.concatenate([b.scores for b in batches]),
+            box=np.concatenate([b.box for b in batches]),
+            periods=np.concatenate([b.periods for b in batches]),
+            plays=np.concatenate(logs) if len(logs) == len(batches) else None,
+            seed=seeds.pop() if len(seeds) == 1 else None,
+        )
+
+    @property
+    def home_wins(self) -> np.ndarray:
+        return self.scores[:, HOME] > self.scores[:, AWAY]
+
+    def game(self, i: int) -> "GameResult":
+        plays = None
+        if self.plays is not None:
+            lo, hi = np.searchsorted(self.plays["game"], [i, i + 1])
+            plays = self.plays[lo:hi]
+        return GameResult(
+            home=self.teams[self.home[i]],
+            away=self.teams[self.away[i]],
+            score=(int(self.scores[i, HOME]), int(self.scores[i, AWAY])),
+            box=self.box[i],
+            periods=int(self.periods[i]),
+            plays=plays,
+        )
+
+    def __iter__(self) -> Iterator["GameResult"]:
+        return (self.game(i) for i in range(len(self)))
+
+
+class PlayEvent(NamedTuple):
+    period: int
+    clock: float          # seconds left in the period
+    team: str
+    kind: str             # "shot", "free_throws", "rebound", "turnover" or "end_of_period"
+    player: str
+    home_score: int
+    away_score: int
+    points: int = 0
+    made: bool = False
+    three: bool = False
+    assist: str = ""
+    defender: str = ""    # blocker, stealer or fouler
+    attempts: int = 0     # free throws attempted (``points`` are the makes)
+    offensive: bool = False
+    game: int = 0         # game number within a multi-game stream
+
+    @property
+    def clock_text(self) -> str:
+        secs = int(np.ceil(self.clock))
+        return f"{secs // 60}:{secs % 60:02d}"
+
+    def describe(self) -> str:
+        if self.kind == "end_of_period":
+            return f"End of {period_name(self.period)}"
+        if self.kind == "turnover":
+            return f"{self.player} turnover" + (f" (stolen by {self.defender})" if self.defender else "")
+        if self.kind == "rebound":
+            return f"{self.player} {'offensive' if self.offensive else 'defensive'} rebound"
+        if self.kind == "free_throws":
+            return f"{self.player} makes {self.points} of {self.attempts} free throws (foul on {self.defender})"
+        shot = "three pointer" if self.three else "two pointer"
+        if self.made:
+            return f"{self.player} makes {shot}" + (f" (assist by {self.assist})" if self.assist else "")
+        return f"{self.player} misses {shot}" + (f" (blocked by {self.defender})" if self.defender else "")
+
+
+def box_rows(team: TeamProfile, box: np.ndarray, digits: Optional[int] = None) -> List[Dict[str, object]]:
+    """One dict per rotation player from a ``(ROTATION, stats)`` box.
+
+    Seconds become ``MIN``; counts stay ints unless ``digits`` is given (for
+    averaged boxes), in which case every value is rounded to that many places.
+    """
+    rows = []
+    for slot, name in enumerate(team.players):
+        vals = box[slot]
+        if digits is None:
+            line = dict(zip(STAT_COLUMNS, (int(v) for v in vals)))
+        else:
+            line = dict(zip(STAT_COLUMNS, (round(float(v), digits) for v in vals)))
+        sec = line.pop("SEC")
+        rows.append({"name": name, "MIN": round(sec / 60.0, 1), **line})
+    return rows
+
+
+def period_name(period: int) -> str:
+    if period <= QUARTERS:
+        return ("1st", "2nd", "3rd", "4th")[period - 1] + " quarter"
+    ot = period - QUARTERS
+    return "overtime" if ot == 1 else f"overtime {ot}"
+
+
+def period_clock(time: float) -> Tuple[int, float]:
+    """``(period, seconds left)`` for an elapsed game time."""
+    if time < REGULATION_SECONDS:
+        q, into = divmod(time, QUARTER_SECONDS)
+        return int(q) + 1, QUARTER_SECONDS - into
+    ot, into = divmod(time - REGULATION_SECONDS, OVERTIME_SECONDS)
+    return QUARTERS + int(ot) + 1, OVERTIME_SECONDS - into
+
+
+@dataclass(frozen=True)
+class GameResult:
+    home: TeamProfile
+    away: TeamProfile
+    score: Tuple[int, int]
+    box: np.ndarray       # (2, ROTATION, len(STAT_COLUMNS))
+    periods: int
+    plays: Optional[np.ndarray] = None
+
+    @property
+    def winner(self) -> str:
+        return self.home.name if self.score[HOME] > self.score[AWAY] else self.away.name
+
+    def box_score(self, side: int) -> List[Dict[str, object]]:
+        """Box score rows for ``side`` (HOME or AWAY) with minutes as ``MIN``."""
+        return box_rows(self.home if side == HOME else self.away, self.box[side])
+
+    def events(self, game: int = 0) -> Iterator[PlayEvent]:
+        """Play-by-play in game order (requires ``keep_plays``), tagged with ``game``."""
+        if self.plays is None:
+            raise ValueError("game was simulated without keep_plays=True")
+        return play_events((self.home, self.away), self.plays, self.periods, game=game)
+
+
+def play_events(teams, plays: np.ndarray, periods: int, game: int = 0,
+                score: Tuple[int, int] = (0, 0), period: int = 1) -> Iterator[PlayEvent]:
+    """Turn play records into ``PlayEvent``s.
+
+    ``teams`` are ``(home, away)`` objects with ``name`` and ``players``.
+    ``plays`` may start mid-game, in which case ``score`` and ``period``
+    give the state before its first record.
+    """
+    score = list(score)
+
+    def name(side: int, slot: int) -> str:
+        return teams[side].players[slot] if slot >= 0 else ""
+
+    for p in plays:
+        side = int(p["side"])
+        now, clock = period_clock(float(p["time"]))
+        while period < now:
+            yield PlayEvent(period, 0.0, "", "end_of_period", "", score[HOME], score[AWAY], game=game)
+            period += 1
+        team, other = teams[side].name, 1 - side
+        shooter = name(side, int(p["player"]))
+        if p["kind"] == TURNOVER:
+            yield PlayEvent(period, clock, team, "turnover", shooter, score[HOME], score[AWAY],
+                            defender=name(other, int(p["defender"])), game=game)
+            continue
+        if p["fga"]:
+            made, three = bool(p["made"]), bool(p["three"])
+            pts = (3 if three else 2) if made else 0
+            score[side] += pts
+            yield PlayEvent(period, clock, team, "shot", shooter, score[HOME], score[AWAY], points=pts,
+                            made=made, three=three, assist=name(side, int(p["assist"])),
+                            defender=name(other, int(p["defender"])), game=game)
+        if p["fta"]:
+            score[side] += int(p["ftm"])
+            yield PlayEvent(period, clock, team, "free_throws", shooter, score[HOME], score[AWAY],
+                            points=int(p["ftm"]), attempts=int(p["fta"]),
+                            defender=name(other, int(p["fouler"])), game=game)
+        if p["rebounder"] >= 0:
+            offensive = bool(p["offensive"])
+            reb_side = side if offensive else other
+            yield PlayEvent(period, clock, teams[reb_side].name, "rebound", name(reb_side, int(p["rebounder"])),
+                            score[HOME], score[AWAY], offensive=offensive, game=game)
+    while period <= periods:
+        yield PlayEvent(period, 0.0, "", "end_of_period", "", score[HOME], score[AWAY], game=game)
+        period += 1
@@ -0,0 +1,246 @@
+"""Seekable binary play-by-play logs.
+
+A log holds any number of games as the engine's fixed-size play records,
+so nothing is parsed when it is opened: ``PlayLog`` maps the file with
+``mmap`` and views each section as a NumPy array. Every game has a
+per-minute offset index (minute ``m`` starts at record ``index[m]``), so
+replay can start at any quarter or minute without touching the plays before
+it; the score at that point is summed from the skipped records in one
+vectorized pass. Events are only built when iterated.
+
+Layout (little-endian)::
+
+    MAGIC
+    records   LOG_DTYPE rows of every game, back to back
+    index     int64 record offsets, one run of minutes + 1 per game
+    games     GAME_DTYPE rows
+    teams     UTF-8 JSON: [{"name": ..., "players": [...]}, ...]
+    trailer   TRAILER: index, games and teams offsets, teams length, MAGIC
+
+The trailer goes last so the writer can stream records as games finish.
+A full simulated season is about 5 MB.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple, Union
+
+import numpy as np
+
+from core.game.engine import (
+    AWAY, HOME, OVERTIME_SECONDS, PLAY_DTYPE, QUARTER_SECONDS, QUARTERS, REGULATION_SECONDS,
+    GameBatch, GameResult, PlayEvent, iter_game_blocks, play_events,
+)
+from core.rng import RandomSource, as_streams
+
+MAGIC = b"BBPBPv1\x00"
+TRAILER = struct.Struct("<QQQQ8s")
+# Play records without the game column (the game table locates them)
+LOG_DTYPE = np.dtype([(name, PLAY_DTYPE.fields[name][0]) for name in PLAY_DTYPE.names if name != "game"])
+GAME_DTYPE = np.dtype([
+    ("home", np.int32),          # into the team table
+    ("away", np.int32),
+    ("home_score", np.int16),
+    ("away_score", np.int16),
+    ("periods", np.int16),
+    ("first_record", np.int64),
+    ("records", np.int32),
+    ("first_minute", np.int64),  # into the index
+    ("minutes", np.int32),       # index entries (game minutes + 1)
+])
+
+
+class LogTeam(NamedTuple):
+    name: str
+    players: Tuple[str, ...]
+
+
+def game_minutes(periods: int) -> int:
+    return (REGULATION_SECONDS + OVERTIME_SECONDS * (periods - QUARTERS)) // 60
+
+
+def period_start_minute(period: int) -> int:
+    """Game minute at which ``period`` (1-based, overtimes after 4) starts."""
+    if period <= QUARTERS:
+        return (period - 1) * QUARTER_SECONDS // 60
+    return (REGULATION_SECONDS + (period - QUARTERS - 1) * OVERTIME_SECONDS) // 60
+
+
+def _points(records: np.ndarray) -> Tuple[int, int]:
+    """(home, away) points scored in ``records``."""
+    pts = (records["made"] & records["fga"]) * (2 + records["three"].astype(np.int64)) + records["ftm"]
+    side = records["side"]
+    return int(pts[side == HOME].sum()), int(pts[side == AWAY].sum())
+
+
+class PlayLogWriter:
+    """Streams games into a play log; use as a context manager or call ``close()``."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._file = self.path.open("wb")
+        self._file.write(MAGIC)
+        self._records = 0
+        self._index: List[np.ndarray] = []
+        self._minutes = 0
+        self._games: List[tuple] = []
+        self._teams: List[LogTeam] = []
+        self._team_ids: Dict[str, int] = {}
+
+    def __enter__(self) -> "PlayLogWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def _team(self, profile) -> int:
+        if profile.name not in self._team_ids:
+            self._team_ids[profile.name] = len(self._teams)
+            self._teams.append(LogTeam(profile.name, tuple(profile.players)))
+        return self._team_ids[profile.name]
+
+    def add_game(self, game: GameResult) -> None:
+        if game.plays is None:
+            raise ValueError("game was simulated without keep_plays=True")
+        records = np.empty(len(game.plays), dtype=LOG_DTYPE)
+        for name in LOG_DTYPE.names:
+            records[name] = game.plays[name]
+        minutes = game_minutes(game.periods)
+        index = np.searchsorted(records["time"], np.arange(minutes + 1) * 60.0, side="left").astype(np.int64)
+        self._file.write(records.tobytes())
+        self._index.append(index)
+        self._games.append((self._team(game.home), self._team(game.away), game.score[HOME], game.score[AWAY],
+                            game.periods, self._records, len(records), self._minutes, len(index)))
+        self._records += len(records)
+        self._minutes += len(index)
+
+    def add_batch(self, batch: GameBatch) -> None:
+        for game in batch:
+            self.add_game(game)
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        f = self._file
+        index_at = f.tell()
+        f.write(np.concatenate(self._index).tobytes() if self._index else b"")
+        games_at = f.tell()
+        f.write(np.array(self._games, dtype=GAME_DTYPE).tobytes())
+        teams_at = f.tell()
+        teams = json.dumps([{"name": t.name, "players": list(t.players)} for t in self._teams],
+                           ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        f.write(teams)
+        f.write(TRAILER.pack(index_at, games_at, teams_at, len(teams), MAGIC))
+        f.close()
+
+
+class PlayLog:
+    """A play log opened with ``mmap``; nothing is parsed until a game is replayed."""
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        with self.path.open("rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        mm = self._mmap
+        if len(mm) < len(MAGIC) + TRAILER.size or mm[:len(MAGIC)] != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is not a play-by-play log")
+        index_at, games_at, teams_at, teams_len, magic = TRAILER.unpack_from(mm, len(mm) - TRAILER.size)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{self.path} is truncated")
+        start = len(MAGIC)
+        self.records = np.frombuffer(mm, LOG_DTYPE, (index_at - start) // LOG_DTYPE.itemsize, start)
+        self.index = np.frombuffer(mm, np.int64, (games_at - index_at) // 8, index_at)
+        self.games = np.frombuffer(mm, GAME_DTYPE, (teams_at - games_at) // GAME_DTYPE.itemsize, games_at)
+        self.teams = tuple(LogTeam(t["name"], tuple(t["players"]))
+                           for t in json.loads(bytes(mm[teams_at:teams_at + teams_len]).decode("utf-8")))
+
+    def __enter__(self) -> "PlayLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self.games)
+
+    def close(self) -> None:
+        # Views into the map must go before it can be closed; if callers
+        # still hold some, the map is released when the last one goes.
+        self.records = self.index = self.games = None
+        mm, self._mmap = self._mmap, None
+        if mm is not None and not mm.closed:
+            try:
+                mm.close()
+            except BufferError:
+                pass
+
+    def matchup(self, game: int) -> Tuple[LogTeam, LogTeam]:
+        g = self.games[game]
+        return self.teams[g["home"]], self.teams[g["away"]]
+
+    def describe(self, game: int) -> str:
+        """``"Away 101 @ Home 99"`` for listings."""
+        home, away = self.matchup(game)
+        g = self.games[game]
+        extra = int(g["periods"]) - QUARTERS
+        ot = "" if extra <= 0 else " (OT)" if extra == 1 else f" ({extra}OT)"
+        return f"{away.name} {g['away_score']} @ {home.name} {g['home_score']}{ot}"
+
+    def seek(self, game: int, period: int = 1, minute: Optional[int] = None) -> int:
+        """Record offset (within the game) where ``period`` or game ``minute`` starts."""
+        g = self.games[game]
+        m = period_start_minute(period) if minute is None else minute
+        m = min(max(int(m), 0), int(g["minutes"]) - 1)
+        return int(self.index[g["first_minute"] + m])
+
+    def plays(self, game: int, period: int = 1, minute: Optional[int] = None) -> np.ndarray:
+        """Zero-copy view of a game's records from ``period``/``minute`` on."""
+        g = self.games[game]
+        lo = g["first_record"]
+        return self.records[lo + self.seek(game, period, minute):lo + g["records"]]
+
+    def events(self, game: int, period: int = 1, minute: Optional[int] = None) -> Iterator[PlayEvent]:
+        """Replay ``game`` from the start of ``period`` (or game ``minute``)."""
+        g = self.games[game]
+        lo = int(g["first_record"])
+        skip = self.seek(game, period, minute)
+        start_minute = period_start_minute(period) if minute is None else int(minute)
+        start_period = 1
+        while start_period < g["periods"] and period_start_minute(start_period + 1) <= start_minute:
+            start_period += 1
+        score = _points(self.records[lo:lo + skip])
+        return play_events(self.matchup(game), self.records[lo + skip:lo + g["records"]], int(g["periods"]),
+                           game=game, score=score, period=start_period)
+
+
+def write_play_log(path: Union[str, Path], games: Iterable[Union[GameResult, GameBatch]]) -> None:
+    """Write games (or batches of them) to a new log at ``path``."""
+    with PlayLogWriter(path) as writer:
+        for item in games:
+            if isinstance(item, GameBatch):
+                writer.add_batch(item)
+            else:
+                writer.add_game(item)
+
+
+def record_season(path: Union[str, Path], schedule=None, seed: RandomSource = None) -> int:
+    """Simulate a season with full play-by-play straight into a log; returns the seed.
+
+    Games are drawn from the same streams as ``simulate_season(seed=...)``,
+    so the log replays exactly that season.
+    """
+    from core.game.season import default_schedule
+
+    schedule = schedule if schedule is not None else default_schedule()
+    streams = as_streams(seed)
+    home, away = schedule.matchups()
+    with PlayLogWriter(path) as writer:
+        for batch in iter_game_blocks(home, away, rng=streams.child("season", 0), keep_plays=True):
+            writer.add_batch(batch)
+    return streams.seed
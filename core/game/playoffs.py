@@ -0,0 +1,281 @@
+"""Playoff brackets seeded from simulated standings, with title odds.
+
+Each season's playoff field is the top ``TEAMS_PER_CONFERENCE`` of every
+conference (``cid`` in teams.json). Single games are not simulated:
+a team's strength is its point differential per game that season, and the
+chance of winning one game at home is the normal probability of the rating
+gap plus ``HOME_POINTS`` over a margin spread of ``MARGIN_SD`` (both
+calibrated against the engine). A best-of-seven series then follows
+exactly from the two single-game probabilities by a small DP over series
+states, evaluated for every pair of teams at once.
+
+With series probabilities known, a bracket is just a coin flip per series,
+so tens of thousands of brackets take a few milliseconds and can be run
+after every season of a bulk projection (``project_playoffs``).
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+from core.game.season import SeasonProjection, SeasonResult
+from core.rng import RandomSource, as_streams
+from core.teams.loader import Team, load_teams
+
+TEAMS_PER_CONFERENCE = 8
+PLAYOFF_SIMS = 10_000
+# Home court of the better-record team in a best-of-seven (2-2-1-1-1)
+HOME_PATTERN: Tuple[bool, ...] = (True, True, False, False, True, False, True)
+# Engine calibration: average home margin and spread of game margins around
+# the teams' point differentials, in points
+HOME_POINTS = 1.3
+MARGIN_SD = 17.0
+# Rounds of an eight-seed, two-conference bracket, by the round reached
+ROUND_NAMES: Tuple[str, ...] = ("second_round", "conf_finals", "finals", "champion")
+
+_erf = np.frompyfunc(math.erf, 1, 1)
+
+
+def game_win_matrix(ratings: Sequence[float], home_points: float = HOME_POINTS,
+                    margin_sd: float = MARGIN_SD) -> np.ndarray:
+    """``[i, j]``: chance that team ``i`` beats team ``j`` at ``i``'s arena."""
+    r = np.asarray(ratings, dtype=np.float64)
+    z = (r[:, None] - r[None, :] + home_points) / (margin_sd * math.sqrt(2.0))
+    return (0.5 * (1.0 + _erf(z))).astype(np.float64)
+
+
+def _series(p_home, p_away, pattern: Tuple[bool, ...]):
+    """Chance the home-court team wins the series; works on scalars or arrays.
+
+    ``win[a][b]`` is the chance of winning from ``a`` wins to ``b`` losses,
+    filled backwards from the decided states; the game at that state is
+    game ``a + b`` of ``pattern``.
+    """
+    need = len(pattern) // 2 + 1
+    win = [[None] * (need + 1) for _ in range(need + 1)]
+    for a in range(need, -1, -1):
+        for b in range(need, -1, -1):
+            if a == need and b < need:
+                win[a][b] = 1.0
+            elif b == need and a < need:
+                win[a][b] = 0.0
+            elif a < need and b < need:
+                p = p_home if pattern[a + b] else p_away
+                win[a][b] = p * win[a + 1][b] + (1.0 - p) * win[a][b + 1]
+    return win[0][0]
+
+
+@lru_cache(maxsize=4096)
+def series_win_probability(p_home: float, p_away: float, pattern: Tuple[bool, ...] = HOME_PATTERN) -> float:
+    """Chance the team with home court wins a series (best of ``len(pattern)``).
+
+    ``p_home``/``p_away`` are its single-game chances at home and away;
+    ``pattern`` marks the games it hosts.
+    """
+    if len(pattern) % 2 == 0:
+        raise ValueError("a series needs an odd number of games")
+    return float(_series(float(p_home), float(p_away), tuple(pattern)))
+
+
+def series_win_matrix(game_probs: np.ndarray, pattern: Tuple[bool, ...] = HOME_PATTERN) -> np.ndarray:
+    """``[i, j]``: chance ``i`` beats ``j`` in a series with ``i`` holding home court.
+
+    ``game_probs`` is a ``game_win_matrix``; every pair is solved in one pass.
+    """
+    if len(pattern) % 2 == 0:
+        raise ValueError("a series needs an odd number of games")
+    p = np.asarray(game_probs, dtype=np.float64)
+    return np.asarray(_series(p, 1.0 - p.T, tuple(pattern)), dtype=np.float64)
+
+
+@dataclass(frozen=True)
+class Bracket:
+    """A season's playoff field in bracket order.
+
+    ``slots`` index into ``teams``; neighbours meet in the first round, the
+    winners of neighbouring pairs next, and so on. Each conference fills one
+    contiguous half, so conference champions meet in the final. ``rank``
+    orders every team by record (0 = best) and decides home court.
+    """
+
+    teams: Tuple[str, ...]
+    slots: np.ndarray
+    seeds: np.ndarray       # seed within its conference, per slot
+    rank: np.ndarray        # per team
+    ratings: np.ndarray     # point differential per game, per team
+
+    @property
+    def rounds(self) -> int:
+        return int(len(self.slots)).bit_length() - 1
+
+    def series_matrix(self, pattern: Tuple[bool, ...] = HOME_PATTERN) -> np.ndarray:
+        """``[i, j]``: chance ``i`` beats ``j`` in a series, home court to the better record."""
+        series = series_win_matrix(game_win_matrix(self.ratings), pattern)
+        better = self.rank[:, None] < self.rank[None, :]
+        return np.where(better, series, 1.0 - series.T)
+
+    def first_round(self) -> List[Tuple[str, int, str, int]]:
+        """``(team, seed, opponent, seed)`` for every first-round series."""
+        names = [self.teams[t] for t in self.slots]
+        return [(names[i], int(self.seeds[i]), names[i + 1], int(self.seeds[i + 1]))
+                for i in range(0, len(names), 2)]
+
+
+def _bracket_order(n: int) -> List[int]:
+    """Seeds 1..n in bracket order (1 v n, then the winner meets 4 v n-3, ...)."""
+    order = [1]
+    while len(order) < n:
+        m = 2 * len(order) + 1
+        order = [x for s in order for x in (s, m - s)]
+    return order
+
+
+def seed_playoffs(season: SeasonResult, league: Optional[Sequence[Team]] = None,
+                  per_conference: int = TEAMS_PER_CONFERENCE) -> Bracket:
+    """Seed the top ``per_conference`` teams of each conference by record.
+
+    Ties are broken by point differential, then name. Needs a power-of-two
+    number of conferences and of seeds per conference.
+    """
+    if per_conference < 1 or per_conference & (per_conference - 1):
+        raise ValueError("per_conference must be a power of two")
+    league = league if league is not None else load_teams()
+    index = {name: i for i, name in enumerate(season.teams)}
+    conferences: Dict[int, List[int]] = {}
+    for row in season.standings(league):
+        if row.cid is not None:
+            conferences.setdefault(row.cid, []).append(index[row.team])
+    n_conf = len(conferences)
+    if n_conf == 0 or n_conf & (n_conf - 1):
+        raise ValueError(f"need a power-of-two number of conferences, got {n_conf}")
+    short = [cid for cid, teams in conferences.items() if len(teams) < per_conference]
+    if short:
+        raise ValueError(f"conference {short[0]} has fewer than {per_conference} teams")
+
+    games = np.maximum(season.wins + season.losses, 1)
+    ratings = (season.points_for - season.points_against) / games
+    pct = season.wins / games
+    order = sorted(range(len(season.teams)), key=lambda i: (-pct[i], -ratings[i], season.teams[i]))
+    rank = np.empty(len(order), dtype=np.intp)
+    rank[order] = np.arange(len(order))
+
+    slots, seeds = [], []
+    for cid in sorted(conferences):
+        for seed in _bracket_order(per_conference):
+            slots.append(conferences[cid][seed - 1])
+            seeds.append(seed)
+    return Bracket(tuple(season.teams), np.array(slots, dtype=np.intp), np.array(seeds, dtype=np.int16),
+                   rank, ratings.astype(np.float64))
+
+
+def _simulate_bracket(bracket: Bracket, series: np.ndarray, n_sims: int, rng: np.random.Generator) -> np.ndarray:
+    """Times each team won each round, shape ``(teams, rounds)``."""
+    n_teams = len(bracket.teams)
+    won = np.zeros((n_teams, bracket.rounds), dtype=np.int64)
+    alive = np.broadcast_to(bracket.slots, (n_sims, len(bracket.slots)))
+    for r in range(bracket.rounds):
+        a, b = alive[:, 0::2], alive[:, 1::2]
+        alive = np.where(rng.random(a.shape) < series[a, b], a, b)
+        won[:, r] = np.bincount(alive.ravel(), minlength=n_teams)
+    return won
+
+
+@dataclass(frozen=True)
+class PlayoffOdds:
+    """Share of simulated brackets in which each team won each round.
+
+    ``rounds[t, r]`` is the chance team ``t`` won round ``r`` (the last
+    column is the title), over ``seasons * sims_per_season`` brackets.
+    """
+
+    teams: Tuple[str, ...]
+    rounds: np.ndarray
+    made_playoffs: np.ndarray
+    seasons: int
+    sims_per_season: int
+    seed: Optional[int] = None
+
+    def round_names(self) -> Tuple[str, ...]:
+        n = self.rounds.shape[1]
+        return ROUND_NAMES[-n:] if n <= len(ROUND_NAMES) else tuple(f"round_{r + 2}" for r in range(n))
+
+    def champion_odds(self) -> Dict[str, float]:
+        return {team: float(self.rounds[i, -1]) for i, team in enumerate(self.teams)}
+
+    def table(self) -> List[Dict[str, object]]:
+        """Playoff, round and title odds per team, favourites first."""
+        names = self.round_names()
+        rows = []
+        for i, team in enumerate(self.teams):
+            row: Dict[str, object] = {"team": team, "playoffs": float(self.made_playoffs[i])}
+            row.update({name: float(self.rounds[i, r]) for r, name in enumerate(names)})
+            rows.append(row)
+        rows.sort(key=lambda r: (-r[names[-1]], -r["playoffs"], r["team"]))
+        return rows
+
+
+def _odds(teams: Tuple[str, ...], won: np.ndarray, made: np.ndarray, seasons: int, sims: int,
+          seed: Optional[int]) -> PlayoffOdds:
+    return PlayoffOdds(
+        teams=teams,
+        rounds=won / float(seasons * sims),
+        made_playoffs=made / float(seasons),
+        seasons=seasons,
+        sims_per_season=sims,
+        seed=seed,
+    )
+
+
+def simulate_playoffs(
+    season: Union[SeasonResult, Bracket],
+    n_sims: int = PLAYOFF_SIMS,
+    seed: RandomSource = None,
+    league: Optional[Sequence[Team]] = None,
+) -> PlayoffOdds:
+    """Round and title odds from ``n_sims`` brackets after one season.
+
+    ``seed=None`` uses the season's seed when it has one, so the odds of a
+    reproduced season are reproduced too.
+    """
+    if n_sims < 1:
+        raise ValueError("n_sims must be at least 1")
+    if seed is None and isinstance(season, SeasonResult):
+        seed = season.seed
+    bracket = season if isinstance(season, Bracket) else seed_playoffs(season, league)
+    streams = as_streams(seed)
+    won = _simulate_bracket(bracket, bracket.series_matrix(), n_sims, streams.generator("playoffs", 0))
+    made = np.bincount(bracket.slots, minlength=len(bracket.teams))
+    return _odds(bracket.teams, won, made, 1, n_sims, streams.seed)
+
+
+def project_playoffs(
+    projection: SeasonProjection,
+    sims_per_season: int = PLAYOFF_SIMS,
+    seed: RandomSource = None,
+    league: Optional[Sequence[Team]] = None,
+) -> PlayoffOdds:
+    """Playoff odds over every season of a projection, ``sims_per_season`` brackets each.
+
+    Each season is seeded from its own standings and ratings, so the odds
+    carry both regular-season and playoff uncertainty. ``seed=None`` uses
+    the projection's seed.
+    """
+    if sims_per_season < 1:
+        raise ValueError("sims_per_season must be at least 1")
+    league = league if league is not None else load_teams()
+    streams = as_streams(projection.seed if seed is None else seed)
+    n_teams = len(projection.teams)
+    won = None
+    made = np.zeros(n_teams, dtype=np.int64)
+    for s in range(projection.seasons):
+        bracket = seed_playoffs(projection.season(s), league)
+        season_won = _simulate_bracket(bracket, bracket.series_matrix(), sims_per_season,
+                                       streams.generator("playoffs", s))
+        won = season_won if won is None else won + season_won
+        made += np.bincount(bracket.slots, minlength=n_teams)
+    return _odds(projection.teams, won, made, projection.seasons, sims_per_season, streams.seed)
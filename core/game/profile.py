@@ -0,0 +1,192 @@
+"""Per-team simulation inputs derived from player ratings.
+
+A ``TeamProfile`` turns a roster into a fixed-size rotation with one float
+array per tendency (usage, shooting percentages, rebound/steal/block
+weights, minutes), so the engine can work on stacked ``(teams, ROTATION)``
+matrices instead of per-player objects.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from threading import RLock
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+
+from core.players.ratings import RatingsStore, get_ratings_store
+from core.repository import get_repository
+from core.teams.rosters import get_team_roster
+
+# Players who get minutes; deeper bench players never enter a simulated game
+ROTATION = 10
+# Minutes for a full ten-man rotation, best player first (sums to 240)
+MINUTES = (34.0, 33.0, 32.0, 31.0, 30.0, 24.0, 20.0, 16.0, 12.0, 8.0)
+# Rating used for roster players missing from player_info.json
+DEFAULT_RATING = 40.0
+# Most of a team's shots any one player takes
+MAX_USAGE_SHARE = 0.28
+
+_RATINGS = (
+    "overall", "Height", "Strength", "Speed", "Jump", "Inside", "Dunk", "Free Throw",
+    "Field Goal", "Three Point", "Defense IQ", "Offense IQ", "Dribble", "Pass", "Rebound",
+)
+
+
+def _clip(x, lo: float, hi: float):
+    return np.clip(x, lo, hi)
+
+
+def _cap_shares(weights: np.ndarray, cap: float) -> np.ndarray:
+    """Normalize ``weights`` to shares with none above ``cap`` (excess goes to the rest)."""
+    shares = weights / weights.sum()
+    if cap * len(shares) <= 1.0:
+        return np.full(len(shares), 1.0 / len(shares))
+    capped = np.zeros(len(shares), dtype=bool)
+    while True:
+        over = ~capped & (shares > cap)
+        if not over.any():
+            return shares
+        capped |= over
+        free = weights * ~capped
+        shares = np.where(capped, cap, free / free.sum() * (1.0 - cap * capped.sum()))
+
+
+@dataclass(frozen=True)
+class TeamProfile:
+    """Rotation and per-player tendencies for one team.
+
+    Player arrays have length ``len(players)`` (at most ``ROTATION``); weight
+    arrays are unnormalized and only meaningful relative to each other.
+    """
+
+    name: str
+    players: Tuple[str, ...]
+    minutes: np.ndarray      # minutes per 48, sums to 240 for a full rotation
+    usage: np.ndarray        # shot-taking weight (includes minutes)
+    handling: np.ndarray     # turnover weight
+    passing: np.ndarray      # assist weight
+    rebounding: np.ndarray
+    stealing: np.ndarray
+    blocking: np.ndarray
+    fouling: np.ndarray
+    three_rate: np.ndarray   # share of field goal attempts that are threes
+    p2: np.ndarray
+    p3: np.ndarray
+    pft: np.ndarray
+    foul_drawn: np.ndarray   # chance a field goal attempt draws a shooting foul
+    # Team-level rates (minutes-weighted over the rotation)
+    pace: float              # possessions per 48 minutes
+    turnover_rate: float     # turnovers per possession
+    steal_share: float       # share of turnovers that are steals
+    assist_rate: float       # share of made field goals that are assisted
+    defense: float           # multiplier applied to opponents' make chances
+    rebound: float           # team rebounding rating
+    block_rate: float        # share of opponents' missed twos that are blocked
+
+    @property
+    def size(self) -> int:
+        return len(self.players)
+
+
+def build_team_profile(name: str, roster: Sequence[str], store: RatingsStore) -> TeamProfile:
+    """Build the profile for ``roster`` using ratings from ``store``."""
+    if not roster:
+        raise ValueError(f"team {name!r} has no players")
+    rows = store.rows(roster)
+    r = {}
+    for col in _RATINGS:
+        vals = store.column(col)[rows] if len(store) else np.full(rows.shape, np.nan)
+        vals = np.where(rows >= 0, vals, np.nan)
+        r[col] = vals
+    r["Height"] = np.where(np.isnan(r["Height"]), 78.0, r["Height"])
+    for col in _RATINGS:
+        r[col] = np.where(np.isnan(r[col]), DEFAULT_RATING, r[col])
+
+    # Best players first (stable, so roster order breaks ties)
+    order = np.argsort(-r["overall"], kind="stable")[:ROTATION]
+    r = {col: vals[order] for col, vals in r.items()}
+    players = tuple(str(roster[i]) for i in order)
+    n = len(players)
+
+    minutes = np.array(MINUTES[:n])
+    minutes = np.minimum(minutes * (240.0 / minutes.sum()), 48.0)
+    share = minutes / 48.0
+
+    def team_mean(vals: np.ndarray) -> float:
+        return float(np.sum(vals * share) / share.sum())
+
+    height = (r["Height"] - 70.0) * 4.0  # 80 in -> 40, on the same scale as ratings
+    two = 0.4 * r["Inside"] + 0.3 * r["Dunk"] + 0.3 * r["Field Goal"]
+    handle = (r["Dribble"] + r["Pass"]) / 2.0
+    usage = _cap_shares(np.exp((r["overall"] - 50.0) / 14.0) * (r["Offense IQ"] / 50.0) * share, MAX_USAGE_SHARE)
+
+    arrays = dict(
+        minutes=minutes,
+        usage=usage,
+        handling=usage * (110.0 - handle) / 60.0,
+        passing=(r["Pass"] / 50.0) ** 2 * share,
+        rebounding=np.maximum(r["Rebound"] + height, 1.0) ** 2 * share,
+        stealing=np.maximum(r["Speed"] + r["Defense IQ"], 1.0) * share,
+        blocking=np.maximum(r["Jump"] + height - 40.0, 1.0) ** 2 * share,
+        fouling=np.maximum(110.0 - r["Defense IQ"], 1.0) * share,
+        three_rate=_clip(0.38 + 0.008 * (r["Three Point"] - r["Inside"]), 0.02, 0.75),
+        p2=_clip(0.24 + 0.0035 * two, 0.32, 0.64),
+        p3=_clip(0.14 + 0.0029 * r["Three Point"], 0.15, 0.43),
+        pft=_clip(0.46 + 0.006 * r["Free Throw"], 0.40, 0.95),
+        foul_drawn=_clip(0.12 + 0.0015 * ((r["Strength"] + r["Dunk"]) / 2.0 - 45.0), 0.05, 0.22),
+    )
+    for a in arrays.values():
+        a.setflags(write=False)
+
+    return TeamProfile(
+        name=name,
+        players=players,
+        pace=float(_clip(97.0 + 0.25 * (team_mean(r["Speed"]) - 53.0), 90.0, 108.0)),
+        turnover_rate=float(_clip(0.13 - 0.0015 * (team_mean(handle) - 45.0), 0.08, 0.19)),
+        steal_share=float(_clip(0.52 + 0.008 * (team_mean(r["Speed"]) - 53.0), 0.3, 0.7)),
+        assist_rate=float(_clip(0.62 + 0.005 * (team_mean(r["Pass"]) - 45.0), 0.45, 0.75)),
+        defense=float(_clip(1.0 - 0.004 * (team_mean(r["Defense IQ"]) - 42.0), 0.88, 1.12)),
+        rebound=team_mean(r["Rebound"] + height),
+        block_rate=float(_clip(0.16 + 0.004 * (team_mean(r["Jump"] + height) - 90.0), 0.06, 0.28)),
+        **arrays,
+    )
+
+
+class _ProfileCache:
+    """Profiles per team, rebuilt when that team's roster or ratings change."""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[object, object, TeamProfile]] = {}
+        self._lock = RLock()
+
+    def get(self, team: str) -> TeamProfile:
+        roster = tuple(get_team_roster(team))
+        store = get_ratings_store()
+        with self._lock:
+            hit = self._entries.get(team)
+            # The store object is shared until player_info.json changes
+            if hit is not None and hit[0] == roster and hit[1] is store:
+                return hit[2]
+            profile = build_team_profile(team, roster, store)
+            self._entries[team] = (roster, store, profile)
+            return profile
+
+
+_CACHE = _ProfileCache()
+
+
+def get_team_profile(team: str, rosters_path=None, player_info_path=None) -> TeamProfile:
+    """Profile for ``team`` from rosters.json / player_info.json (cached)."""
+    if rosters_path is None and player_info_path is None:
+        return _CACHE.get(team)
+    roster = get_repository().rosters(rosters_path).get(team, ())
+    return build_team_profile(team, roster, get_ratings_store(player_info_path))
+
+
+def resolve_profile(team, rosters_path=None, player_info_path=None) -> TeamProfile:
+    """Accept a ``TeamProfile`` or a team name."""
+    if isinstance(team, TeamProfile):
+        return team
+    return get_team_profile(str(team), rosters_path, player_info_path)
+
@@ -0,0 +1,313 @@
+"""Full-season simulation spread over worker processes.
+
+Every season's games are cut into engine blocks, each drawn from the random
+stream keyed by (season, block) under the run seed, and tasks are runs of
+blocks. Results are therefore identical for any number of workers. Each
+worker simulates its games with the vectorized engine and sends back only
+small reductions: per-season wins, losses and points per team plus
+per-season player stat totals. The parent sums them, so the data crossing
+process boundaries does not grow with the number of games.
+"""
+
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.game.boxscore import BOX_COLUMNS, BoxScoreAccumulator
+from core.game.engine import AWAY, BLOCK_GAMES, HOME, simulate_games
+from core.game.parallel import TASKS_PER_WORKER, block_ranges, resolve_workers
+from core.game.profile import ROTATION, TeamProfile, get_team_profile
+from core.rng import RandomSource, RandomStreams, as_streams
+from core.schedule import Schedule, generate_schedule
+from core.teams.loader import Team, load_teams
+from core.teams.rosters import get_team_roster
+
+# Season stat columns: games played, then the engine's box score columns
+SEASON_COLUMNS: Tuple[str, ...] = BOX_COLUMNS
+# Minimum task count when reporting progress, so updates arrive steadily
+PROGRESS_TASKS = 50
+
+
+@dataclass(frozen=True)
+class StandingRow:
+    team: str
+    cid: Optional[int]
+    did: Optional[int]
+    wins: int
+    losses: int
+    points_for: int
+    points_against: int
+
+    @property
+    def pct(self) -> float:
+        games = self.wins + self.losses
+        return self.wins / games if games else 0.0
+
+
+@dataclass(frozen=True)
+class SeasonResult:
+    """Standings and player totals of one simulated season.
+
+    ``player_stats`` has shape ``(teams, ROTATION, len(SEASON_COLUMNS))``;
+    row ``[t, slot]`` belongs to ``players[t][slot]``.
+    """
+
+    teams: Tuple[str, ...]
+    wins: np.ndarray
+    losses: np.ndarray
+    points_for: np.ndarray
+    points_against: np.ndarray
+    players: Tuple[Tuple[str, ...], ...]
+    player_stats: np.ndarray
+    seed: Optional[int] = None  # run seed; rerun with it to reproduce the season
+
+    def standings(self, league: Optional[Sequence[Team]] = None) -> List[StandingRow]:
+        """Rows ordered by conference, then win percentage and point differential."""
+        meta = {t.name: t for t in (league if league is not None else load_teams())}
+        rows = []
+        for i, name in enumerate(self.teams):
+            team = meta.get(name)
+            rows.append(StandingRow(
+                team=name,
+                cid=team.cid if team else None,
+                did=team.did if team else None,
+                wins=int(self.wins[i]),
+                losses=int(self.losses[i]),
+                points_for=int(self.points_for[i]),
+                points_against=int(self.points_against[i]),
+            ))
+        rows.sort(key=lambda r: (r.cid if r.cid is not None else 99, -r.pct, r.points_against - r.points_for, r.team))
+        return rows
+
+    def box_scores(self) -> BoxScoreAccumulator:
+        """Player totals keyed by ``(team, player)``, for per-game/per-36 derivations."""
+        acc = BoxScoreAccumulator([(team, name) for t, team in enumerate(self.teams) for name in self.players[t]])
+        acc.totals[...] = self.player_stats.reshape(len(acc), len(SEASON_COLUMNS))
+        return acc
+
+    def player_totals(self) -> List[Dict[str, object]]:
+        """Season totals per player with minutes as ``MIN``, best scorers first."""
+        acc = self.box_scores()
+        minutes = acc.column("MIN")
+        out = []
+        for r, (team, name) in enumerate(acc.keys):
+            line = {"name": name, "team": team}
+            for c, col in enumerate(SEASON_COLUMNS):
+                if col == "SEC":
+                    line["MIN"] = round(float(minutes[r]), 1)
+                else:
+                    line[col] = int(acc.totals[r, c])
+            out.append((-line["PTS"], name, line))
+        return [line for _, _, line in sorted(out, key=lambda x: (x[0], x[1]))]
+
+
+@dataclass(frozen=True)
+class SeasonProjection:
+    """Many simulated seasons: per-season team results and player totals.
+
+    ``season_player_stats`` has shape ``(seasons, teams, ROTATION,
+    len(SEASON_COLUMNS))`` (about 38 KB per season for 30 teams);
+    ``player_stats`` is its sum over all seasons.
+    """
+
+    teams: Tuple[str, ...]
+    wins: np.ndarray            # (seasons, teams)
+    losses: np.ndarray
+    points_for: np.ndarray
+    points_against: np.ndarray
+    players: Tuple[Tuple[str, ...], ...]
+    player_stats: np.ndarray    # summed over all seasons
+    season_player_stats: np.ndarray
+    seed: Optional[int] = None  # run seed; rerun with it to reproduce every season
+
+    @property
+    def seasons(self) -> int:
+        return len(self.wins)
+
+    def season(self, i: int) -> SeasonResult:
+        return SeasonResult(self.teams, self.wins[i], self.losses[i], self.points_for[i],
+                            self.points_against[i], self.players, self.season_player_stats[i], self.seed)
+
+    def win_table(self, percentiles: Sequence[int] = (10, 50, 90)) -> List[Dict[str, object]]:
+        """Mean wins and win percentiles per team, best projection first."""
+        pct = np.percentile(self.wins, percentiles, axis=0)
+        mean = self.wins.mean(axis=0)
+        rows = []
+        for i, team in enumerate(self.teams):
+            row = {"team": team, "mean_wins": round(float(mean[i]), 1)}
+            row.update({f"p{p}": float(pct[j, i]) for j, p in enumerate(percentiles)})
+            rows.append(row)
+        rows.sort(key=lambda r: (-r["mean_wins"], r["team"]))
+        return rows
+
+
+# Profiles handed to each worker process once, by the pool initializer
+_WORKER_PROFILES: Optional[Tuple[TeamProfile, ...]] = None
+
+
+def _init_worker(profiles: Tuple[TeamProfile, ...]) -> None:
+    global _WORKER_PROFILES
+    _WORKER_PROFILES = profiles
+
+
+def _run_task(task, profiles: Optional[Sequence[TeamProfile]] = None):
+    """Simulate one task's blocks and reduce them per season, per team and per player.
+
+    ``task`` is ``(seasons, units)``; each unit is ``(season, home, away,
+    streams, block)`` with task-local season ids and ``home``/``away``
+    indexing into ``profiles``. A unit is one engine block drawn from the
+    stream for ``block``, so results do not depend on how units are grouped.
+    """
+    profiles = profiles if profiles is not None else _WORKER_PROFILES
+    n_seasons, units = task
+    n_teams = len(profiles)
+    ids = {p.name: i for i, p in enumerate(profiles)}
+    wins = np.zeros((n_seasons, n_teams), dtype=np.int64)
+    losses = np.zeros_like(wins)
+    points_for = np.zeros_like(wins)
+    points_against = np.zeros_like(wins)
+    box = BoxScoreAccumulator(n_seasons * n_teams * ROTATION)
+    slots = np.arange(ROTATION)
+
+    for season, home, away, streams, block in units:
+        batch = simulate_games([profiles[i] for i in home], [profiles[i] for i in away],
+                               rng=streams, first_block=block)
+        local = np.array([ids[p.name] for p in batch.teams], dtype=np.intp)
+        home_ids, away_ids = local[batch.home], local[batch.away]
+        home_pts, away_pts = batch.scores[:, HOME], batch.scores[:, AWAY]
+        home_won = home_pts > away_pts
+
+        def per_team(team_ids, weights):
+            return np.bincount(team_ids, weights=weights, minlength=n_teams).astype(np.int64)
+
+        wins[season] += per_team(home_ids, home_won) + per_team(away_ids, ~home_won)
+        losses[season] += per_team(home_ids, ~home_won) + per_team(away_ids, home_won)
+        points_for[season] += per_team(home_ids, home_pts) + per_team(away_ids, away_pts)
+        points_against[season] += per_team(home_ids, away_pts) + per_team(away_ids, home_pts)
+
+        # Player rows are (season * teams + team) * ROTATION + rotation slot
+        sides = np.stack([home_ids, away_ids], axis=1) + season * n_teams
+        box.add_box(sides[:, :, None] * ROTATION + slots, batch.box)
+    return wins, losses, points_for, points_against, box.totals.reshape(n_seasons, n_teams * ROTATION, -1)
+
+
+def league_teams() -> Tuple[str, ...]:
+    """Every team in teams.json that has a roster, in teams.json order."""
+    return tuple(t.name for t in load_teams() if get_team_roster(t.name))
+
+
+def default_schedule() -> Schedule:
+    """``generate_schedule`` over every team in teams.json with a roster."""
+    names = set(league_teams())
+    return generate_schedule([t for t in load_teams() if t.name in names])
+
+
+def _tasks(schedule: Schedule, n_seasons: int, n_tasks: int, streams: RandomStreams) -> List[tuple]:
+    """Split ``n_seasons`` repeats of ``schedule`` into about ``n_tasks`` tasks.
+
+    The unit of work is one engine block of a season (``BLOCK_GAMES``
+    consecutive games), drawn from the stream keyed by season and block;
+    tasks only group units, so any task count gives the same results.
+    Returns ``(first season, task)`` pairs.
+    """
+    n_blocks = -(-len(schedule) // BLOCK_GAMES)
+    units = [(s, b) for s in range(n_seasons) for b in range(n_blocks)]
+    out = []
+    for group in block_ranges(len(units), n_tasks):
+        first = units[group.start][0]
+        task_units = []
+        for s, b in (units[u] for u in group):
+            lo, hi = b * BLOCK_GAMES, (b + 1) * BLOCK_GAMES
+            task_units.append((s - first, schedule.home[lo:hi], schedule.away[lo:hi], streams.child("season", s), b))
+        out.append((first, (units[group.stop - 1][0] - first + 1, task_units)))
+    return out
+
+
+def simulate_seasons(
+    n_seasons: int = 1,
+    schedule: Optional[Schedule] = None,
+    seed: RandomSource = None,
+    workers: Optional[int] = None,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> SeasonProjection:
+    """Simulate ``n_seasons`` of ``schedule`` on ``workers`` processes.
+
+    ``workers=None`` uses every CPU; ``workers=1`` runs in this process.
+    The result is the same for every worker count; ``seed=None`` picks a
+    fresh seed, recorded in the result's ``seed``.
+
+    ``progress(done, total)`` is called after each finished task; an
+    exception raised from it cancels the tasks that have not started.
+    The default schedule is ``generate_schedule`` over every team in
+    teams.json with a roster.
+    """
+    if n_seasons < 1:
+        raise ValueError("n_seasons must be at least 1")
+    if schedule is None:
+        schedule = default_schedule()
+    workers = resolve_workers(workers)
+    streams = as_streams(seed)
+    profiles = tuple(get_team_profile(name) for name in schedule.teams)
+    n_teams = len(profiles)
+    n_tasks = 1 if workers == 1 else workers * TASKS_PER_WORKER
+    if progress is not None:
+        n_tasks = max(n_tasks, PROGRESS_TASKS)
+    tasks = _tasks(schedule, n_seasons, n_tasks, streams)
+
+    wins = np.zeros((n_seasons, n_teams), dtype=np.int64)
+    losses = np.zeros_like(wins)
+    points_for = np.zeros_like(wins)
+    points_against = np.zeros_like(wins)
+    stats = np.zeros((n_seasons, n_teams * ROTATION, len(SEASON_COLUMNS)), dtype=np.int64)
+
+    finished = 0
+
+    def merge(first, result):
+        nonlocal finished
+        w, l, pf, pa, st = result
+        k = len(w)
+        wins[first:first + k] += w
+        losses[first:first + k] += l
+        points_for[first:first + k] += pf
+        points_against[first:first + k] += pa
+        stats[first:first + k] += st
+        finished += 1
+        if progress is not None:
+            progress(finished, len(tasks))
+
+    if workers == 1:
+        for first, task in tasks:
+            merge(first, _run_task(task, profiles))
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(profiles,)) as pool:
+            futures = [(first, pool.submit(_run_task, task)) for first, task in tasks]
+            try:
+                for first, fut in futures:
+                    merge(first, fut.result())
+            except BaseException:
+                for _, fut in futures:
+                    fut.cancel()
+                raise
+
+    return SeasonProjection(
+        teams=schedule.teams,
+        wins=wins,
+        losses=losses,
+        points_for=points_for,
+        points_against=points_against,
+        players=tuple(p.players for p in profiles),
+        player_stats=stats.sum(axis=0).reshape(n_teams, ROTATION, len(SEASON_COLUMNS)),
+        season_player_stats=stats.reshape(n_seasons, n_teams, ROTATION, len(SEASON_COLUMNS)),
+        seed=streams.seed,
+    )
+
+
+def simulate_season(schedule: Optional[Schedule] = None, seed: RandomSource = None,
+                    workers: Optional[int] = None,
+                    progress: Optional[Callable[[int, int], None]] = None) -> SeasonResult:
+    """Simulate one season (split into game blocks across ``workers``)."""
+    return simulate_seasons(1, schedule, seed, workers, progress).season(0)
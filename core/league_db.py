@@ -0,0 +1,364 @@
+"""Optional SQLite storage backend for league data (stdlib ``sqlite3``).
+
+Teams, rosters, player ratings and bios live in one database file with
+indexes on player name, team and the key ratings. Reads are small
+parameterized queries (sqlite keeps them prepared in its statement cache), so
+a large custom league can be queried without loading it into memory, and a
+roster move is a single-row transactional ``UPDATE`` instead of rewriting
+rosters.json.
+
+When ``BGM_LEAGUE_DB`` points at a database, the shared repository
+(``core.repository``) reads teams, rosters, ratings, bios and free agents
+from it instead of the JSON files, so every loader, the OVR engine, the
+skill badges and the hot reloader see the same data; a ``.db`` / ``.sqlite``
+path passed to a loader selects it explicitly. Single-team rosters and
+single-player records are indexed queries. League-wide consumers (the
+ratings store behind OVRs and badges, full roster maps, bios, free agents)
+still load their whole table into memory, once per database revision: for
+those the database is the storage format rather than a query engine. ``import_json`` / ``export_json`` convert to and from the JSON files.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+from threading import RLock
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+import json
+import os
+import re
+import sqlite3
+
+from core.repository import (
+    DEFAULT_PLAYER_BIO_PATH,
+    DEFAULT_PLAYER_INFO_PATH,
+    DEFAULT_ROSTERS_PATH,
+    DEFAULT_TEAMS_PATH,
+)
+
+DB_SUFFIXES = (".db", ".sqlite", ".sqlite3")
+ENV_VAR = "BGM_LEAGUE_DB"
+
+# Rating columns that get their own index
+INDEXED_RATINGS = ("overall", "Three Point", "Defense IQ", "Rebound", "Pass")
+
+
+def is_database_path(path: Path | str | None) -> bool:
+    return path is not None and Path(path).suffix.lower() in DB_SUFFIXES
+
+
+def default_database_path() -> Optional[Path]:
+    """Database configured through ``BGM_LEAGUE_DB``, if any."""
+    value = os.environ.get(ENV_VAR)
+    return Path(value) if value else None
+
+
+def sql_column(rating: str) -> str:
+    """SQL-safe column name for a rating label ("Three Point" -> "r_three_point")."""
+    s = rating.lower().replace("%", "_pct")
+    return "r_" + re.sub(r"[^a-z0-9]+", "_", s).strip("_")
+
+
+def _rating_columns() -> Tuple[Tuple[str, Tuple[str, ...]], ...]:
+    from core.players.ratings import RATING_COLUMNS  # imported lazily so the loaders don't pull in numpy
+
+    return RATING_COLUMNS
+
+
+def _rating(value: Any) -> Optional[float]:
+    from core.players.ratings import to_rating
+
+    v = to_rating(value)
+    return None if v != v else v
+
+
+def _lookup(record: Dict[str, Any], path: Tuple[str, ...]) -> Any:
+    cur: Any = record
+    for key in path:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(key)
+    return cur
+
+
+def _schema() -> str:
+    ratings = ",\n    ".join(f"{sql_column(c)} REAL" for c, _ in _rating_columns())
+    indexes = "\n".join(
+        f"CREATE INDEX IF NOT EXISTS idx_players_{sql_column(c)} ON players({sql_column(c)});"
+        for c in INDEXED_RATINGS
+    )
+    return f"""
+CREATE TABLE IF NOT EXISTS teams (
+    name TEXT PRIMARY KEY,
+    tid INTEGER,
+    cid INTEGER,
+    did INTEGER,
+    region TEXT,
+    abbrev TEXT,
+    pop REAL,
+    stadium_capacity INTEGER,
+    ord INTEGER NOT NULL,
+    raw TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS roster_slots (
+    id INTEGER PRIMARY KEY,
+    team TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    player TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_roster_team ON roster_slots(team, slot);
+CREATE INDEX IF NOT EXISTS idx_roster_player ON roster_slots(player);
+CREATE TABLE IF NOT EXISTS players (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    team TEXT,
+    position TEXT,
+    {ratings},
+    info TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_players_name ON players(name);
+CREATE INDEX IF NOT EXISTS idx_players_team ON players(team);
+{indexes}
+CREATE TABLE IF NOT EXISTS bios (
+    id INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    name TEXT,
+    team TEXT,
+    bio TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bios_name ON bios(name);
+CREATE INDEX IF NOT EXISTS idx_bios_section ON bios(section, team);
+"""
+
+
+class LeagueDatabase:
+    """Connection wrapper exposing the same shapes as the JSON loaders."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        # Autocommit mode; writes go through transaction() explicitly
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False, cached_statements=256,
+                                     isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = RLock()
+        # Bumped by every committed write; part of the repository's cache key,
+        # since a file mtime may not move between two quick in-process writes
+        self.revision = 0
+        self._conn.executescript(_schema())
+
+    def close(self) -> None:
+        self._conn.close()
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        """``BEGIN IMMEDIATE`` ... ``COMMIT`` (rolled back on error)."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+            self.revision += 1
+
+    def _query(self, sql: str, params: Sequence[Any] = ()) -> List[sqlite3.Row]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    # -- reads (same shapes as the JSON loaders) ------------------------------
+    def teams(self) -> list:
+        from core.teams.loader import parse_teams
+
+        return parse_teams([json.loads(r["raw"]) for r in self._query("SELECT raw FROM teams ORDER BY ord")])
+
+    def rosters(self) -> Dict[str, List[str]]:
+        out: Dict[str, List[str]] = {}
+        for r in self._query("SELECT team, player FROM roster_slots ORDER BY team, slot"):
+            out.setdefault(r["team"], []).append(r["player"])
+        return out
+
+    def roster(self, team: str) -> List[str]:
+        """One team's roster through the (team, slot) index."""
+        return [r["player"] for r in self._query(
+            "SELECT player FROM roster_slots WHERE team = ? ORDER BY slot", (team,))]
+
+    def team_of(self, player: str) -> Optional[str]:
+        rows = self._query("SELECT team FROM roster_slots WHERE player = ? LIMIT 1", (player,))
+        return rows[0]["team"] if rows else None
+
+    def player(self, name: str) -> Optional[Dict[str, Any]]:
+        rows = self._query("SELECT info FROM players WHERE name = ? ORDER BY id DESC LIMIT 1", (name,))
+        return json.loads(rows[0]["info"]) if rows else None
+
+    def players(self) -> List[Dict[str, Any]]:
+        """Every player record, in import order."""
+        return [json.loads(r["info"]) for r in self._query("SELECT info FROM players ORDER BY id")]
+
+    def bio_sections(self) -> Dict[str, List[Dict[str, Any]]]:
+        """The bios as ``section -> records``, like player_bio.json."""
+        sections: Dict[str, List[Dict[str, Any]]] = {}
+        for r in self._query("SELECT section, bio FROM bios ORDER BY id"):
+            sections.setdefault(r["section"], []).append(json.loads(r["bio"]))
+        return sections
+
+    def bio(self, name: str) -> Optional[Dict[str, Any]]:
+        rows = self._query(
+            "SELECT bio FROM bios WHERE name = ? AND section = 'players' ORDER BY id DESC LIMIT 1", (name,))
+        return json.loads(rows[0]["bio"]) if rows else None
+
+    def free_agents(self) -> List[str]:
+        return [r["name"] for r in self._query(
+            "SELECT DISTINCT name FROM bios WHERE (section = 'free_agents' OR team = '?') "
+            "AND name IS NOT NULL AND name NOT IN ('', '?') ORDER BY name")]
+
+    def players_where(self, rating: str, min_value: float | None = None, max_value: float | None = None,
+                      limit: int | None = None) -> List[Tuple[str, float]]:
+        """``(name, value)`` for players with ``rating`` in range, best first (index-backed)."""
+        col = sql_column(rating)
+        if col not in {sql_column(c) for c, _ in _rating_columns()}:
+            raise KeyError(f"unknown rating column: {rating!r}")
+        sql = f"SELECT name, {col} AS v FROM players WHERE {col} IS NOT NULL"
+        params: List[Any] = []
+        if min_value is not None:
+            sql += f" AND {col} >= ?"
+            params.append(min_value)
+        if max_value is not None:
+            sql += f" AND {col} <= ?"
+            params.append(max_value)
+        sql += f" ORDER BY {col} DESC"
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(int(limit))
+        return [(r["name"], r["v"]) for r in self._query(sql, params)]
+
+    # -- writes ----------------------------------------------------------------
+    def move_player(self, player: str, to_team: str) -> None:
+        """Move ``player`` to the end of ``to_team``'s roster in one row update."""
+        with self.transaction() as conn:
+            cur = conn.execute(
+                "UPDATE roster_slots SET team = ?, "
+                "slot = (SELECT COALESCE(MAX(slot), -1) + 1 FROM roster_slots WHERE team = ?) "
+                "WHERE player = ?",
+                (to_team, to_team, player),
+            )
+            if cur.rowcount == 0:
+                raise KeyError(f"{player!r} is not on any roster")
+
+    def release_player(self, player: str) -> None:
+        """Remove ``player`` from their roster."""
+        with self.transaction() as conn:
+            cur = conn.execute("DELETE FROM roster_slots WHERE player = ?", (player,))
+            if cur.rowcount == 0:
+                raise KeyError(f"{player!r} is not on any roster")
+
+    def sign_player(self, player: str, team: str) -> None:
+        """Append ``player`` to ``team`` (moving them if already rostered)."""
+        with self.transaction() as conn:
+            next_slot = "(SELECT COALESCE(MAX(slot), -1) + 1 FROM roster_slots WHERE team = ?)"
+            cur = conn.execute(f"UPDATE roster_slots SET team = ?, slot = {next_slot} WHERE player = ?",
+                               (team, team, player))
+            if cur.rowcount == 0:
+                conn.execute(f"INSERT INTO roster_slots (team, slot, player) VALUES (?, {next_slot}, ?)",
+                             (team, team, player))
+
+    # -- JSON import / export ----------------------------------------------------
+    def import_json(
+        self,
+        teams_path: Path = DEFAULT_TEAMS_PATH,
+        rosters_path: Path = DEFAULT_ROSTERS_PATH,
+        player_info_path: Path = DEFAULT_PLAYER_INFO_PATH,
+        player_bio_path: Path = DEFAULT_PLAYER_BIO_PATH,
+    ) -> None:
+        """Replace the database contents with the given JSON files (one transaction)."""
+
+        def read(p: Path) -> Any:
+            if not Path(p).exists():
+                return None
+            with open(p, "r", encoding="utf-8") as f:
+                return json.load(f)
+
+        teams = read(teams_path) or []
+        rosters = read(rosters_path) or {}
+        info = read(player_info_path) or []
+        bios = read(player_bio_path) or {}
+        if isinstance(bios, list):
+            bios = {"players": bios}
+
+        cols = _rating_columns()
+        rating_sql = ", ".join(sql_column(c) for c, _ in cols)
+        marks = ", ".join("?" for _ in cols)
+        with self.transaction() as conn:
+            for table in ("teams", "roster_slots", "players", "bios"):
+                conn.execute(f"DELETE FROM {table}")
+            from core.teams.loader import parse_teams
+
+            for ord_, item in enumerate(teams):
+                parsed = parse_teams([item])
+                if not parsed:
+                    continue
+                t = parsed[0]
+                conn.execute(
+                    "INSERT OR REPLACE INTO teams (name, tid, cid, did, region, abbrev, pop, stadium_capacity, ord, raw) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (t.name, t.tid, t.cid, t.did, t.region, t.abbrev, t.pop, t.stadiumCapacity, ord_,
+                     json.dumps(item, ensure_ascii=False)),
+                )
+            conn.executemany(
+                "INSERT INTO roster_slots (team, slot, player) VALUES (?, ?, ?)",
+                [(team, slot, str(name)) for team, names in rosters.items() for slot, name in enumerate(names or [])],
+            )
+            conn.executemany(
+                f"INSERT INTO players (name, team, position, {rating_sql}, info) VALUES (?, ?, ?, {marks}, ?)",
+                [
+                    (p["name"], p.get("team"), p.get("position"),
+                     *(_rating(_lookup(p, path)) for _, path in cols),
+                     json.dumps(p, ensure_ascii=False, separators=(",", ":")))
+                    for p in info if isinstance(p, dict) and "name" in p
+                ],
+            )
+            conn.executemany(
+                "INSERT INTO bios (section, name, team, bio) VALUES (?, ?, ?, ?)",
+                [
+                    (section, b.get("name"), b.get("team"), json.dumps(b, ensure_ascii=False, separators=(",", ":")))
+                    for section, items in bios.items() if isinstance(items, list)
+                    for b in items if isinstance(b, dict)
+                ],
+            )
+
+    def export_json(
+        self,
+        teams_path: Path | None = None,
+        rosters_path: Path | None = None,
+        player_info_path: Path | None = None,
+        player_bio_path: Path | None = None,
+    ) -> None:
+        """Write the requested JSON files in the app's existing formats."""
+
+        def write(p: Path, data: Any) -> None:
+            Path(p).parent.mkdir(parents=True, exist_ok=True)
+            with open(p, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
+        if teams_path:
+            write(teams_path, [json.loads(r["raw"]) for r in self._query("SELECT raw FROM teams ORDER BY ord")])
+        if rosters_path:
+            write(rosters_path, self.rosters())
+        if player_info_path:
+            write(player_info_path, self.players())
+        if player_bio_path:
+            write(player_bio_path, self.bio_sections())
+
+
+_DATABASES: Dict[str, LeagueDatabase] = {}
+_DB_LOCK = RLock()
+
+
+def open_database(path: Path | str) -> LeagueDatabase:
+    """Shared ``LeagueDatabase`` per file (created with the schema if missing)."""
+    key = str(Path(path).resolve())
+    with _DB_LOCK:
+        db = _DATABASES.get(key)
+        if db is None:
+            db = _DATABASES[key] = LeagueDatabase(Path(path))
+        return db
@@ -0,0 +1,11 @@
+"""Players package: bios, overalls, the columnar ratings store, skill badges and name search."""
+
+from .ratings import RatingsStore, get_ratings_store
+from .name_index import PlayerNameIndex, get_player_name_index, normalize_name
+from .skills import SKILL_DESCRIPTIONS, SkillClassifier, get_skill_classifier
+
+__all__ = [
+    "RatingsStore", "get_ratings_store",
+    "PlayerNameIndex", "get_player_name_index", "normalize_name",
+    "SKILL_DESCRIPTIONS", "SkillClassifier", "get_skill_classifier",
+]
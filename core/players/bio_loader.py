@@ -1,12 +1,171 @@
-import json
 from pathlib import Path
-from typing import Dict, Any
+from typing import Any, Dict, Iterator, Optional, Sequence, Tuple
+import json
+
+from core.repository import get_repository
+
+_WS = " \t\r\n"
+
+
+def _default_bio_path() -> Path:
+    return Path(__file__).resolve().parent / "player_bio.json"
+
 
 def load_player_bios(path: Path = None) -> Dict[str, Any]:
-    """Return a dict mapping player name to their bio/attributes."""
-    if path is None:
-        path = Path(__file__).resolve().parent / "player_bio.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    """Return a dict mapping player name to their bio/attributes.
+
+    The dict and its records are the caller's own copies. Read-only lookups
+    should use ``get_repository().player_bios()``, which is shared and
+    decodes records from the snapshot lazily.
+    """
     # The bios are under the 'players' key
-    return {p["name"]: p for p in data["players"] if "name" in p}
+    return {name: dict(bio) for name, bio in get_repository().player_bios(path).items()}
+
+
+class _JsonStream:
+    """Pull values out of a JSON text one at a time, reading it in chunks."""
+
+    def __init__(self, f, chunk_size: int):
+        self._f = f
+        self._chunk = chunk_size
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self._eof:
+            return False
+        more = self._f.read(self._chunk)
+        if not more:
+            self._eof = True
+            return False
+        self._buf = self._buf[self._pos:] + more
+        self._pos = 0
+        return True
+
+    def peek(self) -> str:
+        while True:
+            while self._pos < len(self._buf) and self._buf[self._pos] in _WS:
+                self._pos += 1
+            if self._pos < len(self._buf):
+                return self._buf[self._pos]
+            if not self._fill():
+                return ""
+
+    def take(self, expected: str) -> None:
+        ch = self.peek()
+        if ch != expected:
+            raise ValueError(f"expected {expected!r} in bio stream, found {ch!r}")
+        self._pos += 1
+
+    def value(self) -> Any:
+        self.peek()
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self._buf, self._pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number may continue past the end of the buffer
+            if end == len(self._buf) and self._fill():
+                continue
+            self._pos = end
+            return obj
+
+    def items(self) -> Iterator[Any]:
+        """Iterate the elements of the array starting at the cursor."""
+        self.take("[")
+        if self.peek() == "]":
+            self._pos += 1
+            return
+        while True:
+            yield self.value()
+            if self.peek() == ",":
+                self._pos += 1
+                continue
+            self.take("]")
+            return
+
+
+def iter_player_bios(
+    path: Optional[Path] = None,
+    sections: Optional[Sequence[str]] = ("players", "free_agents"),
+    fields: Optional[Sequence[str]] = None,
+    chunk_size: int = 64 * 1024,
+) -> Iterator[Tuple[str, Dict[str, Any]]]:
+    """Stream ``(section, record)`` pairs from player_bio.json.
+
+    The file is read ``chunk_size`` characters at a time and decoded one
+    record at a time, so at most one full record is alive at once. With
+    ``fields`` each record is projected to just those keys before it is
+    yielded. Sections not in ``sections`` are skipped record by record. A file
+    that is a bare list is treated as the ``players`` section.
+    """
+    p = Path(path) if path else _default_bio_path()
+    with p.open("r", encoding="utf-8") as f:
+        stream = _JsonStream(f, chunk_size)
+        first = stream.peek()
+        if first == "[":
+            groups = iter(["players"])
+        elif first == "{":
+            stream.take("{")
+            groups = _object_sections(stream)
+        else:
+            return
+        for section in groups:
+            wanted = sections is None or section in sections
+            if stream.peek() != "[":
+                stream.value()  # non-list member, nothing to stream
+                continue
+            for rec in stream.items():
+                if not wanted or not isinstance(rec, dict):
+                    continue
+                if fields is not None:
+                    rec = {k: rec[k] for k in fields if k in rec}
+                yield section, rec
+
+
+def _object_sections(stream: _JsonStream) -> Iterator[str]:
+    """Walk the members of the top-level object, leaving the cursor on each value."""
+    if stream.peek() == "}":
+        return
+    while True:
+        key = stream.value()
+        stream.take(":")
+        yield str(key)
+        if stream.peek() == ",":
+            stream.take(",")
+            continue
+        stream.take("}")
+        return
+
+
+def free_agent_names(path: Optional[Path] = None) -> Tuple[str, ...]:
+    """Sorted names of all free agents (``free_agents`` section or team ``'?'``).
+
+    Unlike the original Free Agents view, which only looked for team ``'?'``
+    in the ``players`` section, this includes the ``free_agents`` section.
+    Names are sorted as before.
+
+    Built from a streaming pass that keeps only ``name``/``team`` per record
+    (or one query against the league database), then cached until the
+    source changes.
+    """
+    repo = get_repository()
+    p = repo.source_path(path, _default_bio_path())
+
+    def build(src: Path) -> Tuple[str, ...]:
+        from core.league_db import is_database_path, open_database
+
+        if is_database_path(src):
+            return tuple(open_database(src).free_agents())
+        names = {
+            rec["name"]
+            for section, rec in iter_player_bios(src, sections=None, fields=("name", "team"))
+            if rec.get("name") not in (None, "", "?") and (section == "free_agents" or rec.get("team") == "?")
+        }
+        return tuple(sorted(names))
+
+    return repo.cached("free_agent_names", p, build, missing=())
@@ -0,0 +1,135 @@
+"""Player name index: exact, prefix and typo-tolerant lookup.
+
+- exact: hash lookup on the stored name, then on a normalized key so that
+  spelling variants such as "C.J. McCollum" / "CJ McCollum" or accented
+  names resolve to the same player,
+- prefix: bisect over a sorted array of every word-start of every
+  normalized name ("mcc" finds "C.J. McCollum"),
+- fuzzy: character-trigram index scored by Dice similarity.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+import re
+import unicodedata
+
+from core.repository import get_repository
+
+_PUNCT = re.compile(r"[.'`’]")
+_SEPARATORS = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse separators to one space."""
+    s = unicodedata.normalize("NFKD", str(name))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch)).lower()
+    s = _PUNCT.sub("", s)
+    return _SEPARATORS.sub(" ", s).strip()
+
+
+def _trigrams(key: str) -> set:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class PlayerNameIndex:
+    """Read-only search index over a collection of player names."""
+
+    def __init__(self, names: Iterable[str]):
+        self.names: Tuple[str, ...] = tuple(dict.fromkeys(n for n in names if n))
+        self._exact = {n: n for n in self.names}
+        self._normalized: Dict[str, List[str]] = defaultdict(list)
+        prefixes: List[Tuple[str, int]] = []
+        self._grams: Dict[str, List[int]] = defaultdict(list)
+        self._gram_counts: List[int] = []
+        for i, name in enumerate(self.names):
+            key = normalize_name(name)
+            self._normalized[key].append(name)
+            # Every word start, so "mcc" and "cj mcc" both hit "C.J. McCollum"
+            words = key.split(" ")
+            for w in range(len(words)):
+                prefixes.append((" ".join(words[w:]), i))
+            grams = _trigrams(key)
+            self._gram_counts.append(len(grams))
+            for g in grams:
+                self._grams[g].append(i)
+        prefixes.sort()
+        self._prefix_keys = [k for k, _ in prefixes]
+        self._prefix_ids = [i for _, i in prefixes]
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._exact
+
+    def get(self, name: str) -> Optional[str]:
+        """Canonical name for ``name`` (exact, then normalized match), or None."""
+        hit = self._exact.get(name)
+        if hit is not None:
+            return hit
+        same = self._normalized.get(normalize_name(name))
+        return same[0] if same else None
+
+    def prefix(self, text: str, limit: int = 20) -> List[str]:
+        """Names with a word starting with ``text`` (normalized), in alphabetical key order."""
+        key = normalize_name(text)
+        if not key:
+            return []
+        out: List[str] = []
+        seen = set()
+        i = bisect_left(self._prefix_keys, key)
+        while i < len(self._prefix_keys) and self._prefix_keys[i].startswith(key):
+            name = self.names[self._prefix_ids[i]]
+            if name not in seen:
+                seen.add(name)
+                out.append(name)
+                if len(out) >= limit:
+                    break
+            i += 1
+        return out
+
+    def fuzzy(self, text: str, limit: int = 10, min_score: float = 0.4) -> List[Tuple[str, float]]:
+        """Best ``(name, score)`` matches for a possibly misspelled ``text``."""
+        key = normalize_name(text)
+        if not key:
+            return []
+        grams = _trigrams(key)
+        shared: Dict[int, int] = defaultdict(int)
+        for g in grams:
+            for i in self._grams.get(g, ()):
+                shared[i] += 1
+        scored = []
+        for i, n in shared.items():
+            score = 2.0 * n / (len(grams) + self._gram_counts[i])
+            if score >= min_score:
+                scored.append((score, self.names[i]))
+        scored.sort(key=lambda t: (-t[0], t[1]))
+        return [(name, round(score, 3)) for score, name in scored[:limit]]
+
+    def search(self, text: str, limit: int = 20) -> List[str]:
+        """Exact/normalized match first, then prefix hits, then fuzzy matches."""
+        out: List[str] = []
+        exact = self.get(text)
+        if exact:
+            out.append(exact)
+        for name in self.prefix(text, limit):
+            if name not in out:
+                out.append(name)
+        if len(out) < limit:
+            for name, _ in self.fuzzy(text, limit):
+                if name not in out:
+                    out.append(name)
+        return out[:limit]
+
+
+def get_player_name_index(path: Path | None = None) -> PlayerNameIndex:
+    """Shared index over player_info.json names, rebuilt only when the file changes."""
+    repo = get_repository()
+    p = repo.source_path(path, repo.player_info_path)
+    return repo.cached("name_index", p, lambda _: PlayerNameIndex(repo.player_info_by_name(p)),
+                       missing=PlayerNameIndex(()))
@@ -1,11 +1,13 @@
-import json
 from pathlib import Path
 from typing import Dict
 
+import numpy as np
+
+from core.players.ratings import get_ratings_store
+
 def load_player_overalls(path: Path = None) -> Dict[str, float]:
     """Return a dict mapping player name to overall rating."""
-    if path is None:
-        path = Path(__file__).resolve().parent.parent / "teams" / "data" / "player_info.json"
-    with open(path, "r", encoding="utf-8") as f:
-        data = json.load(f)
-    return {p["name"]: p["overall"] for p in data if "overall" in p}
+    # Read from the rating column; no player record is decoded
+    store = get_ratings_store(path)
+    ovr = store.column("overall")
+    return {name: float(ovr[i]) for name, i in store.index.items() if not np.isnan(ovr[i])}
@@ -0,0 +1,232 @@
+"""Columnar, array-backed view of player_info.json.
+
+Every numeric rating is stored in one contiguous float64 column (``NaN`` for
+missing or ``"?"`` values) with a ``name -> row`` index, so league-wide
+queries are vectorized NumPy operations instead of nested-dict walks.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.repository import get_repository
+
+# Column name -> location in a player_info.json record
+RATING_COLUMNS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("overall", ("overall",)),
+    ("potential", ("potential",)),
+    ("Height", ("physical", "Height")),
+    ("Weight", ("physical", "Weight")),
+    ("Strength", ("physical", "Strength")),
+    ("Speed", ("physical", "Speed")),
+    ("Jump", ("physical", "Jump")),
+    ("Endurance", ("physical", "Endurance")),
+    ("Inside", ("shooting", "Inside")),
+    ("Dunk", ("shooting", "Dunk")),
+    ("Free Throw", ("shooting", "Free Throw")),
+    ("Field Goal", ("shooting", "Field Goal")),
+    ("Three Point", ("shooting", "Three Point")),
+    ("Defense IQ", ("skill", "Defense IQ")),
+    ("Offense IQ", ("skill", "Offense IQ")),
+    ("Dribble", ("skill", "Dribble")),
+    ("Pass", ("skill", "Pass")),
+    ("Rebound", ("skill", "Rebound")),
+    ("G", ("summary", "G")),
+    ("MP", ("summary", "MP")),
+    ("PTS", ("summary", "PTS")),
+    ("TRB", ("summary", "TRB")),
+    ("AST", ("summary", "AST")),
+    ("FG%", ("summary", "FG%")),
+    ("3P%", ("summary", "3P%")),
+    ("FT%", ("summary", "FT%")),
+    ("TS%", ("summary", "TS%")),
+    ("PER", ("summary", "PER")),
+    ("WS", ("summary", "WS")),
+)
+
+COLUMN_NAMES: Tuple[str, ...] = tuple(name for name, _ in RATING_COLUMNS)
+
+
+def to_rating(value: Any) -> float:
+    """Coerce a raw rating to float; ``"?"``, blanks and junk become ``NaN``.
+
+    Strings such as ``"65 (+1)"`` keep their leading number.
+    """
+    if isinstance(value, bool):
+        return float("nan")
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        head = value.strip().split(" ", 1)[0]
+        try:
+            return float(head)
+        except ValueError:
+            return float("nan")
+    return float("nan")
+
+
+def _lookup(record: Mapping[str, Any], path: Tuple[str, ...]) -> Any:
+    cur: Any = record
+    for key in path:
+        if not isinstance(cur, Mapping):
+            return None
+        cur = cur.get(key)
+    return cur
+
+
+class RatingsStore:
+    """Ratings for every player as contiguous columns.
+
+    ``data`` has shape ``(len(columns), len(names))`` in C order, so each
+    column is one contiguous float64 run. Arrays handed out are read-only.
+    """
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        data: np.ndarray,
+        columns: Sequence[str] = COLUMN_NAMES,
+        teams: Sequence[str] | None = None,
+        positions: Sequence[str] | None = None,
+    ):
+        data = np.ascontiguousarray(data, dtype=np.float64)
+        if data.shape != (len(columns), len(names)):
+            raise ValueError(f"data shape {data.shape} does not match {len(columns)} columns x {len(names)} rows")
+        data.setflags(write=False)
+        self.names: Tuple[str, ...] = tuple(names)
+        self.columns: Tuple[str, ...] = tuple(columns)
+        self.data = data
+        self.teams: Tuple[str, ...] = tuple(teams) if teams is not None else ("",) * len(self.names)
+        self.positions: Tuple[str, ...] = tuple(positions) if positions is not None else ("",) * len(self.names)
+        # Later duplicates win, matching a plain {name: record} dict
+        self.index: Dict[str, int] = {n: i for i, n in enumerate(self.names)}
+        self._col_index: Dict[str, int] = {c: i for i, c in enumerate(self.columns)}
+
+    @classmethod
+    def from_records(cls, records: Iterable[Mapping[str, Any]]) -> "RatingsStore":
+        records = [r for r in records if isinstance(r, Mapping) and "name" in r]
+        data = np.empty((len(RATING_COLUMNS), len(records)), dtype=np.float64)
+        for c, (_, path) in enumerate(RATING_COLUMNS):
+            data[c] = [to_rating(_lookup(r, path)) for r in records]
+        return cls(
+            [str(r["name"]) for r in records],
+            data,
+            COLUMN_NAMES,
+            teams=[str(r.get("team") or "") for r in records],
+            positions=[str(r.get("position") or "") for r in records],
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self.index
+
+    def column(self, name: str) -> np.ndarray:
+        """Return the (read-only) array for rating ``name``."""
+        try:
+            return self.data[self._col_index[name]]
+        except KeyError:
+            raise KeyError(f"unknown rating column: {name!r}") from None
+
+    def rows(self, names: Iterable[str]) -> np.ndarray:
+        """Row numbers for ``names``; ``-1`` for unknown players."""
+        get = self.index.get
+        return np.fromiter((get(n, -1) for n in names), dtype=np.intp)
+
+    def value(self, name: str, column: str) -> Optional[float]:
+        i = self.index.get(name)
+        if i is None:
+            return None
+        v = self.data[self._col_index[column], i]
+        return None if np.isnan(v) else float(v)
+
+    def row(self, name: str) -> Optional[Dict[str, Optional[float]]]:
+        i = self.index.get(name)
+        if i is None:
+            return None
+        return {c: (None if np.isnan(v) else float(v)) for c, v in zip(self.columns, self.data[:, i])}
+
+    def mask(self, column: str, min_value: float | None = None, max_value: float | None = None) -> np.ndarray:
+        """Boolean row mask for ``min_value <= column <= max_value`` (NaN never matches)."""
+        col = self.column(column)
+        m = ~np.isnan(col)
+        if min_value is not None:
+            m &= col >= min_value
+        if max_value is not None:
+            m &= col <= max_value
+        return m
+
+    def names_where(self, column: str, min_value: float | None = None, max_value: float | None = None) -> List[str]:
+        """Names of all players whose ``column`` lies in the given range."""
+        return [self.names[i] for i in np.flatnonzero(self.mask(column, min_value, max_value))]
+
+    def group_rows(self, groups: Mapping[str, Sequence[str]]) -> Tuple[List[str], np.ndarray, np.ndarray]:
+        """Flatten ``group -> player names`` into ``(keys, group ids, rows)``.
+
+        Players unknown to the store are dropped.
+        """
+        keys = list(groups)
+        sizes = [len(groups[k]) for k in keys]
+        gids = np.repeat(np.arange(len(keys), dtype=np.intp), sizes)
+        rows = self.rows(n for k in keys for n in groups[k])
+        known = rows >= 0
+        return keys, gids[known], rows[known]
+
+    def top_k_mean(self, groups: Mapping[str, Sequence[str]], column: str = "overall", k: int = 8) -> Dict[str, float]:
+        """Mean of the ``k`` best ``column`` values in every group (0.0 if none).
+
+        One lexsort over all members of all groups; no per-group Python loop.
+        """
+        keys, gids, rows = self.group_rows(groups)
+        vals = self.column(column)[rows]
+        ok = ~np.isnan(vals)
+        gids, vals = gids[ok], vals[ok]
+        means = _grouped_top_k_mean(gids, vals, len(keys), k)
+        return {key: float(m) for key, m in zip(keys, means)}
+
+
+def _grouped_top_k_mean(gids: np.ndarray, vals: np.ndarray, n_groups: int, k: int) -> np.ndarray:
+    """Vectorized per-group mean of the top ``k`` ``vals``; empty groups give 0."""
+    if gids.size == 0:
+        return np.zeros(n_groups)
+    order = np.lexsort((-vals, gids))
+    g_sorted = gids[order]
+    # rank within group = position - first position of that group
+    starts = np.searchsorted(g_sorted, g_sorted, side="left")
+    keep = (np.arange(g_sorted.size) - starts) < k
+    sums = np.bincount(g_sorted[keep], weights=vals[order][keep], minlength=n_groups)
+    counts = np.bincount(g_sorted[keep], minlength=n_groups)
+    out = np.zeros(n_groups)
+    np.divide(sums, counts, out=out, where=counts > 0)
+    return out
+
+
+def get_ratings_store(path: Path | None = None) -> RatingsStore:
+    """Return the shared store for player_info.json, rebuilt only when the file changes.
+
+    When a fresh snapshot exists the columns are read straight from the mapped
+    file without decoding a single record.
+    """
+    repo = get_repository()
+    p = repo.source_path(path, repo.player_info_path)
+
+    def build(_: Path) -> RatingsStore:
+        snap = repo.snapshot(p)
+        if snap is None or snap.column_names != COLUMN_NAMES:
+            return RatingsStore.from_records(repo.player_info(p))
+        names = snap.strings("name")
+        data = snap.columns()
+        teams, positions = snap.strings("team"), snap.strings("position")
+        if not all(names):
+            keep = [i for i, n in enumerate(names) if n]
+            names = [names[i] for i in keep]
+            teams = [teams[i] for i in keep]
+            positions = [positions[i] for i in keep]
+            data = data[:, keep]
+        return RatingsStore(names, data, COLUMN_NAMES, teams=teams, positions=positions)
+
+    return repo.cached("ratings_store", p, build, missing=RatingsStore.from_records(()))
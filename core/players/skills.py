@@ -0,0 +1,128 @@
+"""Skill-symbol classifier (3, A, B, Ps, R, Di/Dp, Po, V) for the whole league.
+
+Each badge rule is a boolean mask over the rating columns, evaluated once for
+every player. The masks are packed into one small integer code per player,
+and each distinct code maps to its symbol tuple (at most 2**9 of them), so
+looking up a player's badges is two dictionary hits.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from core.players.ratings import RatingsStore, get_ratings_store
+from core.repository import get_repository
+
+SKILL_DESCRIPTIONS: Dict[str, str] = {
+    "3": "Three Point Shooter",
+    "A": "Athlete",
+    "B": "Ball Handler",
+    "Di": "Interior Defender",
+    "Dp": "Perimeter Defender",
+    "Po": "Post Scorer",
+    "Ps": "Passer",
+    "R": "Rebounder",
+    "V": "Volume Scorer",
+}
+
+# Display order; "3" is shown first, the rest in rule order
+SYMBOL_ORDER: Tuple[str, ...] = ("3", "A", "B", "Ps", "R", "Di", "Dp", "Po", "V")
+_BIT = {s: 1 << i for i, s in enumerate(SYMBOL_ORDER)}
+
+
+@lru_cache(maxsize=None)
+def _symbols_for_code(code: int) -> Tuple[str, ...]:
+    return tuple(s for s in SYMBOL_ORDER if code & _BIT[s])
+
+
+def _fmt(v: float) -> str:
+    if np.isnan(v):
+        return ""
+    return str(int(v)) if float(v).is_integer() else str(float(v))
+
+
+class SkillClassifier:
+    """Badge symbols for every player in a ``RatingsStore``, computed in one pass."""
+
+    def __init__(self, store: RatingsStore):
+        self.store = store
+        c = store.column
+        with np.errstate(invalid="ignore"):
+            center = np.array(["C" in p.upper() for p in store.positions], dtype=bool)
+            diq = c("Defense IQ") >= 65
+            masks = {
+                "3": c("Three Point") >= 60,
+                "A": (c("Speed") >= 70) | (c("Jump") >= 70) | (c("Strength") >= 75),
+                "B": c("Dribble") >= 65,
+                "Ps": c("Pass") >= 65,
+                "R": c("Rebound") >= 70,
+                "Di": diq & center,
+                "Dp": diq & ~center,
+                "Po": (c("Inside") >= 70) | (c("Field Goal") >= 68),
+                "V": (c("overall") >= 75) | (c("PTS") >= 18),
+            }
+        codes = np.zeros(len(store), dtype=np.uint16)
+        for sym, m in masks.items():
+            codes |= m.astype(np.uint16) * np.uint16(_BIT[sym])
+        codes.setflags(write=False)
+        self.codes = codes
+        self._tooltips: Dict[str, str] = {}
+
+    def symbols(self, name: str) -> Tuple[str, ...]:
+        """Badge symbols for ``name`` (empty for unknown players)."""
+        i = self.store.index.get(name)
+        return () if i is None else _symbols_for_code(int(self.codes[i]))
+
+    def players_with(self, symbol: str) -> List[str]:
+        """Names of every player carrying ``symbol``."""
+        rows = np.flatnonzero(self.codes & _BIT[symbol])
+        return [self.store.names[i] for i in rows]
+
+    def team_symbols(self, roster: Iterable[str], sample: int = 5) -> Tuple[str, ...]:
+        """Deduplicated symbols of the first ``sample`` roster entries."""
+        out: List[str] = []
+        for name in list(roster)[:sample]:
+            for s in self.symbols(name):
+                if s not in out:
+                    out.append(s)
+        # "3" always leads, mirroring the per-player ordering
+        if "3" in out:
+            out.remove("3")
+            out.insert(0, "3")
+        return tuple(out)
+
+    def tooltip(self, name: str) -> str:
+        """Multi-line ``symbol (description) : value`` text, built on first request."""
+        tip = self._tooltips.get(name)
+        if tip is not None:
+            return tip
+        parts = []
+        for s in self.symbols(name):
+            if s == "3":
+                value = _fmt(self._raw(name, "Three Point"))
+            elif s == "A":
+                spd, jmp, stre = (_fmt(self._raw(name, c)) for c in ("Speed", "Jump", "Strength"))
+                value = f"Spd:{spd} Jmp:{jmp} Str:{stre}"
+            else:
+                col = {"B": "Dribble", "Ps": "Pass", "R": "Rebound", "Di": "Defense IQ",
+                       "Dp": "Defense IQ", "Po": "Inside", "V": "overall"}[s]
+                value = _fmt(self._raw(name, col))
+            parts.append(f"{s} ({SKILL_DESCRIPTIONS.get(s)}) : {value}")
+        tip = self._tooltips[name] = "\n".join(parts)
+        return tip
+
+    def _raw(self, name: str, column: str) -> float:
+        val = self.store.value(name, column)
+        return float("nan") if val is None else val
+
+
+def get_skill_classifier(path: Optional[Path] = None) -> SkillClassifier:
+    """Shared classifier, recomputed only when player_info.json changes."""
+    repo = get_repository()
+    p = repo.source_path(path, repo.player_info_path)
+    return repo.cached("skill_classifier", p, lambda _: SkillClassifier(get_ratings_store(p)),
+                       missing=SkillClassifier(get_ratings_store(p)))
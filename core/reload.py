@@ -0,0 +1,114 @@
+"""Detect and describe league data changes without restarting the app.
+
+``LeagueReloader.check()`` compares each source file's ``(mtime, size)``
+with the last version it saw, re-reads only the files that changed (through
+the shared repository) and diffs old against new, reporting exactly which
+teams and players are affected.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import FrozenSet, Mapping, Optional, Set, Tuple
+
+import numpy as np
+
+from core.players.bio_loader import free_agent_names
+from core.players.ratings import RatingsStore, get_ratings_store
+from core.repository import LeagueRepository, get_repository
+
+
+@dataclass(frozen=True)
+class LeagueChanges:
+    # Which sources changed: any of "teams", "rosters", "player_info", "player_bio"
+    files: Tuple[str, ...] = ()
+    # Teams whose listing, roster or member players changed
+    teams: FrozenSet[str] = field(default_factory=frozenset)
+    # Players whose ratings, bio, roster spot or free-agent status changed
+    players: FrozenSet[str] = field(default_factory=frozenset)
+
+    def __bool__(self) -> bool:
+        return bool(self.files)
+
+
+def _diff_stores(old: RatingsStore, new: RatingsStore) -> Set[str]:
+    """Players added, removed or with any differing rating/team/position."""
+    changed = set(old.index) ^ set(new.index)
+    common = [n for n in new.index if n in old.index]
+    if common and old.columns == new.columns:
+        a = old.data[:, old.rows(common)]
+        b = new.data[:, new.rows(common)]
+        same = (a == b) | (np.isnan(a) & np.isnan(b))
+        moved = ~same.all(axis=0)
+        changed.update(n for n, m in zip(common, moved) if m)
+        changed.update(n for n in common
+                       if old.teams[old.index[n]] != new.teams[new.index[n]]
+                       or old.positions[old.index[n]] != new.positions[new.index[n]])
+    else:
+        changed.update(common)
+    return changed
+
+
+def _diff_mappings(old: Mapping, new: Mapping) -> Set[str]:
+    changed = set(old) ^ set(new)
+    changed.update(k for k in new if k in old and old[k] != new[k])
+    return changed
+
+
+class LeagueReloader:
+    """Remembers the last seen league state and reports what changed since."""
+
+    def __init__(self, repo: Optional[LeagueRepository] = None):
+        self.repo = repo or get_repository()
+        self._capture()
+
+    def _capture(self) -> None:
+        repo = self.repo
+        self._version = repo.version()
+        self._teams = repo.teams()
+        self._rosters = repo.rosters()
+        self._store = get_ratings_store(repo.source_path(None, repo.player_info_path))
+        self._bios = repo.player_bios()
+        self._free_agents = free_agent_names(repo.source_path(None, repo.player_bio_path))
+
+    def check(self) -> LeagueChanges:
+        """Re-read the files that changed since the last call and diff them."""
+        repo = self.repo
+        version = repo.version()
+        if version == self._version:
+            return LeagueChanges()
+        old_teams, old_rosters, old_store = self._teams, self._rosters, self._store
+        old_bios, old_fa = self._bios, self._free_agents
+        old_version = self._version
+        self._capture()
+
+        files = []
+        teams: Set[str] = set()
+        players: Set[str] = set()
+        labels = ("teams", "rosters", "player_info", "player_bio")
+        changed_files = {label for label, a, b in zip(labels, old_version, self._version) if a != b}
+
+        if "teams" in changed_files:
+            files.append("teams")
+            old_t = {t.name: t for t in old_teams or ()}
+            new_t = {t.name: t for t in self._teams or ()}
+            teams |= _diff_mappings(old_t, new_t)
+        if "rosters" in changed_files:
+            files.append("rosters")
+            for team in set(old_rosters) | set(self._rosters):
+                before, after = old_rosters.get(team, ()), self._rosters.get(team, ())
+                if before != after:
+                    teams.add(team)
+                    players |= set(before) ^ set(after)
+        if "player_info" in changed_files:
+            files.append("player_info")
+            players |= _diff_stores(old_store, self._store)
+        if "player_bio" in changed_files:
+            files.append("player_bio")
+            players |= _diff_mappings(old_bios, self._bios)
+            players |= set(old_fa) ^ set(self._free_agents)
+
+        if players:
+            # A team is affected when any current member changed (OVR, badges)
+            teams.update(t for t, roster in self._rosters.items() if players.intersection(roster))
+        return LeagueChanges(tuple(files), frozenset(teams), frozenset(players))
@@ -0,0 +1,286 @@
+"""Shared league data repository.
+
+Every JSON source (teams, rosters, player info, bios) is parsed at most once
+per on-disk version. Each access re-validates the file by ``(mtime, size)``
+and only re-parses when the file changed, so callers can ask for data freely
+(e.g. on every combo change) and get a dictionary lookup in the common case.
+
+With a SQLite database (``BGM_LEAGUE_DB``, see ``core.league_db``) the
+same accessors read every source from the database instead, validated by
+the database file's signature plus its write revision, so in-process roster
+moves are seen immediately. ``roster()`` and ``player()`` are single indexed
+queries there; the league-wide views (all rosters, all player records and
+bios, and what is derived from them) are still loaded whole, once per
+database revision.
+
+Values handed out are shared between callers and must be treated as
+read-only: top-level containers are tuples / ``MappingProxyType`` views (or
+lazy snapshot views, see ``core.snapshot``), the player records inside them
+are plain dicts that nobody should mutate.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from threading import RLock
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+import json
+import os
+
+_CORE_DIR = Path(__file__).resolve().parent
+
+DEFAULT_TEAMS_PATH = _CORE_DIR / "teams" / "data" / "teams.json"
+DEFAULT_ROSTERS_PATH = _CORE_DIR / "teams" / "data" / "rosters" / "rosters.json"
+DEFAULT_PLAYER_INFO_PATH = _CORE_DIR / "teams" / "data" / "player_info.json"
+DEFAULT_PLAYER_BIO_PATH = _CORE_DIR / "players" / "player_bio.json"
+
+# (mtime_ns, size) of a file (plus the write revision for a database), or
+# None when it does not exist
+Signature = Optional[Tuple[int, ...]]
+
+
+def file_signature(path: Path) -> Signature:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_json(path: Path) -> Any:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _is_database(path: Path) -> bool:
+    from core.league_db import is_database_path  # local import to avoid a cycle
+
+    return is_database_path(path)
+
+
+def _database(path: Path):
+    from core.league_db import open_database
+
+    return open_database(path)
+
+
+class LeagueRepository:
+    """Parses each league file once and hands out shared read-only views.
+
+    Derived views (e.g. the name -> record index) are cached under their own
+    key but share the freshness check of the file they were built from.
+    With ``database`` set, accessors called without a path read from that
+    database; an explicit ``.db``/``.sqlite`` path always selects it.
+    """
+
+    def __init__(
+        self,
+        teams_path: Path | None = None,
+        rosters_path: Path | None = None,
+        player_info_path: Path | None = None,
+        player_bio_path: Path | None = None,
+        database: Path | None = None,
+    ):
+        self.database = Path(database) if database else None
+        self.teams_path = Path(teams_path) if teams_path else DEFAULT_TEAMS_PATH
+        self.rosters_path = Path(rosters_path) if rosters_path else DEFAULT_ROSTERS_PATH
+        self.player_info_path = Path(player_info_path) if player_info_path else DEFAULT_PLAYER_INFO_PATH
+        self.player_bio_path = Path(player_bio_path) if player_bio_path else DEFAULT_PLAYER_BIO_PATH
+        # (key, resolved path) -> (signature, value)
+        self._cache: Dict[Tuple[str, str], Tuple[Signature, Any]] = {}
+        self._lock = RLock()
+
+    def source_path(self, path: Path | None, default: Path) -> Path:
+        """The source an accessor reads: ``path``, else the database, else ``default``."""
+        return Path(path) if path else (self.database or Path(default))
+
+    def signature(self, path: Path) -> Signature:
+        """Freshness key of a source; databases add their in-process write revision."""
+        sig = file_signature(path)
+        if sig is None or not _is_database(path):
+            return sig
+        return sig + (_database(path).revision,)
+
+    # -- generic cache -----------------------------------------------------
+    def cached(self, key: str, path: Path, build: Callable[[Path], Any], missing: Any = None) -> Any:
+        """Return ``build(path)`` memoized until the file's signature changes.
+
+        ``missing`` is returned (and cached) when the file does not exist.
+        """
+        path = Path(path)
+        sig = self.signature(path)
+        ck = (key, str(path))
+        with self._lock:
+            hit = self._cache.get(ck)
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+            value = build(path) if sig is not None else missing
+            self._cache[ck] = (sig, value)
+            return value
+
+    def invalidate(self, path: Path | None = None) -> None:
+        """Drop cached values for ``path`` (or everything)."""
+        with self._lock:
+            if path is None:
+                self._cache.clear()
+                return
+            p = str(Path(path))
+            for ck in [ck for ck in self._cache if ck[1] == p]:
+                del self._cache[ck]
+
+    def version(self) -> Tuple[Signature, ...]:
+        """Combined signature of all sources; changes whenever any file does.
+
+        With a database every source is reported as changed on any write.
+        """
+        if self.database is not None:
+            return (self.signature(self.database),) * 4
+        return tuple(
+            file_signature(p)
+            for p in (self.teams_path, self.rosters_path, self.player_info_path, self.player_bio_path)
+        )
+
+    # -- snapshots -----------------------------------------------------------
+    def snapshot(self, path: Path, columns: bool = True):
+        """Return the fresh mmap snapshot for ``path`` (rebuilt when stale), or None.
+
+        ``columns`` compiles the player rating columns into the snapshot.
+        Databases have no snapshot.
+        """
+        from core.snapshot import open_snapshot
+
+        if _is_database(path):
+            return None
+
+        if not columns:
+            return self.cached("snapshot:records", path, lambda p: open_snapshot(p))
+        from core.players.ratings import RATING_COLUMNS, to_rating  # local import to avoid a cycle
+
+        return self.cached(
+            "snapshot",
+            path,
+            lambda p: open_snapshot(p, RATING_COLUMNS, ("name", "team", "position"), to_rating),
+        )
+
+    # -- teams ---------------------------------------------------------------
+    def teams(self, path: Path | None = None) -> tuple:
+        """Return the parsed ``Team`` objects as a tuple."""
+        from core.teams.loader import parse_teams  # local import to avoid a cycle
+
+        def build(p: Path) -> tuple:
+            if _is_database(p):
+                return tuple(_database(p).teams())
+            snap = self.snapshot(p, columns=False)
+            return tuple(parse_teams(list(snap.records()) if snap is not None else _read_json(p)))
+
+        return self.cached("teams", self.source_path(path, self.teams_path), build, missing=None)
+
+    # -- rosters -------------------------------------------------------------
+    def rosters(self, path: Path | None = None) -> Mapping[str, Tuple[str, ...]]:
+        """Return a read-only ``team name -> player names`` mapping."""
+
+        def build(p: Path) -> Mapping[str, Tuple[str, ...]]:
+            data = _database(p).rosters() if _is_database(p) else _read_json(p)
+            if not isinstance(data, dict):
+                return MappingProxyType({})
+            return MappingProxyType({
+                str(team): tuple(str(x) for x in (names or []) if isinstance(x, (str, int)))
+                for team, names in data.items()
+            })
+
+        return self.cached("rosters", self.source_path(path, self.rosters_path), build, missing=MappingProxyType({}))
+
+    def roster(self, team: str, path: Path | None = None) -> Tuple[str, ...]:
+        """One team's player names; a single query against a database."""
+        p = self.source_path(path, self.rosters_path)
+        if _is_database(p):
+            return tuple(_database(p).roster(team))
+        return self.rosters(p).get(team, ())
+
+    # -- player info ---------------------------------------------------------
+    def player_info(self, path: Path | None = None) -> Sequence[Dict[str, Any]]:
+        """Return every player_info.json record, in file order.
+
+        Backed by the snapshot when available: records decode on first access.
+        """
+
+        def build(p: Path) -> Sequence[Dict[str, Any]]:
+            snap = self.snapshot(p)
+            if snap is not None:
+                return snap.records()
+            data = _database(p).players() if _is_database(p) else _read_json(p)
+            return tuple(r for r in data if isinstance(r, dict)) if isinstance(data, list) else ()
+
+        return self.cached("player_info", self.source_path(path, self.player_info_path), build, missing=())
+
+    def player_info_by_name(self, path: Path | None = None) -> Mapping[str, Dict[str, Any]]:
+        """Return a read-only ``name -> record`` index over player_info.json."""
+        p = self.source_path(path, self.player_info_path)
+
+        def build(_: Path) -> Mapping[str, Dict[str, Any]]:
+            snap = self.snapshot(p)
+            if snap is not None:
+                return snap.by_name()
+            return MappingProxyType({r["name"]: r for r in self.player_info(p) if "name" in r})
+
+        return self.cached("player_info_by_name", p, build, missing=MappingProxyType({}))
+
+    def player(self, name: str, path: Path | None = None) -> Optional[Dict[str, Any]]:
+        p = self.source_path(path, self.player_info_path)
+        if _is_database(p):
+            # Point query; doesn't load every record
+            return _database(p).player(name)
+        return self.player_info_by_name(p).get(name)
+
+    # -- bios ----------------------------------------------------------------
+    def player_bio_data(self, path: Path | None = None) -> Mapping[str, Sequence[Dict[str, Any]]]:
+        """Return the bio file as ``section -> records`` (``players``, ``free_agents``).
+
+        Older files that are a bare list are exposed as the ``players`` section.
+        """
+
+        def build(p: Path) -> Mapping[str, Sequence[Dict[str, Any]]]:
+            snap = self.snapshot(p)
+            if snap is not None:
+                return MappingProxyType({
+                    ("players" if k == "records" else k): snap.records(k) for k in snap.sections
+                })
+            data = _database(p).bio_sections() if _is_database(p) else _read_json(p)
+            if isinstance(data, list):
+                data = {"players": data}
+            if not isinstance(data, dict):
+                data = {}
+            return MappingProxyType({
+                k: tuple(r for r in v if isinstance(r, dict))
+                for k, v in data.items() if isinstance(v, list)
+            })
+
+        return self.cached("player_bio", self.source_path(path, self.player_bio_path), build, missing=MappingProxyType({}))
+
+    def player_bios(self, path: Path | None = None) -> Mapping[str, Dict[str, Any]]:
+        """Return a read-only ``name -> bio`` index over the ``players`` section."""
+        p = self.source_path(path, self.player_bio_path)
+
+        def build(_: Path) -> Mapping[str, Dict[str, Any]]:
+            snap = self.snapshot(p)
+            if snap is not None:
+                return snap.by_name("players" if "players" in snap.sections else "records")
+            return MappingProxyType({
+                r["name"]: r for r in self.player_bio_data(p).get("players", ()) if "name" in r
+            })
+
+        return self.cached("player_bios", p, build, missing=MappingProxyType({}))
+
+
+_REPOSITORY: LeagueRepository | None = None
+
+
+def get_repository() -> LeagueRepository:
+    """Return the process-wide repository over the default data files (or ``BGM_LEAGUE_DB``)."""
+    global _REPOSITORY
+    if _REPOSITORY is None:
+        from core.league_db import default_database_path
+
+        _REPOSITORY = LeagueRepository(database=default_database_path())
+    return _REPOSITORY
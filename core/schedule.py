@@ -0,0 +1,489 @@
+"""League schedules as flat arrays of (day, home, away) games.
+
+``generate_schedule`` builds an NBA-style schedule from the conference and
+division ids in teams.json in three constructive passes:
+
+1. game counts per pair of teams: a fixed number against division, then
+   conference, then league opponents, topped up to the season length with
+   one extra game against some opponents (Havel-Hakimi style, with edge
+   swaps as repair when the greedy choice paints itself into a corner);
+2. venues: half of each pairing at each arena, with the odd games oriented
+   along an Euler circuit so home and away games differ by at most one;
+3. days: one day at a time, the teams that are furthest behind are matched
+   first, subject to rest rules (no three games in three nights, a cap on
+   back-to-backs), followed by a repair pass that moves back-to-back games
+   to nearby open days.
+
+The result is deterministic for a given league, format and seed, and is
+memoized in-process; ``Schedule.save``/``Schedule.load`` persist it as JSON.
+"""
+
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+GAMES_PER_TEAM = 82
+
+
+@dataclass(frozen=True)
+class Schedule:
+    """Every game of a season; ``home``/``away`` index into ``teams``.
+
+    Games are ordered by ``day``; each team plays at most once per day.
+    """
+
+    teams: Tuple[str, ...]
+    day: np.ndarray
+    home: np.ndarray
+    away: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.day)
+
+    @property
+    def days(self) -> int:
+        return int(self.day.max()) + 1 if len(self.day) else 0
+
+    def games_per_team(self) -> np.ndarray:
+        n = len(self.teams)
+        return np.bincount(self.home, minlength=n) + np.bincount(self.away, minlength=n)
+
+    def home_games(self) -> np.ndarray:
+        return np.bincount(self.home, minlength=len(self.teams))
+
+    def matchups(self) -> Tuple[List[str], List[str]]:
+        """Home and away team names, one entry per game."""
+        return [self.teams[i] for i in self.home], [self.teams[i] for i in self.away]
+
+    def pair_counts(self) -> np.ndarray:
+        """Symmetric ``(teams, teams)`` matrix of games between each pair."""
+        n = len(self.teams)
+        counts = np.zeros((n, n), dtype=np.int32)
+        np.add.at(counts, (self.home, self.away), 1)
+        return counts + counts.T
+
+    def back_to_backs(self) -> np.ndarray:
+        """Games each team plays on the day after another game."""
+        n = len(self.teams)
+        out = np.zeros(n, dtype=np.int32)
+        days = np.concatenate([self.day, self.day])
+        teams = np.concatenate([self.home, self.away])
+        order = np.lexsort((days, teams))
+        days, teams = days[order], teams[order]
+        b2b = (teams[1:] == teams[:-1]) & (days[1:] - days[:-1] == 1)
+        np.add.at(out, teams[1:][b2b], 1)
+        return out
+
+    def to_dict(self) -> Dict[str, object]:
+        return {
+            "teams": list(self.teams),
+            "games": [[int(d), int(h), int(a)] for d, h, a in zip(self.day, self.home, self.away)],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "Schedule":
+        games = np.asarray(data.get("games") or [], dtype=np.int32).reshape(-1, 3)
+        order = np.argsort(games[:, 0], kind="stable")
+        games = games[order]
+        return cls(
+            teams=tuple(str(t) for t in data.get("teams") or ()),
+            day=games[:, 0].copy(),
+            home=games[:, 1].copy(),
+            away=games[:, 2].copy(),
+        )
+
+    def save(self, path: Path) -> None:
+        Path(path).write_text(json.dumps(self.to_dict(), separators=(",", ":")), encoding="utf-8")
+
+    @classmethod
+    def load(cls, path: Path) -> "Schedule":
+        return cls.from_dict(json.loads(Path(path).read_text(encoding="utf-8")))
+
+
+def round_robin_schedule(teams: Sequence[str], games_per_team: int = GAMES_PER_TEAM) -> Schedule:
+    """Repeated circle-method round robin, one round per day.
+
+    Venues alternate between repeat meetings of the same two teams. With an
+    odd number of teams one team sits out each round.
+    """
+    names = tuple(teams)
+    if len(names) < 2:
+        raise ValueError("a schedule needs at least two teams")
+    slots = list(range(len(names))) + ([-1] if len(names) % 2 else [])
+    n = len(slots)
+    home_count = [0] * len(names)
+    last_home = {}
+    days: List[int] = []
+    homes: List[int] = []
+    aways: List[int] = []
+    for rnd in range(games_per_team):
+        r = rnd % (n - 1)
+        # Rotate every slot but the first
+        order = [slots[0]] + slots[1:][-r:] + slots[1:][:-r] if r else list(slots)
+        for i in range(n // 2):
+            a, b = order[i], order[n - 1 - i]
+            if a < 0 or b < 0:
+                continue
+            pair = (min(a, b), max(a, b))
+            # Alternate venues between meetings; otherwise favor the team with fewer home games
+            if pair in last_home:
+                host = b if last_home[pair] == a else a
+            else:
+                host = a if home_count[a] <= home_count[b] else b
+            guest = b if host == a else a
+            last_home[pair] = host
+            home_count[host] += 1
+            days.append(rnd)
+            homes.append(host)
+            aways.append(guest)
+    return Schedule(
+        teams=names,
+        day=np.array(days, dtype=np.int32),
+        home=np.array(homes, dtype=np.int32),
+        away=np.array(aways, dtype=np.int32),
+    )
+
+
+# Relation of two teams, from closest to furthest
+DIVISION, CONFERENCE, LEAGUE = 2, 1, 0
+# Top-up games go to conference opponents first, as in the NBA
+FILL_ORDER = (CONFERENCE, LEAGUE, DIVISION)
+# Days a back-to-back game may be moved by the repair pass
+REPAIR_WINDOW = 3
+
+
+@dataclass(frozen=True)
+class ScheduleFormat:
+    """Shape of a generated season.
+
+    ``division_games``, ``conference_games`` and ``other_games`` are played
+    against every opponent of that kind before topping up to ``games``;
+    they are lowered automatically when a large league cannot fit them.
+    """
+
+    games: int = GAMES_PER_TEAM
+    division_games: int = 4
+    conference_games: int = 3
+    other_games: int = 2
+    days: Optional[int] = None              # season length, default 2 * games
+    max_back_to_backs: Optional[int] = None  # per team, default games // 5
+
+    @property
+    def season_days(self) -> int:
+        return self.days if self.days is not None else 2 * self.games
+
+    @property
+    def back_to_back_cap(self) -> int:
+        return self.max_back_to_backs if self.max_back_to_backs is not None else self.games // 5
+
+
+def _relations(teams: Sequence) -> np.ndarray:
+    """``(teams, teams)`` matrix of DIVISION/CONFERENCE/LEAGUE, -1 on the diagonal.
+
+    Teams without a ``cid`` share one conference; teams without a ``did``
+    have no division rivals.
+    """
+    conf = np.array([-1 if getattr(t, "cid", None) is None else t.cid for t in teams])
+    div = np.array([-1 - i if getattr(t, "did", None) is None else t.did for i, t in enumerate(teams)])
+    rel = np.where(conf[:, None] == conf[None, :], CONFERENCE, LEAGUE)
+    rel[div[:, None] == div[None, :]] = DIVISION
+    np.fill_diagonal(rel, -1)
+    return rel
+
+
+def _top_up(counts: np.ndarray, budget: np.ndarray, allowed: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Add at most one game per ``allowed`` pair until budgets run out.
+
+    Greedy Havel-Hakimi: the team with the most games still to place takes
+    partners with the most games to place. When a team is left without a
+    free partner, an added game ``(a, b)`` is swapped for ``(i, a)`` and
+    ``(i, b)`` (or ``(i, a)`` and ``(j, b)`` for two one-game leftovers).
+    Returns the budgets that could not be placed.
+    """
+    budget = budget.copy()
+    free = allowed.copy()
+    jitter = rng.random(len(budget))
+    added: List[Tuple[int, int]] = []
+    stuck = np.zeros(len(budget), dtype=bool)
+
+    def link(a, b, step):
+        counts[a, b] += step
+        counts[b, a] += step
+        budget[a] -= step
+        budget[b] -= step
+        free[a, b] = free[b, a] = step < 0
+
+    def swap(i) -> bool:
+        others = np.flatnonzero((budget > 0) & (np.arange(len(budget)) != i))
+        for a, b in added:
+            if i in (a, b):
+                continue
+            if budget[i] >= 2 and free[i, a] and free[i, b]:
+                pairs = ((i, a), (i, b))
+            else:
+                js = [j for j in others if j not in (a, b)]
+                j = next((j for j in js if free[i, a] and free[j, b]), None)
+                if j is not None:
+                    pairs = ((i, a), (j, b))
+                else:
+                    j = next((j for j in js if free[i, b] and free[j, a]), None)
+                    if j is None:
+                        continue
+                    pairs = ((i, b), (j, a))
+            added.remove((a, b))
+            link(a, b, -1)
+            for x, y in pairs:
+                link(x, y, 1)
+                added.append((x, y))
+            return True
+        return False
+
+    while True:
+        need = np.flatnonzero((budget > 0) & ~stuck)
+        if not len(need):
+            break
+        i = need[np.argmax(budget[need] + jitter[need])]
+        cand = np.flatnonzero(free[i] & (budget > 0))
+        if len(cand):
+            for j in cand[np.lexsort((jitter[cand], -budget[cand]))][:budget[i]]:
+                link(i, j, 1)
+                added.append((i, j))
+        elif not swap(i):
+            stuck[i] = True
+    return budget
+
+
+def _pair_counts(rel: np.ndarray, fmt: ScheduleFormat, rng: np.random.Generator) -> np.ndarray:
+    """Symmetric matrix of games between each pair, every row summing to ``fmt.games``."""
+    n = len(rel)
+    counts = np.zeros((n, n), dtype=np.int32)
+    budget = np.full(n, fmt.games, dtype=np.int64)
+    for kind, games in ((DIVISION, fmt.division_games), (CONFERENCE, fmt.conference_games), (LEAGUE, fmt.other_games)):
+        mask = rel == kind
+        opponents = mask.sum(axis=1)
+        has = opponents > 0
+        if not has.any():
+            continue
+        per = max(0, min(games, int((budget[has] // opponents[has]).min())))
+        counts[mask] = per
+        budget -= per * opponents
+    for kind in FILL_ORDER:
+        budget = _top_up(counts, budget, rel == kind, rng)
+    # Small leagues need several extra games per pair
+    while budget.any():
+        left = int(budget.sum())
+        budget = _top_up(counts, budget, rel >= 0, rng)
+        if budget.sum() == left:
+            raise ValueError(f"cannot give every team {fmt.games} games in a {n}-team league")
+    return counts
+
+
+def _venues(counts: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """``hosts[i, j]``: games ``i`` hosts ``j``, with home totals balanced to within one.
+
+    Each pair splits its games evenly; the odd games are oriented along
+    closed trails (Hierholzer) of the odd-pair graph, with a dummy vertex
+    joined to odd-degree teams so every trail can close.
+    """
+    n = len(counts)
+    hosts = counts // 2
+    edges = [tuple(int(v) for v in e) for e in np.argwhere(np.triu(counts % 2 == 1, 1))]
+    degree = np.bincount(np.array(edges, dtype=np.intp).ravel(), minlength=n) if edges else np.zeros(n, dtype=np.intp)
+    edges += [(int(v), n) for v in np.flatnonzero(degree % 2)]
+    adj: List[List[Tuple[int, int]]] = [[] for _ in range(n + 1)]
+    for e in rng.permutation(len(edges)):
+        a, b = edges[e]
+        adj[a].append((b, e))
+        adj[b].append((a, e))
+    used = np.zeros(len(edges), dtype=bool)
+    ptr = [0] * (n + 1)
+    for start in range(n + 1):
+        stack = [start]
+        while stack:
+            v = stack[-1]
+            while ptr[v] < len(adj[v]) and used[adj[v][ptr[v]][1]]:
+                ptr[v] += 1
+            if ptr[v] == len(adj[v]):
+                stack.pop()
+                continue
+            w, e = adj[v][ptr[v]]
+            used[e] = True
+            if v < n and w < n:
+                hosts[v, w] += 1
+            stack.append(w)
+    return hosts
+
+
+def _assign_days(hosts: np.ndarray, fmt: ScheduleFormat, rng: np.random.Generator) -> Tuple[List[int], List[int], List[int]]:
+    """Place every game on a day, the teams furthest behind pace first.
+
+    A team never plays three nights in a row, and takes a back-to-back
+    only while under the cap unless it must play every remaining day.
+    """
+    n = len(hosts)
+    hosts = hosts.copy()
+    pair_left = hosts + hosts.T
+    left = pair_left.sum(axis=1)
+    hosted = np.zeros(n)
+    played = np.zeros(n)
+    last = np.full(n, -3)
+    prev = np.full(n, -3)
+    b2b = np.zeros(n, dtype=np.int64)
+    cap = fmt.back_to_back_cap
+    remaining = int(left.sum()) // 2
+    days: List[int] = []
+    homes: List[int] = []
+    aways: List[int] = []
+    day = 0
+    while remaining:
+        days_left = max(fmt.season_days - day, 1)
+        urgency = left / days_left + rng.random(n) * 1e-3
+        yesterday = last == day - 1
+        ok = (left > 0) & ~(yesterday & (prev == day - 2)) & (~yesterday | (b2b < cap) | (urgency >= 1.0))
+        target = -(-remaining // days_left)
+        matched = np.zeros(n, dtype=bool)
+        count = 0
+        # Rested teams first, then by how far behind pace they are
+        for i in np.argsort(-(urgency - 0.5 * yesterday)):
+            if count >= target:
+                break
+            if matched[i] or not ok[i]:
+                continue
+            opp = ok & ~matched & (pair_left[i] > 0)
+            if not opp.any():
+                continue
+            j = int(np.argmax(np.where(opp, urgency - 0.5 * yesterday, -np.inf)))
+            if hosts[i, j] and hosts[j, i]:
+                h = i if hosted[i] - played[i] / 2 <= hosted[j] - played[j] / 2 else j
+            else:
+                h = i if hosts[i, j] else j
+            g = j if h == i else i
+            hosts[h, g] -= 1
+            pair_left[i, j] -= 1
+            pair_left[j, i] -= 1
+            for t in (i, j):
+                left[t] -= 1
+                played[t] += 1
+                b2b[t] += last[t] == day - 1
+                prev[t] = last[t]
+                last[t] = day
+            hosted[h] += 1
+            matched[i] = matched[j] = True
+            days.append(day)
+            homes.append(h)
+            aways.append(g)
+            count += 1
+            remaining -= 1
+        day += 1
+    return days, homes, aways
+
+
+def _repair_back_to_backs(days: np.ndarray, homes: np.ndarray, aways: np.ndarray, n: int) -> None:
+    """Move games that sit in a back-to-back to a nearby day where they do not."""
+    span = int(days.max()) + 1 if len(days) else 0
+    busy = np.zeros((n, span + 2 * REPAIR_WINDOW), dtype=bool)
+    pad = REPAIR_WINDOW
+    busy[homes, days + pad] = True
+    busy[aways, days + pad] = True
+
+    def cost(t, d):
+        return int(busy[t, d - 1]) + int(busy[t, d + 1])
+
+    def three_straight(t, d):
+        w = busy[t, d - 2:d + 3]
+        return (w[:3].all() or w[1:4].all() or w[2:].all())
+
+    for g in range(len(days)):
+        a, b, d = homes[g], aways[g], days[g] + pad
+        current = cost(a, d) + cost(b, d)
+        if not current:
+            continue
+        busy[a, d] = busy[b, d] = False
+        best = d
+        for step in range(1, REPAIR_WINDOW + 1):
+            for d2 in (d - step, d + step):
+                if d2 < pad or d2 >= span + pad or busy[a, d2] or busy[b, d2]:
+                    continue
+                if cost(a, d2) + cost(b, d2) < current:
+                    busy[a, d2] = busy[b, d2] = True
+                    if three_straight(a, d2) or three_straight(b, d2):
+                        busy[a, d2] = busy[b, d2] = False
+                        continue
+                    busy[a, d2] = busy[b, d2] = False
+                    best = d2
+                    break
+            if best != d:
+                break
+        busy[a, best] = busy[b, best] = True
+        days[g] = best - pad
+
+
+_SCHEDULE_CACHE: Dict[tuple, Schedule] = {}
+_SCHEDULE_CACHE_SIZE = 16
+
+
+def generate_schedule(teams: Optional[Sequence] = None, fmt: ScheduleFormat = ScheduleFormat(), seed: int = 0) -> Schedule:
+    """NBA-style schedule for ``teams`` (``Team`` objects or names; default teams.json).
+
+    Division, conference and other opponents are met ``fmt``'s number of
+    times, every team plays ``fmt.games`` games with home and away split to
+    within one, and back-to-backs stay under the cap. Results are memoized
+    per league, format and seed, so their arrays are read-only.
+    """
+    if teams is None:
+        from core.teams.loader import load_teams
+
+        teams = load_teams()
+    league = [t for t in teams]
+    names = tuple(t if isinstance(t, str) else t.name for t in league)
+    if len(names) < 2:
+        raise ValueError("a schedule needs at least two teams")
+    if len(set(names)) != len(names):
+        raise ValueError("team names must be unique")
+    if len(names) * fmt.games % 2:
+        raise ValueError(f"{len(names)} teams cannot each play {fmt.games} games")
+    key = (tuple((nm, getattr(t, "cid", None), getattr(t, "did", None)) for nm, t in zip(names, league)), fmt, seed)
+    hit = _SCHEDULE_CACHE.get(key)
+    if hit is not None:
+        return hit
+
+    rng = np.random.default_rng(seed)
+    counts = _pair_counts(_relations(league), fmt, rng)
+    days, homes, aways = (np.array(a, dtype=np.int32) for a in _assign_days(_venues(counts, rng), fmt, rng))
+    _repair_back_to_backs(days, homes, aways, len(names))
+    order = np.lexsort((homes, days))
+    schedule = Schedule(teams=names, day=days[order], home=homes[order], away=aways[order])
+    # The memoized schedule is shared by every caller
+    for a in (schedule.day, schedule.home, schedule.away):
+        a.setflags(write=False)
+
+    if len(_SCHEDULE_CACHE) >= _SCHEDULE_CACHE_SIZE:
+        _SCHEDULE_CACHE.clear()
+    _SCHEDULE_CACHE[key] = schedule
+    return schedule
+
+
+def check_schedule(schedule: Schedule, fmt: ScheduleFormat = ScheduleFormat()) -> List[str]:
+    """Rule violations in ``schedule`` (empty when it is valid for ``fmt``)."""
+    problems = []
+    n = len(schedule.teams)
+    games = schedule.games_per_team()
+    for i in np.flatnonzero(games != fmt.games):
+        problems.append(f"{schedule.teams[i]} plays {games[i]} games")
+    home = schedule.home_games()
+    for i in np.flatnonzero(np.abs(2 * home - games) > 1 + games % 2):
+        problems.append(f"{schedule.teams[i]} has {home[i]} home games out of {games[i]}")
+    busy = np.zeros((n, schedule.days + 2), dtype=np.int32)
+    np.add.at(busy, (schedule.home, schedule.day), 1)
+    np.add.at(busy, (schedule.away, schedule.day), 1)
+    for i, d in np.argwhere(busy > 1):
+        problems.append(f"{schedule.teams[i]} plays twice on day {d}")
+    three = (busy[:, :-2] > 0) & (busy[:, 1:-1] > 0) & (busy[:, 2:] > 0)
+    for i in np.flatnonzero(three.any(axis=1)):
+        problems.append(f"{schedule.teams[i]} plays three days in a row")
+    return problems
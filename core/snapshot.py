@@ -0,0 +1,361 @@
+"""Compiled, memory-mapped snapshots of the league JSON files.
+
+A snapshot is a binary image of one JSON source (a list of records, or an
+object whose values are lists of records, e.g. ``{"players": [...],
+"free_agents": [...]}``). It is written next to the source as
+``<name>.<key>.snap`` and opened with ``mmap``; nothing is decoded up front:
+
+- numeric columns are fixed-width float64 blocks read through
+  ``np.frombuffer`` (zero copy),
+- string fields (``name``, ``team``, ...) live in a string heap and are
+  decoded on first use,
+- every record is kept as compact JSON and only parsed when it is touched.
+
+File layout (little-endian)::
+
+    magic "BGMSNAP\\0" | u32 version | u32 meta length | meta (JSON)
+    then 8-byte aligned blocks, offsets relative to the first block:
+      record offsets (u64, n+1) | record heap
+      per string field: offsets (u64, n+1) | heap
+      columns (float64, n_columns x n, C order)
+
+The meta block records the source ``(mtime_ns, size)``; a snapshot whose
+signature no longer matches its source is stale and gets rebuilt. ``<key>``
+hashes that signature and the compiled fields, so a rebuild always writes a
+new file instead of replacing one that may still be mapped (Windows refuses
+to replace or delete a mapped file, and column arrays handed out keep the
+map alive). Superseded versions are deleted once nothing maps them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import mmap
+import os
+import struct
+import tempfile
+
+import numpy as np
+
+from core.repository import Signature, file_signature
+
+MAGIC = b"BGMSNAP\x00"
+VERSION = 1
+_HEADER = struct.Struct("<8sII")
+
+# Column name -> key path inside a record
+ColumnSpec = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+def snapshot_path(
+    source: Path,
+    columns: ColumnSpec = (),
+    strings: Tuple[str, ...] = ("name",),
+    signature: Signature = None,
+) -> Path:
+    """Versioned snapshot file for ``source`` at ``signature`` (default: its current one)."""
+    source = Path(source)
+    key = json.dumps([VERSION, signature or file_signature(source), columns, strings])
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=6).hexdigest()
+    return source.with_name(f"{source.stem}.{digest}.snap")
+
+
+def remove_stale_snapshots(source: Path, keep: Path | None = None) -> None:
+    """Delete the other snapshot versions of ``source``; mapped ones are left for next time."""
+    source = Path(source)
+    for p in source.parent.glob(f"{source.stem}.*snap"):
+        # "<stem>.<key>.snap", or "<stem>.snap" from before versioned names
+        key = p.name[len(source.stem):-len(".snap")]
+        if p == keep or not (key == "" or (len(key) == 13 and key[0] == ".")):
+            continue
+        try:
+            p.unlink()
+        except OSError:
+            pass
+
+
+def _align(n: int) -> int:
+    return (n + 7) & ~7
+
+
+def _lookup(record: Any, path: Tuple[str, ...]) -> Any:
+    cur = record
+    for key in path:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(key)
+    return cur
+
+
+def _to_float(value: Any) -> float:
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    return float("nan")
+
+
+def _sections_of(data: Any) -> List[Tuple[str, list]]:
+    if isinstance(data, list):
+        return [("records", data)]
+    if isinstance(data, dict):
+        return [(str(k), v) for k, v in data.items() if isinstance(v, list)]
+    return []
+
+
+def _heap(chunks: List[bytes]) -> Tuple[np.ndarray, bytes]:
+    offsets = np.zeros(len(chunks) + 1, dtype="<u8")
+    np.cumsum([len(c) for c in chunks], out=offsets[1:])
+    return offsets, b"".join(chunks)
+
+
+def build_snapshot(
+    source: Path,
+    dest: Path | None = None,
+    columns: ColumnSpec = (),
+    strings: Tuple[str, ...] = ("name",),
+    coerce: Callable[[Any], float] = _to_float,
+) -> Path:
+    """Compile ``source`` into a snapshot at ``dest`` (default ``snapshot_path()``).
+
+    The file is written to a temporary name and atomically moved into place.
+    """
+    source = Path(source)
+    sig = file_signature(source)
+    if sig is None:
+        raise FileNotFoundError(source)
+    dest = Path(dest) if dest else snapshot_path(source, columns, strings, sig)
+    with open(source, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    records: list = []
+    sections = []
+    for name, items in _sections_of(data):
+        sections.append([name, len(records), len(items)])
+        records.extend(items)
+    n = len(records)
+
+    blocks: List[Tuple[str, bytes]] = []
+    rec_off, rec_heap = _heap([json.dumps(r, ensure_ascii=False, separators=(",", ":")).encode("utf-8") for r in records])
+    blocks += [("records.offsets", rec_off.tobytes()), ("records.heap", rec_heap)]
+    for field in strings:
+        vals = [r.get(field) if isinstance(r, dict) else None for r in records]
+        off, heap = _heap([("" if v is None else str(v)).encode("utf-8") for v in vals])
+        blocks += [(f"strings.{field}.offsets", off.tobytes()), (f"strings.{field}.heap", heap)]
+    matrix = np.empty((len(columns), n), dtype="<f8")
+    for c, (_, path) in enumerate(columns):
+        matrix[c] = [coerce(_lookup(r, path)) for r in records]
+    blocks.append(("columns", matrix.tobytes()))
+
+    layout: Dict[str, List[int]] = {}
+    pos = 0
+    for key, payload in blocks:
+        layout[key] = [pos, len(payload)]
+        pos = _align(pos + len(payload))
+    meta = json.dumps({
+        "source_mtime_ns": sig[0],
+        "source_size": sig[1],
+        "count": n,
+        "sections": sections,
+        "columns": [c for c, _ in columns],
+        "strings": list(strings),
+        "blocks": layout,
+    }).encode("utf-8")
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(prefix=dest.name, suffix=".tmp", dir=dest.parent)
+    try:
+        with os.fdopen(fd, "wb") as out:
+            out.write(_HEADER.pack(MAGIC, VERSION, len(meta)))
+            out.write(meta)
+            base = _align(_HEADER.size + len(meta))
+            for key, payload in blocks:
+                out.seek(base + layout[key][0])
+                out.write(payload)
+            out.truncate(base + pos)
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    return dest
+
+
+class Snapshot:
+    """Read-only, memory-mapped view of a compiled snapshot."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            magic, version, meta_len = _HEADER.unpack_from(self._mm, 0)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{self.path} is not a version {VERSION} snapshot")
+            meta = json.loads(self._mm[_HEADER.size:_HEADER.size + meta_len])
+            self._base = _align(_HEADER.size + meta_len)
+            self._blocks: Dict[str, List[int]] = meta["blocks"]
+            self.count: int = meta["count"]
+            self.source_signature: Signature = (meta["source_mtime_ns"], meta["source_size"])
+            self.sections: Dict[str, Tuple[int, int]] = {s: (start, start + cnt) for s, start, cnt in meta["sections"]}
+            self.column_names: Tuple[str, ...] = tuple(meta["columns"])
+            self.string_fields: Tuple[str, ...] = tuple(meta["strings"])
+        except Exception:
+            # Don't leave a broken file mapped; it is about to be rebuilt
+            self._mm.close()
+            raise
+        self._rec_off = self._array("records.offsets", "<u8")
+        self._decoded: Dict[int, Any] = {}
+        self._strings: Dict[str, Tuple[str, ...]] = {}
+        self._index: Optional[Dict[str, int]] = None
+
+    def close(self) -> None:
+        """Unmap the file unless arrays handed out (e.g. ``columns()``) still use it.
+
+        In that case the map is released when the last of them goes away.
+        """
+        self._rec_off = None
+        try:
+            self._mm.close()
+        except BufferError:
+            pass
+
+    def _array(self, key: str, dtype: str) -> np.ndarray:
+        off, length = self._blocks[key]
+        return np.frombuffer(self._mm, dtype=dtype, count=length // np.dtype(dtype).itemsize, offset=self._base + off)
+
+    def _slice(self, key: str, start: int, stop: int) -> bytes:
+        off = self._base + self._blocks[key][0]
+        return self._mm[off + start:off + stop]
+
+    def is_fresh(self, source: Path) -> bool:
+        return file_signature(source) == self.source_signature
+
+    def record(self, row: int) -> Any:
+        """Decode (once) and return record ``row``."""
+        rec = self._decoded.get(row)
+        if rec is None:
+            if not 0 <= row < self.count:
+                raise IndexError(row)
+            a, b = int(self._rec_off[row]), int(self._rec_off[row + 1])
+            rec = self._decoded[row] = json.loads(self._slice("records.heap", a, b))
+        return rec
+
+    def strings(self, field: str) -> Tuple[str, ...]:
+        """All values of string field ``field`` in row order ("" when absent)."""
+        vals = self._strings.get(field)
+        if vals is None:
+            off = self._array(f"strings.{field}.offsets", "<u8")
+            heap = self._slice(f"strings.{field}.heap", 0, int(off[-1]) if off.size else 0)
+            bounds = off.tolist()
+            vals = self._strings[field] = tuple(
+                heap[a:b].decode("utf-8") for a, b in zip(bounds[:-1], bounds[1:])
+            )
+        return vals
+
+    def columns(self) -> np.ndarray:
+        """Numeric columns as a read-only ``(n_columns, count)`` array backed by the map."""
+        return self._array("columns", "<f8").reshape(len(self.column_names), self.count)
+
+    def index(self) -> Dict[str, int]:
+        """``name -> row``; later duplicates win, empty names are skipped."""
+        if self._index is None:
+            self._index = {n: i for i, n in enumerate(self.strings("name")) if n}
+        return self._index
+
+    def records(self, section: str | None = None) -> "LazyRecords":
+        start, stop = self.sections.get(section, (0, 0)) if section else (0, self.count)
+        return LazyRecords(self, start, stop)
+
+    def by_name(self, section: str | None = None) -> "LazyIndex":
+        if section is None:
+            return LazyIndex(self, self.index())
+        start, stop = self.sections.get(section, (0, 0))
+        names = self.strings("name")
+        return LazyIndex(self, {names[i]: i for i in range(start, stop) if names[i]})
+
+
+class LazyRecords(Sequence):
+    """Sequence of snapshot records, each decoded on first access."""
+
+    def __init__(self, snapshot: Snapshot, start: int, stop: int):
+        self._snap = snapshot
+        self._start = start
+        self._stop = stop
+
+    def __len__(self) -> int:
+        return self._stop - self._start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError(i)
+        return self._snap.record(self._start + i)
+
+
+class LazyIndex(Mapping):
+    """Read-only ``name -> record`` mapping that decodes records on lookup."""
+
+    def __init__(self, snapshot: Snapshot, rows: Dict[str, int]):
+        self._snap = snapshot
+        self._rows = rows
+
+    def __getitem__(self, name: str) -> Any:
+        return self._snap.record(self._rows[name])
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._rows
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rows)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+
+def open_snapshot(
+    source: Path,
+    columns: ColumnSpec = (),
+    strings: Tuple[str, ...] = ("name",),
+    coerce: Callable[[Any], float] = _to_float,
+    rebuild: bool = True,
+) -> Optional[Snapshot]:
+    """Open the snapshot for ``source``, rebuilding it when stale or missing.
+
+    Returns None when no usable snapshot can be produced (e.g. the data
+    directory is read-only); callers then fall back to parsing the JSON.
+    """
+    source = Path(source)
+    sig = file_signature(source)
+    if sig is None:
+        return None
+    dest = snapshot_path(source, columns, strings, sig)
+    want_cols = tuple(c for c, _ in columns)
+    try:
+        snap = Snapshot(dest)
+        if snap.is_fresh(source) and snap.column_names == want_cols and snap.string_fields == tuple(strings):
+            remove_stale_snapshots(source, keep=dest)
+            return snap
+        snap.close()
+    except (OSError, ValueError, KeyError, struct.error):
+        pass
+    if not rebuild:
+        return None
+    try:
+        build_snapshot(source, dest, columns, strings, coerce)
+        snap = Snapshot(dest)
+    except (OSError, ValueError, KeyError, struct.error):
+        return None
+    if not snap.is_fresh(source):
+        # The source changed while it was being compiled
+        snap.close()
+        return None
+    remove_stale_snapshots(source, keep=dest)
+    return snap
@@ -1,7 +1,8 @@
 from dataclasses import dataclass
 from pathlib import Path
-import json
-from typing import List, Optional
+from typing import Any, List, Optional
+
+from core.repository import get_repository
 
 
 @dataclass
@@ -23,17 +24,10 @@ def _default_teams_path() -> Path:
     return Path(__file__).resolve().parent / "data" / "teams.json"
 
 
-def load_teams(path: Path | None = None) -> List[Team]:
-    p = Path(path) if path else _default_teams_path()
-    if not p.exists():
-        # Fallback to a small built-in list
-        return [Team(name=n) for n in [
-            "Lakers", "Warriors", "Celtics", "Bulls", "Heat", "Suns"
-        ]]
-    with p.open("r", encoding="utf-8") as f:
-        data = json.load(f)
+def parse_teams(data: Any) -> List[Team]:
+    """Build ``Team`` objects from the decoded contents of teams.json."""
     teams = []
-    for item in data:
+    for item in data if isinstance(data, list) else []:
         if isinstance(item, dict):
             # Prefer region+name if provided, else "name" as-is
             region = item.get("region")
@@ -57,3 +51,14 @@ def load_teams(path: Path | None = None) -> List[Team]:
             if name:
                 teams.append(Team(name=name))
     return teams
+
+
+def load_teams(path: Path | None = None) -> List[Team]:
+    # teams.json, or the league database (BGM_LEAGUE_DB or a .db path)
+    teams = get_repository().teams(path)
+    if teams is None:
+        # Fallback to a small built-in list
+        return [Team(name=n) for n in [
+            "Lakers", "Warriors", "Celtics", "Bulls", "Heat", "Suns"
+        ]]
+    return list(teams)
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Dict, List
-import json
+from typing import Dict, List, Mapping, Sequence
+
+from core.repository import get_repository
 
 
 def _default_rosters_path() -> Path:
@@ -10,17 +11,15 @@ def _default_rosters_path() -> Path:
 
 
 def load_rosters(path: Path | None = None) -> Dict[str, List[str]]:
-    p = Path(path) if path else _default_rosters_path()
-    if not p.exists():
-        return {}
-    with p.open("r", encoding="utf-8") as f:
-        data = json.load(f)
-    return data if isinstance(data, dict) else {}
+    # rosters.json, or the league database (BGM_LEAGUE_DB or a .db path)
+    return {team: list(names) for team, names in get_repository().rosters(path).items()}
 
 
-def get_team_roster(team_display_name: str, rosters: Dict[str, List[str]] | None = None) -> List[str]:
+def get_team_roster(team_display_name: str, rosters: Mapping[str, Sequence[str]] | None = None) -> List[str]:
     if rosters is None:
-        rosters = load_rosters()
-    lst = rosters.get(team_display_name) or []
+        # Shared, already-parsed view (one indexed query with a database)
+        lst = get_repository().roster(team_display_name)
+    else:
+        lst = rosters.get(team_display_name) or []
     # Ensure it's a list of strings
     return [str(x) for x in lst if isinstance(x, (str, int))]
@@ -1,7 +1,145 @@
+from __future__ import annotations
 
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-import json
+from threading import RLock
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.players.ratings import RatingsStore, get_ratings_store
+from core.repository import get_repository
+from core.teams.loader import load_teams
+
+TOP_N = 8
+
+
+def _member_overalls(ovr: np.ndarray, rows: np.ndarray) -> np.ndarray:
+    """``ovr[rows]`` with NaN wherever ``rows`` is -1 (unknown player)."""
+    if ovr.size == 0:
+        return np.full(rows.shape, np.nan)
+    return np.where(rows >= 0, ovr[rows], np.nan)
+
+
+@dataclass(frozen=True)
+class TeamOverallRow:
+    rank: int
+    team: str
+    overall: float
+    players: int  # rated players on the roster
+
+
+def top_k_means(store: RatingsStore, rosters: Mapping[str, Sequence[str]], k: int = TOP_N) -> Dict[str, float]:
+    """Top-``k`` overall average for every roster in one vectorized pass.
+
+    Rosters are packed into a ``(teams, max roster)`` matrix padded with
+    ``-inf`` and ``np.partition`` selects each row's ``k`` best without a full
+    sort. The selected values are summed best-first so results match the
+    original sorted-list computation exactly.
+    """
+    teams = list(rosters)
+    if not teams:
+        return {}
+    width = max(max((len(rosters[t]) for t in teams), default=0), k)
+    rows = np.full((len(teams), width), -1, dtype=np.intp)
+    for i, t in enumerate(teams):
+        r = store.rows(rosters[t])
+        rows[i, :r.size] = r
+    vals = _member_overalls(store.column("overall"), rows)
+    vals[np.isnan(vals)] = -np.inf
+    top = -np.partition(-vals, k - 1, axis=1)[:, :k]
+    top = -np.sort(-top, axis=1)
+    valid = np.isfinite(top)
+    counts = valid.sum(axis=1)
+    sums = np.cumsum(np.where(valid, top, 0.0), axis=1)[:, -1]
+    means = np.divide(sums, counts, out=np.zeros(len(teams)), where=counts > 0)
+    return {t: float(m) for t, m in zip(teams, means)}
+
+
+class TeamOverallEngine:
+    """League-wide team OVR table with incremental invalidation.
+
+    ``refresh()`` is O(1) while neither rosters.json nor player_info.json
+    changed; otherwise it fingerprints every team (roster + member ratings)
+    and recomputes only the teams whose fingerprint moved, in one batch.
+    """
+
+    def __init__(self, top_n: int = TOP_N, rosters_path: Optional[Path] = None, player_info_path: Optional[Path] = None):
+        self.top_n = top_n
+        self.rosters_path = rosters_path
+        self.player_info_path = player_info_path
+        self._sources: Tuple[object, object] | None = None
+        self._fingerprints: Dict[str, tuple] = {}
+        self._overalls: Dict[str, float] = {}
+        self._counts: Dict[str, int] = {}
+        self._table: List[TeamOverallRow] | None = None
+        self._lock = RLock()
+
+    def refresh(self) -> List[str]:
+        """Bring the table up to date; return the teams that were recomputed."""
+        repo = get_repository()
+        rosters = repo.rosters(self.rosters_path)
+        store = get_ratings_store(self.player_info_path)
+        with self._lock:
+            # The repository hands out the same objects until a file changes
+            if self._sources is not None and self._sources[0] is rosters and self._sources[1] is store:
+                return []
+            names = list(rosters)
+            names += [t.name for t in load_teams() if t.name not in rosters]
+            ovr = store.column("overall")
+            dirty: Dict[str, Tuple[str, ...]] = {}
+            fingerprints: Dict[str, tuple] = {}
+            for team in names:
+                roster = rosters.get(team, ())
+                vals = _member_overalls(ovr, store.rows(roster))
+                fp = (roster, vals.tobytes())
+                fingerprints[team] = fp
+                if self._fingerprints.get(team) != fp:
+                    dirty[team] = roster
+                    self._counts[team] = int(np.count_nonzero(~np.isnan(vals)))
+            for team, mean in top_k_means(store, dirty, self.top_n).items():
+                self._overalls[team] = round(mean, 1)
+            for team in set(self._overalls) - set(fingerprints):
+                self._overalls.pop(team, None)
+                self._counts.pop(team, None)
+            self._fingerprints = fingerprints
+            self._sources = (rosters, store)
+            if dirty:
+                self._table = None
+            return list(dirty)
+
+    def overall(self, team: str) -> float:
+        """Team OVR (0.0 for unknown/empty teams)."""
+        self.refresh()
+        return self._overalls.get(team, 0.0)
+
+    def overalls(self) -> Dict[str, float]:
+        self.refresh()
+        return dict(self._overalls)
+
+    def league_table(self) -> List[TeamOverallRow]:
+        """Every team ranked by OVR (ties broken by name)."""
+        self.refresh()
+        with self._lock:
+            if self._table is None:
+                ranked = sorted(self._overalls.items(), key=lambda kv: (-kv[1], kv[0]))
+                self._table = [
+                    TeamOverallRow(rank=i + 1, team=t, overall=o, players=self._counts.get(t, 0))
+                    for i, (t, o) in enumerate(ranked)
+                ]
+            return list(self._table)
+
+
+_ENGINE: TeamOverallEngine | None = None
+
+
+def get_team_overall_engine() -> TeamOverallEngine:
+    """Shared engine over the default rosters.json / player_info.json."""
+    global _ENGINE
+    if _ENGINE is None:
+        _ENGINE = TeamOverallEngine()
+    return _ENGINE
+
 
 def load_team_overall(team_name: str, rosters_path: Optional[Path] = None, player_info_path: Optional[Path] = None) -> float:
     """
@@ -9,22 +147,8 @@ def load_team_overall(team_name: str, rosters_path: Optional[Path] = None, playe
     - Use the average of the top 8 player overalls on the roster (simulating a real NBA rotation).
     - If fewer than 8 players, average all available overalls.
     """
-    if rosters_path is None:
-        rosters_path = Path(__file__).resolve().parent / "data" / "rosters" / "rosters.json"
-    if player_info_path is None:
-        player_info_path = Path(__file__).resolve().parent / "data" / "player_info.json"
-    with open(rosters_path, "r", encoding="utf-8") as f:
-        rosters = json.load(f)
-    with open(player_info_path, "r", encoding="utf-8") as f:
-        players = json.load(f)
-    player_overall = {p["name"]: p["overall"] for p in players if "overall" in p}
-    roster = rosters.get(team_name, [])
-    overalls = [player_overall.get(name) for name in roster]
-    overalls = [o for o in overalls if o is not None]
-    if not overalls:
-        return 0.0
-    # Sort overalls descending and take the top 8 (or all if fewer)
-    overalls.sort(reverse=True)
-    top_n = 8
-    top_overalls = overalls[:top_n]
-    return round(sum(top_overalls) / len(top_overalls), 1)
+    if rosters_path is None and player_info_path is None:
+        return get_team_overall_engine().overall(team_name)
+    roster = get_repository().rosters(rosters_path).get(team_name, ())
+    store = get_ratings_store(player_info_path)
+    return round(top_k_means(store, {team_name: roster}, TOP_N)[team_name], 1)
@@ -0,0 +1,77 @@
+from PyQt5.QtCore import QObject, QFileSystemWatcher, QTimer, pyqtSignal
+import logging
+
+from core.reload import LeagueChanges, LeagueReloader
+from core.repository import get_repository
+
+
+class DataWatcher(QObject):
+    """Watches the league data files and broadcasts what changed.
+
+    Edits (e.g. from the tools/ scripts) are debounced, then only the changed
+    files are re-read and diffed; ``dataChanged`` carries a ``LeagueChanges``
+    listing the affected teams and players so open windows can update just
+    those rows instead of restarting the app.
+    """
+
+    dataChanged = pyqtSignal(object)
+
+    DEBOUNCE_MS = 150
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._reloader = LeagueReloader()
+        repo = get_repository()
+        if repo.database is not None:
+            # Every source lives in the league database
+            self._files = [repo.database]
+        else:
+            self._files = [repo.teams_path, repo.rosters_path, repo.player_info_path, repo.player_bio_path]
+        self._watcher = QFileSystemWatcher(self)
+        self._watcher.fileChanged.connect(self._schedule)
+        # Tools rewrite files by replacing them, which drops file watches;
+        # watching the directories too catches those and lets us re-arm.
+        self._watcher.directoryChanged.connect(self._schedule)
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(self.DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.reload_now)
+        self._arm()
+
+    def _arm(self):
+        files = [str(p) for p in self._files if p.exists()]
+        dirs = sorted({str(p.parent) for p in self._files if p.parent.is_dir()})
+        watched = set(self._watcher.files()) | set(self._watcher.directories())
+        missing = [p for p in files + dirs if p not in watched]
+        if missing:
+            self._watcher.addPaths(missing)
+
+    def _schedule(self, *_):
+        self._debounce.start()
+
+    def reload_now(self) -> LeagueChanges:
+        """Check the data files immediately; emit and return the changes."""
+        self._arm()
+        try:
+            changes = self._reloader.check()
+        except Exception:
+            # A half-written file; the next change notification retries
+            logging.exception('League data reload failed')
+            return LeagueChanges()
+        if changes:
+            logging.info('League data reloaded: files=%s teams=%d players=%d',
+                          ','.join(changes.files), len(changes.teams), len(changes.players))
+            self.dataChanged.emit(changes)
+        return changes
+
+
+_WATCHER = None
+
+
+def get_data_watcher() -> DataWatcher:
+    """Process-wide watcher (created on first use, after the QApplication)."""
+    global _WATCHER
+    if _WATCHER is None:
+        _WATCHER = DataWatcher()
+    return _WATCHER
+
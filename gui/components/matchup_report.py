@@ -0,0 +1,56 @@
+from html import escape
+
+# Box score columns shown in the matchup summary (average per game)
+REPORT_COLUMNS = ('MIN', 'PTS', 'TRB', 'AST', 'STL', 'BLK', 'TOV', 'FG%', '3P%')
+
+
+def _pct(made, att):
+    return f'{100.0 * made / att:.1f}' if att else '-'
+
+
+def _cells(row):
+    out = []
+    for col in REPORT_COLUMNS:
+        if col == 'TRB':
+            val = f"{row['ORB'] + row['DRB']:.1f}"
+        elif col == 'FG%':
+            val = _pct(row['FGM'], row['FGA'])
+        elif col == '3P%':
+            val = _pct(row['3PM'], row['3PA'])
+        else:
+            val = f'{row[col]:.1f}'
+        out.append(f'<td align="right">{val}</td>')
+    return ''.join(out)
+
+
+def _box_table(team, rows):
+    head = ''.join(f'<th align="right">{c}</th>' for c in REPORT_COLUMNS)
+    body = ''.join(f"<tr><td>{escape(r['name'])}</td>{_cells(r)}</tr>" for r in rows)
+    return (f'<h4>{escape(team)}</h4>'
+            f'<table cellspacing="0" cellpadding="3" width="100%"><tr><th align="left">Player</th>{head}</tr>{body}</table>')
+
+
+def _spread(dist):
+    return f"{dist['mean']:.1f} (5–95%: {dist['p5']:.0f}–{dist['p95']:.0f}, median {dist['p50']:.0f})"
+
+
+def matchup_html(summary):
+    """Render a ``MatchupSummary`` as HTML for the results pane."""
+    home, away = escape(summary.home), escape(summary.away)
+    favorite = summary.home if summary.home_win_prob >= 0.5 else summary.away
+    fav_prob = max(summary.home_win_prob, summary.away_win_prob)
+    margin = summary.margin
+    return ''.join([
+        f'<h3>{away} @ {home}</h3>',
+        f'<p>{summary.games:,} simulated games &mdash; <b>{escape(favorite)}</b> win {100.0 * fav_prob:.1f}%</p>',
+        '<table cellspacing="0" cellpadding="3">',
+        f'<tr><td>{home} win probability</td><td align="right"><b>{100.0 * summary.home_win_prob:.1f}%</b></td></tr>',
+        f'<tr><td>{away} win probability</td><td align="right"><b>{100.0 * summary.away_win_prob:.1f}%</b></td></tr>',
+        f'<tr><td>{home} points</td><td align="right">{_spread(summary.home_points)}</td></tr>',
+        f'<tr><td>{away} points</td><td align="right">{_spread(summary.away_points)}</td></tr>',
+        f"<tr><td>{home} margin</td><td align=\"right\">{margin['mean']:+.1f} (middle 50%: {margin['p25']:+.0f} to {margin['p75']:+.0f})</td></tr>",
+        f'<tr><td>Overtime</td><td align="right">{100.0 * summary.overtime_rate:.1f}%</td></tr>',
+        '</table>',
+        _box_table(summary.home, summary.home_box),
+        _box_table(summary.away, summary.away_box),
+    ])
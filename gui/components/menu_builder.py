@@ -39,6 +39,15 @@ class MenuBuilder:
 
         bar.addMenu(file_menu)
 
+        sim_menu = QMenu('Simulation', self.host)
+        add_action(sim_menu, 'Simulate Matchup', self.host.simulate_matchup, 'Ctrl+G')
+        add_action(sim_menu, 'Simulate Season', self.host.simulate_season, 'Ctrl+Shift+G')
+        add_action(sim_menu, 'Watch Game', self.host.watch_game, 'Ctrl+Shift+W')
+        sim_menu.addSeparator()
+        self.host.cancel_action = add_action(sim_menu, 'Cancel Simulation', self.host.cancel_tasks, 'Ctrl+.')
+        self.host.cancel_action.setEnabled(False)
+        bar.addMenu(sim_menu)
+
         view_menu = QMenu('View', self.host)
         self.host.fullscreen_action = add_action(view_menu, 'Toggle Full Screen', self.host.toggle_fullscreen, 'F11', checkable=True)
         bar.addMenu(view_menu)
@@ -0,0 +1,153 @@
+"""Streaming extraction of plays from play-by-play HTML.
+
+``PlayExtractor`` is an ``html.parser`` fed in chunks; plays found so far
+are collected with ``pop()``, so a caller can show the first plays of a
+multi-megabyte export while the rest is still being read. A play is the
+inner HTML of an ``<li>``, a ``<div>`` with a ``play...`` class, or a
+``<p>``, in that order of preference over the whole document: ``<li>``
+plays anywhere win, else play divs, else paragraphs. A document with none
+of them yields its non-empty lines.
+
+Only ``<li>`` plays are streamed, since nothing later can replace them.
+Play divs and paragraphs are held until ``close()``, because an ``<li>``
+(or, for paragraphs, a play div) further down would take precedence.
+"""
+
+import codecs
+import os
+from html.parser import HTMLParser
+
+# Characters decoded per chunk when reading a file
+CHUNK_SIZE = 1 << 16
+# Play kinds, most preferred first
+KINDS = ('li', 'div', 'p')
+
+
+class PlayExtractor(HTMLParser):
+    """Incremental play extractor: ``feed()`` chunks, ``pop()`` the plays found."""
+
+    def __init__(self):
+        # Keep entity references as written so play HTML round-trips
+        super().__init__(convert_charrefs=False)
+        self.kind = None
+        self._ready = []
+        self._held = {'div': [], 'p': []}
+        self._open = []        # [kind, tag, depth, parts] per element being captured
+        self._raw = []         # text for the line fallback, until an element shows up
+
+    def feed(self, data):
+        if self._raw is not None:
+            self._raw.append(data)
+        super().feed(data)
+
+    def close(self):
+        super().close()
+        if self.kind is None:
+            held = next((k for k in KINDS[1:] if self._held[k]), None)
+            if held is not None:
+                self.kind = held
+                self._ready.extend(self._held[held])
+            elif self._raw is not None:
+                self.kind = 'lines'
+                self._ready.extend(ln.strip() for ln in ''.join(self._raw).splitlines() if ln.strip())
+            self._held = {'div': [], 'p': []}
+        self._raw = None
+
+    def pop(self):
+        """Plays completed since the last call."""
+        plays, self._ready = self._ready, []
+        return plays
+
+    @staticmethod
+    def _kind(tag, attrs):
+        if tag == 'li':
+            return 'li'
+        if tag == 'p':
+            return 'p'
+        if tag == 'div':
+            classes = next((v for k, v in attrs if k == 'class'), None) or ''
+            if any(c.startswith('play') for c in classes.split()):
+                return 'div'
+        return None
+
+    def _append(self, text):
+        for cap in self._open:
+            cap[3].append(text)
+
+    def handle_starttag(self, tag, attrs):
+        for cap in self._open:
+            if tag == cap[1]:
+                cap[2] += 1
+        self._append(self.get_starttag_text())
+        kind = self._kind(tag, attrs)
+        if kind is None or (self.kind == 'li' and kind != 'li'):
+            return
+        # Elements of a kind nest by depth; other kinds are captured alongside,
+        # e.g. an <li> inside a play div is still an <li> play
+        if not any(cap[0] == kind for cap in self._open):
+            self._open.append([kind, tag, 1, []])
+            self._raw = None
+
+    def handle_startendtag(self, tag, attrs):
+        self._append(self.get_starttag_text())
+
+    def handle_endtag(self, tag):
+        for cap in list(self._open):
+            if tag == cap[1]:
+                cap[2] -= 1
+                if cap[2] == 0:
+                    self._open.remove(cap)
+                    self._add(cap[0], ''.join(cap[3]).strip())
+                    continue
+            cap[3].append(f'</{tag}>')
+
+    def handle_data(self, data):
+        self._append(data)
+
+    def handle_entityref(self, name):
+        self._append(f'&{name};')
+
+    def handle_charref(self, name):
+        self._append(f'&#{name};')
+
+    def _add(self, kind, play):
+        if kind == 'li':
+            if self.kind != 'li':
+                # List plays win; divs and paragraphs so far were page content
+                self.kind = 'li'
+                self._held = {'div': [], 'p': []}
+                self._open = [cap for cap in self._open if cap[0] == 'li']
+            self._ready.append(play)
+        elif self.kind is None:
+            self._held[kind].append(play)
+
+
+def extract_plays(html):
+    """All plays of an HTML string."""
+    parser = PlayExtractor()
+    parser.feed(html)
+    parser.close()
+    return parser.pop()
+
+
+def read_plays(path, chunk_size=CHUNK_SIZE):
+    """Yield ``(plays, bytes read, file size)`` while reading ``path`` in chunks.
+
+    The file is decoded as UTF-8 (invalid bytes replaced) incrementally, so
+    multi-byte characters split across chunks survive.
+    """
+    total = os.path.getsize(path)
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    parser = PlayExtractor()
+    done = 0
+    with open(path, 'rb') as f:
+        while True:
+            data = f.read(chunk_size)
+            if not data:
+                break
+            done += len(data)
+            parser.feed(decoder.decode(data))
+            yield parser.pop(), done, total
+    parser.feed(decoder.decode(b'', final=True))
+    parser.close()
+    yield parser.pop(), done, total
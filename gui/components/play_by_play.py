@@ -1,7 +1,16 @@
+from collections import deque
+from html import escape
+import json
+import logging
+
 from PyQt5.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider, QTextBrowser
+    QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel, QSlider, QTextBrowser, QComboBox
 )
-from PyQt5.QtCore import QTimer, Qt
+from PyQt5.QtCore import QTimer, Qt, pyqtSignal
+from PyQt5.QtGui import QTextBlockFormat, QTextCharFormat, QTextCursor
+
+from gui.components.pbp_parser import extract_plays, read_plays
+from gui.components.workers import TaskRunner
 
 # Try to import QWebEngineView for high-fidelity HTML rendering. If the
 # environment doesn't have PyQtWebEngine installed, we'll fall back to
@@ -12,21 +21,96 @@ except Exception:
     QWebEngineView = None  # type: ignore
 
 
+def _period_label(period):
+    from core.game.engine import QUARTERS
+    if period <= QUARTERS:
+        return f'Q{period}'
+    ot = period - QUARTERS
+    return 'OT' if ot == 1 else f'OT{ot}'
+
+
+def event_html(event):
+    """Format one engine ``PlayEvent`` as an HTML fragment (away-home score)."""
+    score = f"<span class='pbp-score'>{event.away_score}-{event.home_score}</span>"
+    if event.kind == 'end_of_period':
+        return f'<b>{escape(event.describe())}</b> {score}'
+    text = escape(event.describe())
+    if event.points:
+        text = f'<b>{text}</b>'
+    return (f"<span class='pbp-clock'>{_period_label(event.period)} {event.clock_text}</span> "
+            f'{escape(event.team)}: {text} {score}')
+
+
 class PlayByPlayWidget(QWidget):
     """A lightweight play-by-play pane with simple playback controls.
 
     Uses QTextBrowser to render HTML fragments. Plays can be loaded from an
-    HTML file (li, p, or div blocks) or appended programmatically.
+    HTML file (li, p, or div blocks; ``load_file`` parses it on a worker
+    thread and playback can start on the first plays), appended
+    programmatically, or streamed
+    lazily from an iterable of engine ``PlayEvent``s or a binary play log
+    (``open_log``), which can be jumped into by period. Only the most recent
+    ``HISTORY_LIMIT`` entries are kept on screen, and events are formatted
+    to HTML only when rendered.
+
+    With ``incremental`` on (the default) each step appends only the new
+    entry (a cursor insert into the QTextBrowser document, or a DOM append
+    via ``runJavaScript`` in QWebEngineView) and trims the oldest, so a step
+    costs the same however long the game has run; the view stays pinned to
+    the bottom while it is scrolled there and stays put otherwise. The
+    document is only rebuilt when playback restarts.
+
+    Playback runs from 0.1x to 100x. Timer ticks never come faster than a
+    display frame (``FRAME_MS``); at higher speeds every tick shows all the
+    plays due as one batch. Skip to end and jump to a period also show their
+    plays as one batch, so either way there is a single repaint.
     """
 
+    loadFinished = pyqtSignal(str, int)   # path, plays
+    loadFailed = pyqtSignal(str, str)     # path, error
+    streamFailed = pyqtSignal(str)        # error raised by a streamed event source
+
+    HISTORY_LIMIT = 500
+    # Entries trimmed at once when appending past the limit (a trim relayouts
+    # the document, so it is amortized over this many steps)
+    TRIM_BATCH = 100
+    incremental = True
+    # Playback speed in plays per second, on a log-scale slider (1x = 1 play/s)
+    SPEED_MIN = 0.1
+    SPEED_MAX = 100.0
+    SPEED_STEPS = 300
+    # Fastest timer tick, about one display frame; faster speeds play several
+    # plays per tick and render them as one batch
+    FRAME_MS = 16
+    # Appends a batch of fragments to the page, trimming to the history limit
+    # and following the bottom if the view was there
+    _APPEND_JS = (
+        "(function(items, limit) {"
+        "var b = document.body, e = document.scrollingElement || b;"
+        "var follow = e.scrollTop + e.clientHeight >= e.scrollHeight - 4;"
+        "for (var i = 0; i < items.length; i++) {"
+        "var d = document.createElement('div'); d.className = 'pbp-entry';"
+        "d.innerHTML = items[i]; b.appendChild(d); }"
+        "while (b.childElementCount > limit) b.removeChild(b.firstElementChild);"
+        "if (follow) e.scrollTop = e.scrollHeight;"
+        "})(%s, %d);"
+    )
+
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setObjectName('PlayByPlayWidget')
 
-        self._displayed = []
+        self._displayed = deque(maxlen=self.HISTORY_LIMIT)
+        # Text blocks taken by each entry in the QTextBrowser document, oldest first
+        self._entry_blocks = deque()
+        self._stream = None
+        self._log = None
+        self._log_game = 0
         self.plays = []
         self.index = 0
         self.playing = False
+        self._loader = TaskRunner(self)
+        self._load_task = None
 
         # Controls
         controls = QHBoxLayout()
@@ -38,11 +122,20 @@ class PlayByPlayWidget(QWidget):
         self.speed_label = QLabel('1.00x')
         self.speed_label.setObjectName('PBPSpdLbl')
         self.speed_slider = QSlider(Qt.Horizontal)
-        self.speed_slider.setRange(10, 300)  # percent (0.1x - 3.0x)
-        self.speed_slider.setValue(100)
+        self.speed_slider.setRange(0, self.SPEED_STEPS)
+        self.speed_slider.setValue(self._speed_to_slider(1.0))
+        self.jump_box = QComboBox()
+        self.jump_box.setObjectName('PBPJump')
+        self.jump_box.addItems(['Jump to...', 'Q1', 'Q2', 'Q3', 'Q4', 'OT'])
+        self.jump_box.setToolTip('Jump to the start of a period')
+        self.end_btn = QPushButton('End')
+        self.end_btn.setObjectName('PBPEnd')
+        self.end_btn.setToolTip('Skip to the end')
 
         controls.addWidget(self.play_btn)
         controls.addWidget(self.next_btn)
+        controls.addWidget(self.jump_box)
+        controls.addWidget(self.end_btn)
         controls.addWidget(self.speed_label)
         controls.addWidget(self.speed_slider)
 
@@ -50,10 +143,16 @@ class PlayByPlayWidget(QWidget):
         if QWebEngineView is not None:
             self.browser = QWebEngineView()
             # QWebEngineView doesn't have setOpenExternalLinks; links open in engine
+            # Appends wait for the scaffold page to finish loading
+            self._page_ready = False
+            self._pending = []
+            self.browser.loadFinished.connect(self._on_page_loaded)
         else:
             self.browser = QTextBrowser()
             self.browser.setOpenExternalLinks(True)
             self.browser.setObjectName('PlayByPlayBrowser')
+            # Nothing to undo in a read-only view; don't let appends pile up there
+            self.browser.document().setUndoRedoEnabled(False)
 
         # Layout
         root = QVBoxLayout()
@@ -63,12 +162,15 @@ class PlayByPlayWidget(QWidget):
 
         # Timer for auto-play
         self.timer = QTimer(self)
-        self.timer.timeout.connect(self._play_step)
+        self.timer.timeout.connect(self._on_tick)
 
         # Signals
         self.play_btn.clicked.connect(self.toggle_play)
         self.next_btn.clicked.connect(self.next_play)
+        self.end_btn.clicked.connect(self.skip_to_end)
+        self.jump_box.activated.connect(self._on_jump)
         self.speed_slider.valueChanged.connect(self._update_speed_label)
+        self._budget = 0.0
 
         self._update_speed_label()
 
@@ -90,52 +192,141 @@ class PlayByPlayWidget(QWidget):
                 pass
 
         # Parse possible play entries for stepwise playback
+        self.cancel_loading()
+        self._stream = None
+        self._close_log()
         self._parse_plays_from_html(html)
         self.index = 0
-        self._displayed = []
+        self._displayed.clear()
+        self._render_display()
+
+    def load_file(self, path, autoplay=False):
+        """Parse a play-by-play HTML file on a worker thread, appending plays as they are found.
+
+        Playback can run while the file is still being read; it waits at
+        the last parsed play until more arrive. ``loadFinished`` or
+        ``loadFailed`` reports the outcome.
+        """
+        self.cancel_loading()
+        self._close_log()
+        self._stream = None
+        self._reset_display()
+        task = self._loader.start(_read_play_file, path)
+        self._load_task = task
+        task.signals.partial.connect(lambda plays: self._on_plays_loaded(task, plays))
+        task.signals.finished.connect(lambda n: self._on_load_done(task) and self.loadFinished.emit(path, n))
+        task.signals.failed.connect(lambda msg: self._on_load_done(task) and self.loadFailed.emit(path, msg))
+        if autoplay and not self.playing:
+            self.toggle_play()
+
+    def is_loading(self):
+        return self._load_task is not None
+
+    def cancel_loading(self):
+        if self._load_task is not None:
+            self._load_task.cancel()
+            self._load_task = None
+
+    def _on_plays_loaded(self, task, plays):
+        if task is self._load_task:
+            self.plays.extend(plays)
+
+    def _on_load_done(self, task):
+        """Clear the loading state; False if ``task`` was superseded."""
+        if task is not self._load_task:
+            return False
+        self._load_task = None
+        if self.playing and self.index >= len(self.plays):
+            self.toggle_play()
+        return True
+
+    def stream_events(self, events, autoplay=True):
+        """Play back ``events`` (e.g. ``core.game.play_by_play``) as they are produced.
+
+        The iterable is consumed one event per step, so a generator that
+        simulates games lazily is never run ahead of the display.
+        """
+        self.cancel_loading()
+        self._close_log()
+        self._start_stream(events, autoplay)
+
+    def open_log(self, path, game=0, period=1, autoplay=False):
+        """Replay ``game`` of a play log (``core.game.pbplog``) from ``period``.
+
+        The log is memory-mapped; only the plays that are shown get decoded.
+        """
+        from core.game.pbplog import PlayLog
+        log = PlayLog(path)
+        self.cancel_loading()
+        self._close_log()
+        self._log, self._log_game = log, game
+        self._start_stream(log.events(game, period), autoplay)
+
+    def seek_period(self, period):
+        """Restart the open log's game at ``period`` (1-4, then overtimes)."""
+        if self._log is None:
+            return
+        self._start_stream(self._log.events(self._log_game, period), self.playing)
+
+    def _close_log(self):
+        if self._log is not None:
+            self._stream = None
+            self._log.close()
+            self._log = None
+
+    def _reset_display(self):
+        self.plays = []
+        self.index = 0
+        self._displayed.clear()
         self._render_display()
 
+    def _start_stream(self, events, autoplay):
+        self._stream = iter(events)
+        self._reset_display()
+        if autoplay and not self.playing:
+            self.toggle_play()
+
     def append_line(self, html_line: str):
         """Append a single play (HTML fragment) to the internal play list."""
         self.plays.append(html_line)
 
     def _parse_plays_from_html(self, html: str):
-        import re
+        self.plays = extract_plays(html)
 
-        # Try common containers in order: <li>, <div class="play">, <p>
-        plays = re.findall(r'<li[^>]*>(.*?)</li>', html, flags=re.DOTALL | re.IGNORECASE)
-        if plays:
-            self.plays = [p.strip() for p in plays]
-            return
+    def _speed_to_slider(self, speed):
+        import math
+        ratio = math.log(speed / self.SPEED_MIN) / math.log(self.SPEED_MAX / self.SPEED_MIN)
+        return round(ratio * self.SPEED_STEPS)
 
-        plays = re.findall(r'<div[^>]*class=["\']?play[^"\']*["\']?[^>]*>(.*?)</div>', html, flags=re.DOTALL | re.IGNORECASE)
-        if plays:
-            self.plays = [p.strip() for p in plays]
-            return
+    def speed(self):
+        """Current playback speed (1.0 = one play per second)."""
+        ratio = self.speed_slider.value() / self.SPEED_STEPS
+        return round(self.SPEED_MIN * (self.SPEED_MAX / self.SPEED_MIN) ** ratio, 3)
 
-        plays = re.findall(r'<p[^>]*>(.*?)</p>', html, flags=re.DOTALL | re.IGNORECASE)
-        if plays:
-            self.plays = [p.strip() for p in plays]
-            return
-
-        # Last resort: split on newlines and keep non-empty lines
-        lines = [ln.strip() for ln in html.splitlines() if ln.strip()]
-        self.plays = lines
+    def set_speed(self, speed):
+        speed = min(max(speed, self.SPEED_MIN), self.SPEED_MAX)
+        self.speed_slider.setValue(self._speed_to_slider(speed))
 
     def _update_speed_label(self):
-        val = self.speed_slider.value()
-        speed = val / 100.0
-        self.speed_label.setText(f'{speed:.2f}x')
+        speed = self.speed()
+        self.speed_label.setText(f'{speed:.2f}x' if speed < 10 else f'{speed:.0f}x')
         if self.playing:
             self._start_timer()
 
     def _start_timer(self):
-        speed = max(0.01, self.speed_slider.value() / 100.0)
-        # base interval 1000ms per play at 1x
-        interval = int(1000 / speed)
-        interval = max(50, interval)
+        # base interval 1000ms per play at 1x, but never faster than a frame
+        interval = max(self.FRAME_MS, int(1000 / self.speed()))
+        self._budget = 0.0
         self.timer.start(interval)
 
+    def _on_tick(self):
+        # Plays due this tick; the fractional remainder carries over
+        self._budget += self.speed() * self.timer.interval() / 1000.0
+        n = int(self._budget)
+        self._budget -= n
+        if n:
+            self._advance(n)
+
     def toggle_play(self):
         if self.playing:
             self.timer.stop()
@@ -146,16 +337,91 @@ class PlayByPlayWidget(QWidget):
             self.play_btn.setText('Pause')
             self._start_timer()
 
-    def _play_step(self):
-        if self.index >= len(self.plays):
+    def _next_item(self):
+        if self._stream is not None:
+            try:
+                item = next(self._stream, None)
+            except Exception as e:
+                # Runs from the timer slot, where an uncaught error would abort
+                # the app; end the stream and report it instead
+                logging.exception('Play-by-play stream failed')
+                self._stream = None
+                if self.playing:
+                    self.toggle_play()
+                self.streamFailed.emit(str(e))
+                return None
+            if item is None:
+                self._stream = None
+            return item
+        if self.index < len(self.plays):
+            return self.plays[self.index]
+        return None
+
+    def _advance(self, n=1, until=None):
+        """Show the next ``n`` plays (or up to the first matching ``until``) as one batch.
+
+        Only the entries that stay within ``HISTORY_LIMIT`` are formatted;
+        a batch that replaces the whole history is shown with one rebuild.
+        """
+        batch = deque(maxlen=self.HISTORY_LIMIT)
+        count = 0
+        exhausted = False
+        while count < n:
+            item = self._next_item()
+            if item is None:
+                exhausted = True
+                break
+            batch.append(item)
+            self.index += 1
+            count += 1
+            if until is not None and until(item):
+                break
+        if count:
+            self._displayed.extend(batch)
+            if self.incremental and count < self.HISTORY_LIMIT:
+                self._append_display(list(batch))
+            else:
+                self._render_display()
+        if exhausted and self._load_task is None:
             self.timer.stop()
             self.play_btn.setText('Play')
             self.playing = False
+        return count
+
+    def _play_step(self):
+        self._advance(1)
+
+    def skip_to_end(self):
+        """Show the rest of the plays at once (to the end of a streamed batch of games)."""
+        if self.playing:
+            self.toggle_play()
+        self._advance(float('inf'))
+
+    def current_period(self):
+        """Period of the last shown engine event (0 before the first)."""
+        for entry in reversed(self._displayed):
+            if not isinstance(entry, str):
+                return entry.period
+        return 0
+
+    def jump_to_period(self, period):
+        """Continue from the start of ``period`` (5 = first overtime).
+
+        An open play log seeks straight there, forwards or back; a live
+        stream fast-forwards, so it can only move ahead. Periods are only
+        known for engine events, not plays parsed from HTML.
+        """
+        if self._log is not None:
+            self.seek_period(period)
             return
-        item = self.plays[self.index]
-        self._displayed.append(item)
-        self.index += 1
-        self._render_display()
+        if self._stream is None or self.current_period() >= period:
+            return
+        self._advance(float('inf'), until=lambda e: not isinstance(e, str) and e.period >= period)
+
+    def _on_jump(self, index):
+        self.jump_box.setCurrentIndex(0)
+        if index > 0:
+            self.jump_to_period(index)
 
     def next_play(self):
         # If auto-playing, stop first
@@ -165,20 +431,85 @@ class PlayByPlayWidget(QWidget):
 
     def _build_html(self):
         # Simple scaffold for displayed entries
-        body = '\n'.join(f"<div class='pbp-entry'>{entry}</div>" for entry in self._displayed)
+        body = '\n'.join(f"<div class='pbp-entry'>{self._entry_html(entry)}</div>" for entry in self._displayed)
         return f"<html><head></head><body>{body}</body></html>"
 
+    @staticmethod
+    def _entry_html(entry):
+        return entry if isinstance(entry, str) else event_html(entry)
+
+    def _is_web(self):
+        return QWebEngineView is not None and isinstance(self.browser, QWebEngineView)
+
     def _render_display(self):
+        """Rebuild the whole document from the displayed entries."""
+        if not self._is_web():
+            # Built entry by entry like appends, so the block count of every
+            # entry is known when the history is trimmed
+            self.browser.clear()
+            self._entry_blocks.clear()
+            self._append_display(self._displayed)
+            return
         html = self._build_html()
         # QWebEngineView requires a different call path
         try:
-            if QWebEngineView is not None and isinstance(self.browser, QWebEngineView):
-                self.browser.setHtml(html)
-            else:
-                self.browser.setHtml(html)
+            self._page_ready = False
+            self._pending = []
+            self.browser.setHtml(html)
         except Exception:
-            try:
-                self.browser.setPlainText(html)
-            except Exception:
-                pass
+            pass
+
+    def _append_display(self, entries):
+        """Append ``entries`` to the shown document without rebuilding it."""
+        fragments = [self._entry_html(e) for e in entries]
+        if self._is_web():
+            if not self._page_ready:
+                self._pending.extend(fragments)
+                return
+            self.browser.page().runJavaScript(self._APPEND_JS % (json.dumps(fragments), self.HISTORY_LIMIT))
+            return
+        bar = self.browser.verticalScrollBar()
+        follow = bar.value() >= bar.maximum() - 4
+        value = bar.value()
+        cursor = QTextCursor(self.browser.document())
+        cursor.movePosition(QTextCursor.End)
+        doc = self.browser.document()
+        cursor.beginEditBlock()
+        for html in fragments:
+            before = doc.blockCount()
+            # Fresh formats so bold or colour doesn't leak from the previous entry
+            cursor.insertBlock(QTextBlockFormat(), QTextCharFormat())
+            cursor.insertHtml(html)
+            self._entry_blocks.append(doc.blockCount() - before)
+        excess = len(self._entry_blocks) - self.HISTORY_LIMIT
+        if excess >= self.TRIM_BATCH:
+            # Blocks ahead of the first entry (the document's initial empty block)
+            lead = doc.blockCount() - sum(self._entry_blocks)
+            dropped = sum(self._entry_blocks.popleft() for _ in range(excess))
+            first, keep = doc.findBlockByNumber(lead), doc.findBlockByNumber(lead + dropped)
+            # Shift a scrolled-up view by the trimmed height so it stays put
+            layout = doc.documentLayout()
+            trimmed = layout.blockBoundingRect(keep).top() - layout.blockBoundingRect(first).top()
+            value = max(0, value - int(trimmed))
+            cursor.setPosition(first.position())
+            cursor.setPosition(keep.position(), QTextCursor.KeepAnchor)
+            cursor.removeSelectedText()
+        cursor.endEditBlock()
+        bar.setValue(bar.maximum() if follow else value)
+
+    def _on_page_loaded(self, ok):
+        self._page_ready = True
+        pending, self._pending = self._pending, []
+        if pending:
+            self.browser.page().runJavaScript(self._APPEND_JS % (json.dumps(pending), self.HISTORY_LIMIT))
 
+
+def _read_play_file(ctx, path):
+    """Task body for ``load_file``: stream plays from ``path``; returns the play count."""
+    count = 0
+    for plays, done, total in read_plays(path):
+        if plays:
+            count += len(plays)
+            ctx.partial(plays)
+        ctx.progress(done, total)
+    return count
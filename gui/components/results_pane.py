@@ -31,5 +31,11 @@ class ResultsPane(QFrame):
     def clear(self):
         return self.inner.clear()
 
+    def setHtml(self, html):
+        return self.inner.setHtml(html)
+
+    def append(self, text):
+        return self.inner.append(text)
+
     def print(self, printer):
         return self.inner.print(printer)
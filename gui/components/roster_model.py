@@ -0,0 +1,102 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, Qt
+from PyQt5.QtGui import QIcon
+from PyQt5.QtWidgets import QStyledItemDelegate
+
+from gui.components.skill_badge import get_combined_badge
+
+# Badge symbols of the row (tuple of str)
+BadgesRole = Qt.UserRole + 1
+BADGE_SIZE = 18
+
+
+class PlayerListModel(QAbstractListModel):
+    """Player names for a list view; badges and tooltips are looked up per row on demand.
+
+    Switching lists only swaps the name tuple, so the cost and memory of a
+    switch do not depend on what was shown before. Views ask for the badge
+    role only for rows being painted, and for the tooltip only on hover.
+    With no names the model shows a single unselectable ``placeholder`` row.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.names = ()
+        self.placeholder = ''
+        self._rows = 0
+        self._classifier = None
+
+    def set_names(self, names, placeholder=''):
+        self.beginResetModel()
+        self.names = tuple(names)
+        self.placeholder = placeholder
+        # Views call rowCount once per row while laying out; keep it trivial
+        self._rows = len(self.names) or (1 if placeholder else 0)
+        try:
+            from core.players.skills import get_skill_classifier
+            self._classifier = get_skill_classifier()
+        except Exception:
+            self._classifier = None
+        self.endResetModel()
+
+    def is_player(self, row):
+        return 0 <= row < len(self.names)
+
+    def name(self, row):
+        return self.names[row] if self.is_player(row) else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._rows
+
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        if not self.names:
+            return Qt.ItemIsEnabled
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+        if not self.names:
+            return self.placeholder if role == Qt.DisplayRole else None
+        if role == Qt.DisplayRole:
+            return self.names[row]
+        if role == BadgesRole:
+            return self._symbols(row)
+        if role == Qt.ToolTipRole:
+            # Tooltip listing each symbol with numeric values
+            if self._symbols(row):
+                return self._classifier.tooltip(self.names[row])
+        return None
+
+    def _symbols(self, row):
+        if self._classifier is None:
+            return ()
+        return self._classifier.symbols(self.names[row])
+
+
+class BadgeDelegate(QStyledItemDelegate):
+    """Paints a row's combined skill badge as its icon, built when the row is painted.
+
+    Icons are shared per symbol combination, of which there are few.
+    """
+
+    def __init__(self, parent=None, size=BADGE_SIZE):
+        super().__init__(parent)
+        self.size = size
+        self._icons = {}
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        symbols = index.data(BadgesRole)
+        if not symbols:
+            return
+        icon = self._icons.get(symbols)
+        if icon is None:
+            pix = get_combined_badge(list(symbols), size=self.size)
+            icon = self._icons[symbols] = QIcon(pix) if not pix.isNull() else QIcon()
+        if not icon.isNull():
+            # Drawn at the view's icon size, as a QListWidgetItem icon would be
+            option.features |= option.HasDecoration
+            option.icon = icon
@@ -0,0 +1,34 @@
+from html import escape
+
+# Scoring leaders listed under the standings
+LEADERS = 10
+
+
+def _standings_table(rows):
+    body = ''.join(
+        f"<tr><td>{escape(r.team)}</td><td align=\"right\">{r.wins}</td><td align=\"right\">{r.losses}</td>"
+        f"<td align=\"right\">{r.pct:.3f}</td><td align=\"right\">{r.points_for - r.points_against:+d}</td></tr>"
+        for r in rows
+    )
+    return ('<table cellspacing="0" cellpadding="3"><tr><th align="left">Team</th><th align="right">W</th>'
+            f'<th align="right">L</th><th align="right">Pct</th><th align="right">Diff</th></tr>{body}</table>')
+
+
+def season_html(result):
+    """Render a ``SeasonResult`` (standings by conference plus scoring leaders) as HTML."""
+    rows = result.standings()
+    conferences = {}
+    for r in rows:
+        conferences.setdefault(r.cid, []).append(r)
+    parts = [f'<h3>Simulated season</h3><p>Seed {result.seed}</p>']
+    for cid, conf_rows in conferences.items():
+        title = {0: 'East', 1: 'West'}.get(cid, 'League' if cid is None else f'Conference {cid}')
+        parts.append(f'<h4>{title}</h4>{_standings_table(conf_rows)}')
+    leaders = [p for p in result.player_totals() if p['G']][:LEADERS]
+    body = ''.join(
+        f"<tr><td>{escape(p['name'])}</td><td>{escape(p['team'])}</td><td align=\"right\">{p['PTS'] / p['G']:.1f}</td></tr>"
+        for p in leaders
+    )
+    parts.append('<h4>Scoring leaders</h4><table cellspacing="0" cellpadding="3">'
+                 f'<tr><th align="left">Player</th><th align="left">Team</th><th align="right">PPG</th></tr>{body}</table>')
+    return ''.join(parts)
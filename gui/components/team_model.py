@@ -0,0 +1,171 @@
+from PyQt5.QtCore import QAbstractListModel, QModelIndex, QObject, Qt
+from PyQt5.QtGui import QIcon
+
+from core.players.skills import get_skill_classifier
+from core.repository import get_repository
+from core.teams import get_team_roster, load_teams
+from core.teams.team_overall import get_team_overall_engine
+from gui.components.skill_badge import get_combined_badge
+
+# Team OVR (float, 0.0 when unknown) and team badge symbols (tuple of str)
+OverallRole = Qt.UserRole + 1
+SymbolsRole = Qt.UserRole + 2
+BADGE_SIZE = 14
+
+
+class TeamListModel(QAbstractListModel):
+    """Every team with its OVR and badge icon, shared by all team combos.
+
+    ``refresh()`` reads teams, rosters, the skill classifier and the OVR
+    table once for all teams. When the team list is unchanged only rows
+    whose OVR or badges moved emit ``dataChanged``; a new team list resets
+    the model. Badge icons are built when a row is first shown.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.teams = ()
+        self._overall = {}
+        self._symbols = {}
+        self._icons = {}
+        self.refresh()
+
+    def refresh(self, teams=None):
+        """Re-read league data for ``teams`` (default: every team) in one pass."""
+        try:
+            classifier = get_skill_classifier()
+        except Exception:
+            classifier = None
+
+        names = tuple(t.name for t in load_teams())
+        rosters = get_repository().rosters()
+        overalls = get_team_overall_engine().overalls()
+        reset = names != self.teams
+        if reset or teams is None:
+            update = names
+        else:
+            wanted = set(teams)
+            update = [t for t in names if t in wanted]
+
+        overall, symbols = {}, {}
+        for name in update:
+            overall[name] = overalls.get(name, 0.0)
+            # Team-level symbols sampled from the first few roster players
+            symbols[name] = classifier.team_symbols(get_team_roster(name, rosters)) if classifier is not None else ()
+
+        if reset:
+            self.beginResetModel()
+            self.teams = names
+            self._overall, self._symbols = overall, symbols
+            self.endResetModel()
+            return
+        for name in update:
+            if self._overall.get(name) == overall[name] and self._symbols.get(name) == symbols[name]:
+                continue
+            self._overall[name] = overall[name]
+            self._symbols[name] = symbols[name]
+            index = self.index(self.teams.index(name))
+            self.dataChanged.emit(index, index)
+
+    def on_data_changed(self, changes):
+        """``DataWatcher.dataChanged`` handler: refresh only the affected teams."""
+        if 'teams' in changes.files:
+            self.refresh()
+        elif changes.teams:
+            self.refresh(changes.teams)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.teams)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < len(self.teams):
+            return None
+        name = self.teams[index.row()]
+        if role == Qt.DisplayRole:
+            return name
+        if role == OverallRole:
+            return self._overall.get(name, 0.0)
+        if role == SymbolsRole:
+            return self._symbols.get(name, ())
+        if role == Qt.DecorationRole:
+            return self._icon(self._symbols.get(name, ()))
+        return None
+
+    def _icon(self, symbols):
+        if not symbols:
+            return None
+        icon = self._icons.get(symbols)
+        if icon is None:
+            pix = get_combined_badge(list(symbols), size=BADGE_SIZE)
+            icon = self._icons[symbols] = QIcon(pix) if not pix.isNull() else QIcon()
+        return icon if not icon.isNull() else None
+
+
+class ExtraRowsModel(QAbstractListModel):
+    """A view of another list model with plain text rows appended (e.g. 'Free Agents').
+
+    Lets a combo add its own entries without writing them into a shared model.
+    """
+
+    def __init__(self, source, extra, parent=None):
+        super().__init__(parent)
+        self.source = source
+        self.extra = tuple(extra)
+        source.modelAboutToBeReset.connect(self.beginResetModel)
+        source.modelReset.connect(self.endResetModel)
+        source.dataChanged.connect(self._forward_changed)
+
+    def _forward_changed(self, top, bottom, roles=()):
+        self.dataChanged.emit(self.index(top.row()), self.index(bottom.row()), roles)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self.source.rowCount() + len(self.extra)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        n = self.source.rowCount()
+        if index.row() < n:
+            return self.source.data(self.source.index(index.row()), role)
+        if role == Qt.DisplayRole and index.row() - n < len(self.extra):
+            return self.extra[index.row() - n]
+        return None
+
+
+class SelectionKeeper(QObject):
+    """Keeps a combo's selected text across resets of its model, without change signals.
+
+    Parented to the combo, so it stops listening to a shared model when the
+    combo goes away.
+    """
+
+    def __init__(self, combo):
+        super().__init__(combo)
+        self._combo = combo
+        self._text = ''
+        self._blocked = False
+        combo.model().modelAboutToBeReset.connect(self._before_reset)
+        combo.model().modelReset.connect(self._after_reset)
+
+    def _before_reset(self):
+        self._text = self._combo.currentText()
+        self._blocked = self._combo.blockSignals(True)
+
+    def _after_reset(self):
+        idx = self._combo.findText(self._text)
+        if self._combo.count() > 0:
+            self._combo.setCurrentIndex(max(idx, 0))
+        self._combo.blockSignals(self._blocked)
+
+
+_MODEL = None
+
+
+def get_team_model():
+    """Process-wide team model (created on first use, after the QApplication)."""
+    global _MODEL
+    if _MODEL is None:
+        from gui.components.data_watcher import get_data_watcher
+        _MODEL = TeamListModel()
+        get_data_watcher().dataChanged.connect(_MODEL.on_data_changed)
+    return _MODEL
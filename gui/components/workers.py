@@ -0,0 +1,172 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+import logging
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a task once its cancellation has been requested."""
+
+
+class TaskSignals(QObject):
+    """Signals of one background task, delivered on the GUI thread."""
+
+    progress = pyqtSignal(int, int)   # done, total
+    partial = pyqtSignal(object)      # intermediate result
+    finished = pyqtSignal(object)     # final result
+    failed = pyqtSignal(str)
+    cancelled = pyqtSignal()
+    done = pyqtSignal()               # after finished, failed or cancelled
+
+
+class TaskContext:
+    """Handed to a task function to report progress and partial results.
+
+    Both calls raise ``Cancelled`` once the task has been cancelled, so
+    long loops stop at their next report; call ``check()`` elsewhere.
+    """
+
+    def __init__(self, signals, cancel_event):
+        self._signals = signals
+        self._cancel = cancel_event
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def check(self):
+        if self._cancel.is_set():
+            raise Cancelled()
+
+    def progress(self, done, total):
+        self._emit('progress', int(done), int(total))
+
+    def partial(self, value):
+        self._emit('partial', value)
+
+    def _emit(self, name, *args):
+        self.check()
+        try:
+            getattr(self._signals, name).emit(*args)
+        except RuntimeError:
+            # Signals deleted (window closed): stop the task
+            self._cancel.set()
+            raise Cancelled()
+
+
+class Task(QRunnable):
+    """Runs ``fn(context, *args, **kwargs)`` on a thread pool."""
+
+    def __init__(self, fn, *args, **kwargs):
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = TaskSignals()
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def run(self):
+        try:
+            result = self._fn(TaskContext(self.signals, self._cancel), *self._args, **self._kwargs)
+        except Cancelled:
+            self._emit('cancelled')
+        except Exception as e:
+            logging.exception('Background task failed')
+            self._emit('failed', str(e))
+        else:
+            if self._cancel.is_set():
+                self._emit('cancelled')
+            else:
+                self._emit('finished', result)
+        finally:
+            self._emit('done')
+
+    def _emit(self, name, *args):
+        # The receiver side may already be gone when the app shuts down mid-task
+        try:
+            getattr(self.signals, name).emit(*args)
+        except RuntimeError:
+            self._cancel.set()
+
+
+class TaskRunner(QObject):
+    """Starts tasks off the GUI thread and tracks them for cancellation.
+
+    ``busyChanged`` fires when the first task starts and the last one ends,
+    e.g. to enable a Cancel menu action or show a progress bar.
+    """
+
+    busyChanged = pyqtSignal(bool)
+
+    def __init__(self, parent=None, pool=None):
+        super().__init__(parent)
+        self._pool = pool or QThreadPool.globalInstance()
+        self._active = []
+
+    def is_busy(self):
+        return bool(self._active)
+
+    def start(self, fn, *args, **kwargs):
+        """Queue ``fn(context, *args, **kwargs)``; connect to the returned task's ``signals``."""
+        task = Task(fn, *args, **kwargs)
+        task.signals.done.connect(lambda: self._finish(task))
+        self._active.append(task)
+        if len(self._active) == 1:
+            self.busyChanged.emit(True)
+        self._pool.start(task)
+        return task
+
+    def cancel_all(self):
+        for task in self._active:
+            task.cancel()
+
+    def wait(self, msecs=-1):
+        """Block until the pool is idle (used when closing)."""
+        return self._pool.waitForDone(msecs)
+
+    def _finish(self, task):
+        if task in self._active:
+            self._active.remove(task)
+            if not self._active:
+                self.busyChanged.emit(False)
+
+
+class LatestThrottle(QObject):
+    """Coalesces rapid partial results: ``callback`` sees at most one value per interval.
+
+    Only the newest pushed value is delivered; ``discard()`` drops a pending
+    one (e.g. once the final result has been shown).
+    """
+
+    def __init__(self, callback, interval_ms=250, parent=None):
+        super().__init__(parent)
+        self._callback = callback
+        self._pending = None
+        self._has_pending = False
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self._flush)
+
+    def push(self, value):
+        self._pending = value
+        self._has_pending = True
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def discard(self):
+        self._timer.stop()
+        self._pending = None
+        self._has_pending = False
+
+    def _flush(self):
+        if self._has_pending:
+            value, self._pending, self._has_pending = self._pending, None, False
+            self._callback(value)
@@ -1,5 +1,6 @@
 from PyQt5.QtWidgets import (
-	QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QVBoxLayout as QVBL, QFileDialog, QMessageBox
+	QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QVBoxLayout as QVBL, QFileDialog, QMessageBox,
+	QProgressBar
 )
 from PyQt5.QtGui import QFont, QGuiApplication
 from PyQt5.QtCore import Qt
@@ -7,15 +8,18 @@ from gui.components.team_selector import TeamSelector
 from gui.components.results_pane import ResultsPane
 from gui.components.menu_builder import MenuBuilder
 from gui.components.play_by_play import PlayByPlayWidget
+from gui.components.workers import LatestThrottle, TaskRunner
 from PyQt5.QtPrintSupport import QPrinter, QPrintDialog
 import os
-import random
+from html import escape as html_escape
 
 class BasketballSimulatorWindow(QWidget):
 	def __init__(self):
 		super().__init__()
 		self._main_menu = None
+		self.tasks = TaskRunner(self)
 		self.init_ui()
+		self.tasks.busyChanged.connect(self._on_busy_changed)
 
 	def init_ui(self):
 		self.setWindowTitle('Basketball GM — Exhibition Manager')
@@ -31,6 +35,19 @@ class BasketballSimulatorWindow(QWidget):
 		# Menu bar via helper
 		self.menu_bar = MenuBuilder(self).build()
 
+		# Matchup simulation
+		self.simulate_btn = QPushButton('Simulate Matchup')
+		self.simulate_btn.setObjectName('SimulateButton')
+		self.simulate_btn.setFont(font_button)
+		self.simulate_btn.setProperty('accent', True)
+		self.simulate_btn.clicked.connect(self.simulate_matchup)
+
+		# Progress of background simulations; hidden while idle
+		self.progress_bar = QProgressBar()
+		self.progress_bar.setObjectName('TaskProgress')
+		self.progress_bar.setTextVisible(True)
+		self.progress_bar.hide()
+
 		# Back button under team selectors
 		self.back_btn = QPushButton('Back to Main Menu')
 		self.back_btn.setObjectName('BackButton')
@@ -61,7 +78,9 @@ class BasketballSimulatorWindow(QWidget):
 		team_layout.addLayout(right)
 		layout.addLayout(team_layout)
 
-		# Back button
+		# Simulate + back buttons
+		layout.addWidget(self.simulate_btn)
+		layout.addWidget(self.progress_bar)
 		layout.addWidget(self.back_btn)
 
 		# Results pane
@@ -71,17 +90,28 @@ class BasketballSimulatorWindow(QWidget):
 
 		# Play-by-play widget and controls
 		self.play_by_play = PlayByPlayWidget()
+		self.play_by_play.loadFinished.connect(
+			lambda path, n: self.result_box.append(f'<p><i>Loaded {n} plays from {html_escape(path)}.</i></p>'))
+		self.play_by_play.loadFailed.connect(
+			lambda path, msg: QMessageBox.critical(self, 'Play-by-Play', f'Failed to load file:\n{msg}'))
+		self.play_by_play.streamFailed.connect(
+			lambda msg: QMessageBox.critical(self, 'Play-by-Play', f'Simulation failed:\n{msg}'))
 		self.play_by_play.setObjectName('PlayByPlayWidget')
-		self.load_pbp_btn = QPushButton('Load Play-by-Play HTML')
+		self.load_pbp_btn = QPushButton('Load Play-by-Play')
 		self.load_pbp_btn.setObjectName('LoadPBPButton')
 		self.load_pbp_btn.setFont(font_button)
 		self.load_pbp_btn.clicked.connect(self._load_play_by_play_html)
+		self.watch_btn = QPushButton('Watch Game')
+		self.watch_btn.setObjectName('WatchGameButton')
+		self.watch_btn.setFont(font_button)
+		self.watch_btn.clicked.connect(self.watch_game)
 
 		# Two-column area: results on the left, play-by-play on the right
 		two_col = QHBoxLayout()
 		left_col = QVBoxLayout()
 		left_col.addWidget(self.result_box)
 		left_col.addWidget(self.load_pbp_btn)
+		left_col.addWidget(self.watch_btn)
 		# Allow left column to expand more than right
 		two_col.addLayout(left_col, 3)
 		two_col.addWidget(self.play_by_play, 2)
@@ -110,7 +140,8 @@ class BasketballSimulatorWindow(QWidget):
 			self.team1_selector.setCurrentIndex(0)
 			self.team2_selector.setCurrentIndex(0)
 			return
-		i1, i2 = random.sample(range(cnt), 2)
+		from core.rng import next_session_generator
+		i1, i2 = (int(i) for i in next_session_generator('randomize_teams').choice(cnt, 2, replace=False))
 		self.team1_selector.setCurrentIndex(i1)
 		self.team2_selector.setCurrentIndex(i2)
 
@@ -126,6 +157,111 @@ class BasketballSimulatorWindow(QWidget):
 		"""Clear the results pane."""
 		self.result_box.clear()
 
+	def _selected_matchup(self, title):
+		"""(home, away) from the selectors, or None after telling the user what is missing."""
+		home = self.team1_selector.currentTeam()
+		away = self.team2_selector.currentTeam()
+		if not home or not away:
+			QMessageBox.information(self, title, 'Select two teams first.')
+			return None
+		if home == away:
+			QMessageBox.information(self, title, 'Select two different teams.')
+			return None
+		return home, away
+
+	def _on_busy_changed(self, busy):
+		self.simulate_btn.setEnabled(not busy)
+		self.cancel_action.setEnabled(busy)
+		if busy:
+			self.progress_bar.setRange(0, 0)
+			self.progress_bar.show()
+		else:
+			self.progress_bar.hide()
+
+	def _show_progress(self, done, total):
+		self.progress_bar.setRange(0, total)
+		self.progress_bar.setValue(done)
+
+	def _run_task(self, title, fn, on_finished, on_partial=None):
+		"""Run ``fn`` in the background, wiring progress, errors and cancellation to the UI.
+
+		Partial results are throttled so redrawing them never stalls the window.
+		"""
+		if self.tasks.is_busy():
+			QMessageBox.information(self, title, 'A simulation is already running.')
+			return None
+		task = self.tasks.start(fn)
+		task.signals.progress.connect(self._show_progress)
+		task.signals.finished.connect(on_finished)
+		if on_partial is not None:
+			throttle = LatestThrottle(on_partial, parent=self)
+			task.signals.partial.connect(throttle.push)
+			task.signals.finished.connect(throttle.discard)
+			task.signals.done.connect(throttle.discard)
+			task.signals.done.connect(throttle.deleteLater)
+		task.signals.failed.connect(lambda msg: QMessageBox.critical(self, title, f'{title} failed:\n{msg}'))
+		task.signals.cancelled.connect(lambda: self.result_box.append(f'<p><i>{title} cancelled.</i></p>'))
+		return task
+
+	def cancel_tasks(self):
+		"""Cancel running simulations (they stop at their next progress report)."""
+		self.tasks.cancel_all()
+
+	def simulate_matchup(self):
+		"""Simulate many games between the selected teams (team 1 at home) in the background.
+
+		The summary is redrawn after every block of games, so results sharpen
+		while the batch runs.
+		"""
+		teams = self._selected_matchup('Simulate Matchup')
+		if teams is None:
+			return
+		home, away = teams
+		from core.game.matchup import MATCHUP_GAMES, iter_matchup
+		from gui.components.matchup_report import matchup_html
+
+		def run(ctx):
+			summary = None
+			for summary in iter_matchup(home, away, MATCHUP_GAMES):
+				ctx.partial(summary)
+				ctx.progress(summary.games, MATCHUP_GAMES)
+			return summary
+
+		def show(summary):
+			self.result_box.setHtml(matchup_html(summary))
+
+		self._run_task('Simulate Matchup', run, show, show)
+
+	def simulate_season(self):
+		"""Simulate a full league season in the background and show the standings."""
+		from core.game.season import simulate_season
+		from gui.components.season_report import season_html
+
+		def run(ctx):
+			return simulate_season(workers=1, progress=ctx.progress)
+
+		self._run_task('Simulate Season', run, lambda result: self.result_box.setHtml(season_html(result)))
+
+	def watch_game(self):
+		"""Simulate a game between the selected teams and stream its play-by-play."""
+		teams = self._selected_matchup('Watch Game')
+		if teams is None:
+			return
+		from itertools import chain
+		from core.game.engine import play_by_play
+		from core.game.profile import resolve_profile
+		from core.rng import next_session_generator
+		try:
+			# play_by_play is lazy: resolve the teams and simulate the first
+			# game here so bad rosters are reported before playback starts
+			home, away = resolve_profile(teams[0]), resolve_profile(teams[1])
+			events = play_by_play(home, away, rng=next_session_generator('watch_game'))
+			first = next(events)
+		except Exception as e:
+			QMessageBox.critical(self, 'Watch Game', f'Simulation failed:\n{e}')
+			return
+		self.play_by_play.stream_events(chain([first], events))
+
 	def _current_matchup_slug(self) -> str:
 		"""Build a simple filename slug from current selections."""
 		t1 = (self.team1_selector.currentTeam() or 'Team1').replace(' ', '_')
@@ -171,8 +307,8 @@ class BasketballSimulatorWindow(QWidget):
 
 	def reload_teams(self):
 		"""Reload team list from core.teams and repopulate dropdowns and update OVR labels."""
+		# Both selectors share one team model; a single refresh updates them
 		self.team1_selector.reload()
-		self.team2_selector.reload()
 
 	def toggle_fullscreen(self, checked=False):
 		"""Toggle between fullscreen and normal window."""
@@ -189,20 +325,37 @@ class BasketballSimulatorWindow(QWidget):
 
 
 	def _load_play_by_play_html(self):
-		from PyQt5.QtWidgets import QFileDialog, QMessageBox
+		from PyQt5.QtWidgets import QFileDialog
 		start_dir = os.path.expanduser('~')
-		path, _ = QFileDialog.getOpenFileName(self, 'Load Play-by-Play HTML', start_dir, 'HTML Files (*.html *.htm);;All Files (*)')
+		path, _ = QFileDialog.getOpenFileName(self, 'Load Play-by-Play', start_dir, 'Play-by-Play (*.html *.htm *.pbp);;All Files (*)')
 		if not path:
 			return
+		if path.lower().endswith('.pbp'):
+			self._open_play_log(path)
+			return
+		# Parsed on a worker thread; playback can start on the first plays
+		self.play_by_play.load_file(path)
+
+	def _open_play_log(self, path):
+		"""Open a binary play log, asking which game to replay when it holds several."""
+		from PyQt5.QtWidgets import QInputDialog, QMessageBox
+		from core.game.pbplog import PlayLog
 		try:
-			with open(path, 'r', encoding='utf-8') as f:
-				html = f.read()
-			self.play_by_play.load_html(html)
-			QMessageBox.information(self, 'Play-by-Play', f'Loaded play-by-play from:\n{path}')
+			with PlayLog(path) as log:
+				games = [f'{i + 1}. {log.describe(i)}' for i in range(len(log))]
 		except Exception as e:
-			QMessageBox.critical(self, 'Play-by-Play', f'Failed to load file:\n{e}')
-
-
+			QMessageBox.critical(self, 'Play-by-Play', f'Failed to open log:\n{e}')
+			return
+		if not games:
+			QMessageBox.information(self, 'Play-by-Play', 'The log contains no games.')
+			return
+		game = 0
+		if len(games) > 1:
+			choice, ok = QInputDialog.getItem(self, 'Play-by-Play', 'Game:', games, 0, False)
+			if not ok:
+				return
+			game = games.index(choice)
+		self.play_by_play.open_log(path, game)
 
 	def back_to_main_menu(self):
 		"""Close this window and return to the main menu."""
@@ -212,6 +365,13 @@ class BasketballSimulatorWindow(QWidget):
 		self._main_menu.show()
 		self.close()
 
+	def closeEvent(self, event):
+		"""Stop background work before the window goes away."""
+		self.tasks.cancel_all()
+		self.play_by_play.cancel_loading()
+		self.tasks.wait(5000)
+		super().closeEvent(event)
+
 	def keyPressEvent(self, event):
 		"""Let ESC exit fullscreen; otherwise default behavior."""
 		if event.key() == Qt.Key_Escape and self.isFullScreen():
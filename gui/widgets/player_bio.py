@@ -1,7 +1,9 @@
-from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel, QWidget
 from PyQt5.QtGui import QFont
-import json
-from pathlib import Path
+from PyQt5.QtCore import Qt
+from core.players.name_index import get_player_name_index
+from core.repository import get_repository
+from gui.components.data_watcher import get_data_watcher
 
 class PlayerBioDialog(QDialog):
     def __init__(self, player_name, parent=None):
@@ -9,7 +11,30 @@ class PlayerBioDialog(QDialog):
         self.setWindowTitle(f"Player Bio - {player_name}")
         self.resize(400, 600)
         self.setObjectName('PlayerBioDialog')
-        layout = QVBoxLayout()
+        # Opened once per double-click; don't pile up under the parent window
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self._player_name = player_name
+        self._root = QVBoxLayout()
+        self._root.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(self._root)
+        self._body = None
+        self._populate()
+        get_data_watcher().dataChanged.connect(self._on_data_changed)
+
+    def done(self, result):
+        # The watcher is process-wide; stop reloading once the dialog is closed
+        get_data_watcher().dataChanged.disconnect(self._on_data_changed)
+        super().done(result)
+
+    def _on_data_changed(self, changes):
+        """Rebuild the bio in place when this player's data was reloaded."""
+        if self._player_name in changes.players:
+            self._populate()
+
+    def _populate(self):
+        player_name = self._player_name
+        body = QWidget(self)
+        layout = QVBoxLayout(body)
         font = QFont('Arial', 12)
 
         info = self._get_player_info(player_name)
@@ -94,18 +119,19 @@ class PlayerBioDialog(QDialog):
             label = QLabel("No player info found.")
             label.setFont(font)
             layout.addWidget(label)
-        self.setLayout(layout)
+        if self._body is not None:
+            self._root.removeWidget(self._body)
+            self._body.deleteLater()
+        self._root.addWidget(body)
+        self._body = body
 
     def _get_player_info(self, player_name):
-        path = Path(__file__).parent.parent.parent / "core" / "teams" / "data" / "player_info.json"
-        if not path.exists():
+        try:
+            info = get_repository().player(player_name)
+            if info is None:
+                # Tolerate spelling variants such as "CJ McCollum" vs "C.J. McCollum"
+                canonical = get_player_name_index().get(player_name)
+                info = get_repository().player(canonical) if canonical else None
+            return info
+        except Exception:
             return None
-        with path.open("r", encoding="utf-8") as f:
-            try:
-                data = json.load(f)
-            except Exception:
-                return None
-        for entry in data:
-            if entry.get("name") == player_name:
-                return entry
-        return None
@@ -2,8 +2,6 @@ from PyQt5.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QMessageB
 from PyQt5.QtGui import QFont, QIcon
 from PyQt5.QtCore import Qt
 from pathlib import Path
-import os
-import sys
 
 # register compiled Qt resources
 try:
@@ -15,6 +13,8 @@ except Exception:
 
 
 class MainMenuWindow(QWidget):
+    FOOTER_TEXT = 'Built with ❤️  — Basketball GM'
+
     def __init__(self):
         super().__init__()
         self.sim_window = None
@@ -102,10 +102,10 @@ class MainMenuWindow(QWidget):
         layout.addWidget(card)
 
         # Footer
-        footer = QLabel('Built with ❤️  — Basketball GM')
-        footer.setObjectName('FooterLabel')
-        footer.setAlignment(Qt.AlignCenter)
-        layout.addWidget(footer)
+        self.footer = QLabel(self.FOOTER_TEXT)
+        self.footer.setObjectName('FooterLabel')
+        self.footer.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.footer)
 
         layout.addStretch(1)
         self.setLayout(layout)
@@ -130,6 +130,11 @@ class MainMenuWindow(QWidget):
             QMessageBox.critical(self, 'Unable to open', f'Failed to open Rosters window.\n\n{e}')
 
     def reload_app(self):
-        python = sys.executable
-        os.execl(python, python, *sys.argv)
-
+        # Re-read whatever changed on disk; open windows update themselves
+        # through the watcher's dataChanged signal, so no restart is needed.
+        from gui.components.data_watcher import get_data_watcher
+        changes = get_data_watcher().reload_now()
+        if changes:
+            self.footer.setText(f'Data reloaded ({len(changes.files)} file(s) changed)')
+        else:
+            self.footer.setText('Data is up to date')
@@ -0,0 +1,47 @@
+"""Watching a game with a team that has no roster reports the error instead of crashing."""
+
+import os
+
+import pytest
+
+pytest.importorskip("PyQt5")
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+from PyQt5.QtWidgets import QApplication  # noqa: E402
+
+NO_ROSTER = "Nowhere Team"
+
+
+@pytest.fixture(scope="module")
+def app():
+    return QApplication.instance() or QApplication([])
+
+
+def test_failing_stream_stops_playback(app):
+    from core.game.engine import play_by_play
+    from gui.components.play_by_play import PlayByPlayWidget
+
+    widget = PlayByPlayWidget()
+    errors = []
+    widget.streamFailed.connect(errors.append)
+    # Lazy: the profile lookup only fails once the first event is pulled
+    widget.stream_events(play_by_play(NO_ROSTER, "Boston Celtics", rng=1))
+    widget._advance(1)  # what the timer slot runs
+    assert errors and "no players" in errors[0]
+    assert not widget.playing
+    assert widget._stream is None
+
+
+def test_watch_game_reports_team_without_roster(app, monkeypatch):
+    from gui.widgets import main_window
+
+    window = main_window.BasketballSimulatorWindow()
+    monkeypatch.setattr(window.team1_selector, "currentTeam", lambda: NO_ROSTER)
+    monkeypatch.setattr(window.team2_selector, "currentTeam", lambda: "Boston Celtics")
+    shown = []
+    monkeypatch.setattr(main_window.QMessageBox, "critical", lambda *args: shown.append(args[2]))
+    window.watch_game()
+    assert shown and "no players" in shown[0]
+    assert window.play_by_play._stream is None
+    assert not window.play_by_play.playing
+    window.close()
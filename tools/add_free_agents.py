@@ -1,5 +1,9 @@
 import json
 import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from core.players.name_index import normalize_name  # noqa: E402
 
 # Paths
 BIO_PATH = os.path.join('core', 'players', 'player_bio.json')
@@ -31,25 +35,23 @@ info_names = set(p['name'] for p in info)
 # Get all bios names
 bio_names = set(p['name'] for p in bios if isinstance(p, dict) and 'name' in p)
 
-# Find free agents: in info but not on any roster
+# Find free agents: in info but not on any roster. Names are compared by
+# normalized key (set lookups) so "C.J. X" and "CJ X" count as one player.
 free_agents = []
+seen = set()
 for p in info:
-    if p['name'] not in roster_names:
+    key = normalize_name(p['name'])
+    if p['name'] not in roster_names and key not in seen:
         free_agents.append(p)
+        seen.add(key)
 
 # Also add bios with team '?' or 'Free Agent' or not in any roster
 for p in bios:
     if isinstance(p, dict) and ('team' in p) and (p['team'] in ['?', 'Free Agent', '', None] or p['name'] not in roster_names):
-        if p['name'] not in [fa['name'] for fa in free_agents]:
+        key = normalize_name(p['name'])
+        if key not in seen:
             free_agents.append(p)
-
-# Remove duplicates by name
-seen = set()
-unique_free_agents = []
-for p in free_agents:
-    if p['name'] not in seen:
-        unique_free_agents.append(p)
-        seen.add(p['name'])
+            seen.add(key)
 
 # Main bios: only those on a team roster
 main_bios = [p for p in bios if isinstance(p, dict) and p.get('name') in roster_names]
@@ -57,8 +59,8 @@ main_bios = [p for p in bios if isinstance(p, dict) and p.get('name') in roster_
 # New structure: list of bios + free_agents section
 output = {
     'players': main_bios,
-    'free_agents': unique_free_agents
+    'free_agents': free_agents
 }
 
 save_json(BIO_PATH, output)
-print(f"Updated {BIO_PATH} with {len(main_bios)} rostered players and {len(unique_free_agents)} free agents.")
+print(f"Updated {BIO_PATH} with {len(main_bios)} rostered players and {len(free_agents)} free agents.")
@@ -0,0 +1,45 @@
+"""Compile the league JSON files into memory-mapped snapshots (``*.snap``).
+
+The app rebuilds stale snapshots on its own; run this after editing the JSON
+(or as part of a data import) so the next start doesn't pay for it. Safe to
+run while the app is open: each build gets a new versioned file name.
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.players.ratings import RATING_COLUMNS, to_rating  # noqa: E402
+from core.repository import (  # noqa: E402
+    DEFAULT_PLAYER_BIO_PATH,
+    DEFAULT_PLAYER_INFO_PATH,
+    DEFAULT_TEAMS_PATH,
+)
+from core.snapshot import build_snapshot, remove_stale_snapshots, snapshot_path  # noqa: E402
+
+
+def main():
+    jobs = [
+        (DEFAULT_PLAYER_INFO_PATH, RATING_COLUMNS, ("name", "team", "position")),
+        (DEFAULT_PLAYER_BIO_PATH, RATING_COLUMNS, ("name", "team", "position")),
+        (DEFAULT_TEAMS_PATH, (), ("name",)),
+    ]
+    for src, columns, strings in jobs:
+        if not src.exists():
+            print(f"Skipping missing {src}")
+            continue
+        dest = snapshot_path(src, columns, strings)
+        if dest.exists():
+            print(f"Up to date: {dest}")
+        else:
+            t0 = time.perf_counter()
+            build_snapshot(src, dest, columns=columns, strings=strings, coerce=to_rating)
+            ms = (time.perf_counter() - t0) * 1000
+            print(f"Wrote {dest} ({dest.stat().st_size:,} bytes) in {ms:.1f} ms")
+        remove_stale_snapshots(src, keep=dest)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""Import/export the league JSON files to a SQLite database and edit rosters in place.
+
+Usage:
+  python tools/league_db.py import <league.db>
+  python tools/league_db.py export <league.db> [<out dir>]
+  python tools/league_db.py move <league.db> "<player>" "<team>"
+
+Point the app at the database with BGM_LEAGUE_DB=<league.db>.
+"""
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.league_db import open_database  # noqa: E402
+
+
+def main():
+    if len(sys.argv) < 3 or sys.argv[1] not in ("import", "export", "move"):
+        print(__doc__.strip())
+        sys.exit(1)
+    cmd, db_path = sys.argv[1], Path(sys.argv[2])
+    db = open_database(db_path)
+    if cmd == "import":
+        db.import_json()
+        print(f"Imported league JSON into {db_path}")
+    elif cmd == "export":
+        out = Path(sys.argv[3]) if len(sys.argv) > 3 else ROOT / "export"
+        db.export_json(
+            teams_path=out / "teams.json",
+            rosters_path=out / "rosters.json",
+            player_info_path=out / "player_info.json",
+            player_bio_path=out / "player_bio.json",
+        )
+        print(f"Exported {db_path} to {out}")
+    else:
+        if len(sys.argv) < 5:
+            print(__doc__.strip())
+            sys.exit(1)
+        player, team = sys.argv[3], sys.argv[4]
+        try:
+            db.move_player(player, team)
+        except KeyError as e:
+            print(e)
+            sys.exit(2)
+        print(f"Moved {player} to {team}")
+
+
+if __name__ == "__main__":
+    main()
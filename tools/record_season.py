@@ -0,0 +1,39 @@
+"""Simulate one season with full play-by-play into a binary play log.
+
+Usage:
+  python tools/record_season.py <path.pbp> [<seed>]
+
+The log replays the same season as ``simulate_season(seed=...)``; open it
+with Load Play-by-Play in the app or ``core.game.PlayLog``.
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.game.pbplog import PlayLog, record_season  # noqa: E402
+
+
+def main():
+    if not 2 <= len(sys.argv) <= 3:
+        print(__doc__.strip())
+        sys.exit(1)
+    try:
+        seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    except ValueError:
+        print(__doc__.strip())
+        sys.exit(1)
+    path = Path(sys.argv[1])
+    start = time.perf_counter()
+    seed = record_season(path, seed=seed)
+    elapsed = time.perf_counter() - start
+    with PlayLog(path) as log:
+        games = len(log)
+    size = path.stat().st_size / 1e6
+    print(f"{games} games in {elapsed:.1f}s, {size:.1f} MB (seed {seed})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Project the league by simulating many full seasons across worker processes.
+
+Usage:
+  python tools/simulate_seasons.py [<seasons>] [<workers>] [<seed>]
+
+Prints mean wins, the 10th/90th percentile and playoff and title odds per
+team (``core.game.playoffs``, brackets seeded from every simulated season). Workers default to
+every CPU; pass 1 to run in this process. Results depend only on the seed,
+never on the worker count; without a seed a fresh one is printed.
+"""
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.game.playoffs import project_playoffs  # noqa: E402
+from core.game.season import simulate_seasons  # noqa: E402
+
+
+def main():
+    try:
+        args = [int(a) for a in sys.argv[1:4]]
+    except ValueError:
+        print(__doc__.strip())
+        sys.exit(1)
+    seasons = args[0] if len(args) > 0 else 100
+    workers = args[1] if len(args) > 1 else None
+    seed = args[2] if len(args) > 2 else None
+    start = time.perf_counter()
+    projection = simulate_seasons(seasons, seed=seed, workers=workers)
+    elapsed = time.perf_counter() - start
+    odds = {row["team"]: row for row in project_playoffs(projection).table()}
+    print(f"{seasons} seasons in {elapsed:.1f}s (seed {projection.seed})")
+    print(f"{'':<28} {'wins':>5}  {'p10-p90':<9} {'playoffs':>8} {'title':>6}")
+    for row in projection.win_table():
+        team = odds[row["team"]]
+        print(f"{row['team']:<28} {row['mean_wins']:5.1f}  {row['p10']:>3.0f}-{row['p90']:<5.0f} "
+              f"{team['playoffs']:8.0%} {team['champion']:6.1%}")
+
+
+if __name__ == "__main__":
+    main()
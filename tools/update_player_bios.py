@@ -1,8 +1,15 @@
 import json
+import sys
 from pathlib import Path
 
+import numpy as np
+
 # Paths
 ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+from core.game.boxscore import BOX_COLUMNS, BoxScoreAccumulator  # noqa: E402
+
 NBA_ROSTER_PATH = ROOT / "2025-26.NBA.Roster.json"
 PLAYER_INFO_PATH = ROOT / "core" / "teams" / "data" / "player_info.json"
 TEAMS_PATH = ROOT / "core" / "teams" / "data" / "teams.json"
@@ -12,12 +19,33 @@ with TEAMS_PATH.open("r", encoding="utf-8") as f:
     teams = json.load(f)
 tid_to_team = {t["tid"]: f"{t['region']} {t['name']}" for t in teams if isinstance(t, dict) and "tid" in t}
 
+# BBGM season stat key for each accumulator column (SEC comes from "min")
+BBGM_COLUMNS = {
+    "G": "gp", "PTS": "pts", "FGM": "fg", "FGA": "fga", "3PM": "tp", "3PA": "tpa",
+    "FTM": "ft", "FTA": "fta", "ORB": "orb", "DRB": "drb", "AST": "ast",
+    "STL": "stl", "BLK": "blk", "TOV": "tov", "PF": "pf",
+}
+
+def career_totals(players):
+    """Regular-season career totals for every player (one accumulator row each) and season counts."""
+    rows, lines = [], []
+    for i, player in enumerate(players):
+        for s in player.get("stats", []):
+            if s.get("playoffs"):
+                continue
+            rows.append(i)
+            lines.append([s.get("min", 0) * 60 if col == "SEC" else s.get(BBGM_COLUMNS[col], 0) for col in BOX_COLUMNS])
+    career = BoxScoreAccumulator(len(players), dtype=np.float64)
+    if rows:
+        career.add(np.array(rows), np.array(lines, dtype=np.float64))
+    return career, np.bincount(np.array(rows, dtype=np.intp), minlength=len(players))
+
 def get_latest_rating(ratings):
     if not ratings:
         return {}
     return max(ratings, key=lambda r: r.get("season", 0))
 
-def player_to_bio(player):
+def player_to_bio(player, career, row, seasons):
     import datetime
     ratings = player.get("ratings", [])
     rating = get_latest_rating(ratings)
@@ -40,44 +68,29 @@ def player_to_bio(player):
     draft_year = draft.get("year") if isinstance(draft, dict) else None
     experience = current_year - draft_year if draft_year and isinstance(draft_year, int) else "?"
 
-    # Summary stats (career totals/averages)
+    # Summary stats (career totals/averages), regular season only
     summary = {}
-    stats = player.get("stats", [])
-    if stats:
-        # Use regular season only, not playoffs
-        reg_stats = [s for s in stats if not s.get("playoffs")]
-        if reg_stats:
-            # Career totals/averages
-            G = sum(s.get("gp", 0) for s in reg_stats)
-            MP = sum(s.get("min", 0) for s in reg_stats)
-            PTS = sum(s.get("pts", 0) for s in reg_stats)
-            TRB = sum(s.get("orb", 0) + s.get("drb", 0) for s in reg_stats)
-            AST = sum(s.get("ast", 0) for s in reg_stats)
-            FGA = sum(s.get("fga", 0) for s in reg_stats)
-            FGM = sum(s.get("fg", 0) for s in reg_stats)
-            FG_PCT = round(FGM / FGA * 100, 1) if FGA else "?"
-            TPA = sum(s.get("tpa", 0) for s in reg_stats)
-            TPM = sum(s.get("tp", 0) for s in reg_stats)
-            TP_PCT = round(TPM / TPA * 100, 1) if TPA else "?"
-            FTA = sum(s.get("fta", 0) for s in reg_stats)
-            FTM = sum(s.get("ft", 0) for s in reg_stats)
-            FT_PCT = round(FTM / FTA * 100, 1) if FTA else "?"
-            TS_PCT = "?"  # True shooting% could be calculated if needed
-            PER = reg_stats[-1].get("per", "?")
-            WS = reg_stats[-1].get("ows", 0) + reg_stats[-1].get("dws", 0) if reg_stats else "?"
-            summary = {
-                "G": G,
-                "MP": MP,
-                "PTS": PTS,
-                "TRB": TRB,
-                "AST": AST,
-                "FG%": FG_PCT,
-                "3P%": TP_PCT,
-                "FT%": FT_PCT,
-                "TS%": TS_PCT,
-                "PER": PER,
-                "WS": WS
-            }
+    if seasons[row]:
+        reg_stats = [s for s in player.get("stats", []) if not s.get("playoffs")]
+
+        def pct(name):
+            value = float(career.pct(name)[row])
+            return "?" if np.isnan(value) else round(value, 1)
+
+        summary = {
+            "G": int(career.column("G")[row]),
+            # Raw sum of BBGM's fractional minutes, as before (not rounded)
+            "MP": sum(s.get("min", 0) for s in reg_stats),
+            "PTS": int(career.column("PTS")[row]),
+            "TRB": int(career.column("TRB")[row]),
+            "AST": int(career.column("AST")[row]),
+            "FG%": pct("FG%"),
+            "3P%": pct("3P%"),
+            "FT%": pct("FT%"),
+            "TS%": "?",  # True shooting% could be calculated if needed
+            "PER": reg_stats[-1].get("per", "?"),
+            "WS": reg_stats[-1].get("ows", 0) + reg_stats[-1].get("dws", 0),
+        }
 
     # Physical, Shooting, Skill from latest rating
     physical = {}
@@ -145,7 +158,8 @@ with NBA_ROSTER_PATH.open("r", encoding="utf-8") as f:
     data = json.load(f)
 players = data["players"]
 
-bios = [player_to_bio(p) for p in players]
+career, seasons = career_totals(players)
+bios = [player_to_bio(p, career, i, seasons) for i, p in enumerate(players)]
 
 with PLAYER_INFO_PATH.open("w", encoding="utf-8") as f:
     json.dump(bios, f, indent=2, ensure_ascii=False)